@@ -0,0 +1,353 @@
+"""Asynchronous loading with coroutine function validators.
+
+Implements :meth:`Type.load_async() <lollipop.types.Type.load_async>` and
+:meth:`Type.validate_async() <lollipop.types.Type.validate_async>`. Built-in
+container types load their fields and items concurrently with
+:func:`asyncio.gather`; types which (together with their inner types) have no
+asynchronous validators are loaded with regular synchronous
+:meth:`~lollipop.types.Type.load`. Errors are merged the same way as with
+synchronous loading.
+
+Custom types are loaded with their own `load()` method, after which their
+validators are run; asynchronous validators of their inner types can not be
+run and raise `TypeError`, the same as on synchronous loading.
+
+Requires Python 3.5+.
+"""
+from lollipop.types import MISSING, Type, List, Tuple, Dict, Field, \
+    AttributeField, Object, Optional, LoadOnly, DumpOnly, Cached, \
+    _ValidatorCall, _async_validation, _inner_types
+from lollipop.compiler import CompiledType
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+from lollipop.utils import is_list, is_dict, _function
+from lollipop.compat import iteritems
+import asyncio
+import weakref
+
+
+__all__ = [
+    'load_async',
+    'validate_async',
+]
+
+
+#: Asynchronous loaders of built-in types by type class load method
+_LOADERS = {}
+
+
+def _loader(type_class):
+    def decorator(func):
+        _LOADERS[_function(type_class.load)] = func
+        return func
+    return decorator
+
+
+#: Cache of whether type or any of it's inner types have async validators
+_has_async_cache = weakref.WeakKeyDictionary()
+
+
+def _has_async_validators(type):
+    return any(
+        isinstance(validator, _ValidatorCall) and validator.is_async
+        for validator, _ in type._validator_plans
+    )
+
+
+def _has_async(type):
+    """Returns True if type or any of it's inner types has
+    asynchronous validators."""
+    if not isinstance(type, Type):
+        return False
+
+    try:
+        return _has_async_cache[type]
+    except KeyError:
+        pass
+
+    # Walk all reachable types, so that result for recursive types does not
+    # depend on which of them was checked first
+    result = False
+    seen = set([id(type)])
+    pending = [type]
+    while pending:
+        current = pending.pop()
+        if _has_async_validators(current):
+            result = True
+            break
+        for inner_type in _inner_types(current):
+            if isinstance(inner_type, Type) and id(inner_type) not in seen:
+                seen.add(id(inner_type))
+                pending.append(inner_type)
+
+    _has_async_cache[type] = result
+    return result
+
+
+class _Loader(object):
+    def __init__(self, context, concurrency):
+        self.context = context
+        self.semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+
+    async def load(self, type, data):
+        if not _has_async(type):
+            return type.load(data, self.context)
+
+        if isinstance(type, CompiledType):
+            # Compiled code runs validators synchronously
+            return await self.load(type.inner_type, data)
+
+        loader = _LOADERS.get(_function(type.__class__.load))
+        if loader is None:
+            loader = _load_type
+        return await loader(self, type, data)
+
+    async def gather(self, awaitables):
+        """Runs awaitables concurrently. Returns list of tuples of result
+        and raised exception."""
+        results = await asyncio.gather(*awaitables, return_exceptions=True)
+        outcomes = []
+        for result in results:
+            if isinstance(result, ValidationError):
+                outcomes.append((MISSING, result))
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                outcomes.append((result, None))
+        return outcomes
+
+    async def _call_async(self, validator, data, with_context):
+        if self.semaphore is None:
+            return await self._call(validator, data, with_context)
+        async with self.semaphore:
+            return await self._call(validator, data, with_context)
+
+    def _call(self, validator, data, with_context):
+        if with_context:
+            return validator(data, self.context)
+        return validator(data)
+
+    async def validate(self, type, data):
+        """Runs type validators (both synchronous and asynchronous)
+        against loaded data. Returns data."""
+        if not type._validator_plans:
+            return data
+
+        errors = []
+        pending = []
+        for validator, with_context in type._validator_plans:
+            is_async = False
+            if isinstance(validator, _ValidatorCall):
+                validator, with_context, is_async = \
+                    validator.validator, validator.with_context, validator.is_async
+
+            if is_async:
+                pending.append((len(errors),
+                                self._call_async(validator, data, with_context)))
+                errors.append(None)
+                continue
+
+            try:
+                self._call(validator, data, with_context)
+                errors.append(None)
+            except ValidationError as ve:
+                errors.append(ve.raw_messages)
+
+        outcomes = await self.gather([awaitable for _, awaitable in pending])
+        for (idx, _), (_, error) in zip(pending, outcomes):
+            if error is not None:
+                errors[idx] = error.raw_messages
+
+        errors_builder = ValidationErrorBuilder()
+        for error in errors:
+            if error is not None:
+                errors_builder.add_errors(error)
+        errors_builder.raise_errors()
+        return data
+
+
+async def _load_type(loader, type, data):
+    """Loads data with type's own load() skipping it's validators and then
+    runs validators asynchronously."""
+    if not _has_async_validators(type):
+        # Only inner types are asynchronous, but they can't be reached
+        return type.load(data, loader.context)
+
+    _async_validation.type, previous = type, getattr(_async_validation, 'type', None)
+    try:
+        value = type.load(data, loader.context)
+    finally:
+        _async_validation.type = previous
+    return await loader.validate(type, value)
+
+
+@_loader(List)
+async def _load_list(loader, type, data):
+    if data is MISSING or data is None:
+        type._fail('required')
+
+    if not is_list(data):
+        type._fail('invalid')
+
+    outcomes = await loader.gather([
+        loader.load(type.item_type, item) for item in data
+    ])
+
+    errors_builder = ValidationErrorBuilder()
+    items = []
+    for idx, (item, error) in enumerate(outcomes):
+        if error is not None:
+            errors_builder.add_errors({idx: error.raw_messages})
+        items.append(item)
+    errors_builder.raise_errors()
+
+    return await loader.validate(type, items)
+
+
+@_loader(Tuple)
+async def _load_tuple(loader, type, data):
+    if data is MISSING or data is None:
+        type._fail('required')
+
+    if not is_list(data):
+        type._fail('invalid')
+
+    if len(data) != len(type.item_types):
+        type._fail('invalid_length', expected_length=len(type.item_types))
+
+    outcomes = await loader.gather([
+        loader.load(item_type, item)
+        for item_type, item in zip(type.item_types, data)
+    ])
+
+    errors_builder = ValidationErrorBuilder()
+    items = []
+    for idx, (item, error) in enumerate(outcomes):
+        if error is not None:
+            errors_builder.add_errors({idx: error.raw_messages})
+        items.append(item)
+    errors_builder.raise_errors()
+
+    return await loader.validate(type, items)
+
+
+@_loader(Dict)
+async def _load_dict(loader, type, data):
+    if data is MISSING or data is None:
+        type._fail('required')
+
+    if not is_dict(data):
+        type._fail('invalid')
+
+    keys = []
+    awaitables = []
+    for k, v in iteritems(data):
+        value_type = type.value_types.get(k)
+        if value_type is None:
+            continue
+        keys.append(k)
+        awaitables.append(loader.load(value_type, v))
+
+    errors_builder = ValidationErrorBuilder()
+    result = {}
+    for k, (value, error) in zip(keys, await loader.gather(awaitables)):
+        if error is not None:
+            errors_builder.add_error(k, error.raw_messages)
+        else:
+            result[k] = value
+    errors_builder.raise_errors()
+
+    return await loader.validate(type, result)
+
+
+async def _load_field(loader, field, name, data):
+    field_load = _function(field.__class__.load)
+    if field_load is _function(Field.load):
+        return MISSING
+    elif field_load is _function(AttributeField.load):
+        return await loader.load(field.field_type, data.get(name, MISSING))
+    return field.load(name, data, loader.context)
+
+
+@_loader(Object)
+async def _load_object(loader, type, data):
+    if data is MISSING or data is None:
+        type._fail('required')
+
+    if not is_dict(data):
+        type._fail('invalid')
+
+    fields = list(iteritems(type.fields))
+    outcomes = await loader.gather([
+        _load_field(loader, field, name, data) for name, field in fields
+    ])
+
+    errors_builder = ValidationErrorBuilder()
+    result = {}
+    for (name, _), (loaded, error) in zip(fields, outcomes):
+        if error is not None:
+            errors_builder.add_error(name, error.raw_messages)
+        elif loaded is not MISSING:
+            result[name] = loaded
+
+    if not type.allow_extra_fields:
+        for name in data:
+            if name not in type.fields:
+                errors_builder.add_error(name, type._error_message('unknown'))
+
+    errors_builder.raise_errors()
+
+    return type._construct(await loader.validate(type, result))
+
+
+@_loader(Optional)
+async def _load_optional(loader, type, data):
+    if data is MISSING or data is None:
+        return type.load_default
+    return await loader.validate(type, await loader.load(type.inner_type, data))
+
+
+@_loader(LoadOnly)
+async def _load_load_only(loader, type, data):
+    return await loader.load(type.inner_type, data)
+
+
+@_loader(Cached)
+async def _load_cached(loader, type, data):
+    # Results of asynchronous validation are not cached
+    return await loader.validate(type, await loader.load(type.inner_type, data))
+
+
+@_loader(DumpOnly)
+async def _load_dump_only(loader, type, data):
+    return MISSING
+
+
+async def load_async(type, data, context=None, concurrency=None):
+    """Deserializes data with given type running asynchronous validators.
+    See :meth:`Type.load_async() <lollipop.types.Type.load_async>`.
+
+    :param Type type: Type to load data with.
+    :param data: Data to deserialize.
+    :param context: Context data.
+    :param int concurrency: Maximum number of asynchronous validators
+        running at the same time.
+    """
+    return await _Loader(context, concurrency).load(type, data)
+
+
+async def validate_async(type, data, context=None, concurrency=None):
+    """Validates data with given type running asynchronous validators.
+    Returns validation errors or empty dict.
+    See :meth:`Type.validate_async() <lollipop.types.Type.validate_async>`.
+
+    :param Type type: Type to validate data with.
+    :param data: Data to validate.
+    :param context: Context data.
+    :param int concurrency: Maximum number of asynchronous validators
+        running at the same time.
+    """
+    try:
+        await load_async(type, data, context, concurrency)
+        return {}
+    except ValidationError as ve:
+        return ve.messages
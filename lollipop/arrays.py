@@ -0,0 +1,199 @@
+"""Types that load data into `NumPy <http://www.numpy.org/>`_ arrays.
+
+Requires ``numpy`` package to be installed (``pip install lollipop[numpy]``).
+"""
+from lollipop.types import MISSING, Type, List, Number, _error_limit, \
+    _limit_errors
+from lollipop.errors import ValidationError, merge_errors, flatten_errors
+from lollipop.validators import Range
+from lollipop.utils import is_list
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+__all__ = [
+    'NumericArray',
+    'array_to_numpy',
+]
+
+
+#: NumPy data types for :mod:`array` typecodes used in columnar dumps
+_TYPECODE_DTYPES = {
+    'q': 'int64',
+    'd': 'float64',
+    'b': 'bool',
+}
+
+
+def array_to_numpy(column):
+    """Converts :class:`array.array` into :class:`numpy.ndarray` sharing
+    the same memory buffer.
+
+    :param array.array column: Array to convert.
+    """
+    if numpy is None:
+        raise ImportError('Converting to NumPy arrays requires numpy package')
+    return numpy.frombuffer(column, dtype=_TYPECODE_DTYPES[column.typecode])
+
+
+def _is_vectorizable_range(validator):
+    return isinstance(validator, Range) and \
+        validator.__class__.__call__ == Range.__call__
+
+
+def _range_mask(validator, array):
+    """Returns boolean mask of array items that fail given
+    :class:`~lollipop.validators.Range` validator."""
+    if validator.min is not None and validator.max is not None:
+        return (array < validator.min) | (array > validator.max)
+    elif validator.min is not None:
+        return array < validator.min
+    elif validator.max is not None:
+        return array > validator.max
+    return numpy.zeros(len(array), dtype=bool)
+
+
+class NumericArray(List):
+    """A homogenous list of numbers which loads into :class:`numpy.ndarray`.
+
+    Whole list is converted in one call. :class:`~lollipop.validators.Range`
+    validators of item type are applied to all items at once, other item
+    validators are called for each item. Errors are reported in the same
+    format as :class:`~lollipop.types.List` does. If data can not be converted
+    at once (e.g. it contains non-numeric values), items are loaded one by one
+    to find which of them are invalid.
+
+    Example: ::
+
+        NumericArray(Float(validate=Range(min=0))).load([1.5, 2.0, 3])
+        # => numpy.array([1.5, 2.0, 3.0])
+
+        NumericArray(Float(validate=Range(min=0))).load([1.5, -2.0, 'foo'])
+        # => ValidationError({1: 'Value should be at least 0',
+        #                     2: 'Value should be float'})
+
+    :param Number item_type: Type of list elements, e.g.
+        :class:`~lollipop.types.Integer` or :class:`~lollipop.types.Float`.
+    :param dtype: NumPy data type of loaded array. By default is derived from
+        item type.
+    :param kwargs: Same keyword arguments as for :class:`~lollipop.types.Type`.
+    """
+
+    __slots__ = ('dtype',)
+
+    def __init__(self, item_type, dtype=None, **kwargs):
+        if numpy is None:
+            raise ImportError('NumericArray requires numpy package')
+        if not isinstance(item_type, Number):
+            raise ValueError('Item type should be a Number type')
+        super(NumericArray, self).__init__(item_type, **kwargs)
+        self.dtype = numpy.dtype(dtype or item_type.num_type)
+
+    def _is_vectorizable(self):
+        item_class = self.item_type.__class__
+        return item_class.load == Number.load and \
+            item_class._normalize == Number._normalize and \
+            self.item_type.num_type in (int, float)
+
+    def _convert(self, data):
+        """Converts whole data to array of target type. Returns None if
+        conversion would not match item type conversion rules."""
+        try:
+            array = numpy.asarray(data)
+        except (TypeError, ValueError):
+            return None
+
+        if array.ndim != 1 or array.dtype.kind not in 'bif':
+            return None
+
+        if self.dtype.kind in 'iu' and len(array):
+            if array.dtype.kind == 'f' and not numpy.isfinite(array).all():
+                return None
+            info = numpy.iinfo(self.dtype)
+            # Compare as Python ints: float bounds are rounded, e.g. 2 ** 63
+            # does not exceed float64(2 ** 63 - 1) but can't be cast to int64
+            if int(array.min()) < info.min or int(array.max()) > info.max:
+                return None
+
+        return array.astype(self.dtype, copy=array is data)
+
+    def _validate_items(self, array, context):
+        errors = {}
+
+        def validate(idx, validator, with_context):
+            try:
+                value = array[idx].item()
+                if with_context:
+                    validator(value, context)
+                else:
+                    validator(value)
+            except ValidationError as ve:
+                errors[idx] = merge_errors(errors.get(idx), ve.raw_messages)
+
+        for validator, with_context in self.item_type._validator_plans:
+            if _is_vectorizable_range(validator):
+                # Only items that are out of range are validated individually
+                # to get exactly the same error messages
+                indexes = numpy.flatnonzero(_range_mask(validator, array))
+            else:
+                indexes = range(len(array))
+
+            for idx in indexes:
+                validate(int(idx), validator, with_context)
+
+        if errors:
+            raise ValidationError(errors)
+
+    def load(self, data, context=None, fail_fast=False, max_errors=None,
+             lazy=False):
+        """Deserialize data into array. Accepts the same arguments as
+        :meth:`List.load() <lollipop.types.List.load>`; arrays are always
+        loaded eagerly, so `lazy` is ignored."""
+        limit = _error_limit(fail_fast, max_errors)
+        try:
+            return self._load_array(data, context)
+        except ValidationError as ve:
+            if limit is None:
+                raise
+            raise ValidationError(
+                _limit_errors(flatten_errors(ve.raw_messages), limit)
+            )
+
+    def _load_limited(self, data, context, limit):
+        return self.load(data, context, max_errors=limit)
+
+    def _load_array(self, data, context):
+        if data is MISSING or data is None:
+            self._fail('required')
+
+        if not is_list(data) and not isinstance(data, numpy.ndarray):
+            self._fail('invalid')
+
+        array = self._convert(data) if self._is_vectorizable() else None
+        if array is not None:
+            self._validate_items(array, context)
+        else:
+            items, errors = self.item_type.load_many(data, context)
+            if errors:
+                raise ValidationError(errors)
+            try:
+                array = numpy.array(items, dtype=self.dtype)
+            except OverflowError:
+                array = numpy.array(items, dtype=object)
+
+        return Type.load(self, array, context)
+
+    def dump(self, value, context=None):
+        if isinstance(value, numpy.ndarray):
+            value = value.tolist()
+        return super(NumericArray, self).dump(value, context)
+
+    def __repr__(self):
+        return '<{klass} of {item_type} dtype={dtype}>'.format(
+            klass=self.__class__.__name__,
+            item_type=repr(self.item_type),
+            dtype=self.dtype,
+        )
@@ -0,0 +1,801 @@
+"""Benchmark suite.
+
+Measures load, dump and validate throughput of every built-in type, cost of
+built-in validators, schema construction, error reporting and parallel
+processing and how loading scales with schema width, nesting depth,
+list length and share of invalid items. Results are saved as JSON so that
+runs (e.g. before and after an upgrade) can be compared: ::
+
+    python -m lollipop.benchmarks run -o before.json
+    python -m lollipop.benchmarks run -o after.json
+    python -m lollipop.benchmarks diff before.json after.json
+
+Other commands and options: ::
+
+    python -m lollipop.benchmarks list               # list benchmark names
+    python -m lollipop.benchmarks run -k types.Object   # run matching only
+    python -m lollipop.benchmarks run --quick        # shorter measurements
+    python -m lollipop.benchmarks diff a.json b.json --threshold 10 --fail
+
+Each benchmark runs an operation over a batch of generated values (data is
+generated with a fixed random seed, so runs are reproducible). Batch is
+repeated until a run takes at least `min_time` seconds; the best of
+`repeat` runs is reported as nanoseconds per operation.
+"""
+from __future__ import print_function
+from lollipop import __version__
+from lollipop.types import Any, String, Integer, Float, Boolean, Enum, \
+    DateTime, Date, Time, List, Tuple, Dict, DictWithDefault, \
+    AttributeField, ConstantField, MethodField, FunctionField, Object, \
+    Optional, LoadOnly, DumpOnly, Cached, record
+from lollipop.validators import Predicate, Range, Length, NoneOf, AnyOf, \
+    Regexp
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+from collections import namedtuple, OrderedDict
+import argparse
+import datetime
+import fnmatch
+import gc
+import json
+import platform
+import random
+import sys
+import time
+import timeit
+
+try:
+    import enum
+except ImportError:  # Python 2 without enum34 package
+    enum = None
+
+try:
+    import dataclasses
+except ImportError:  # Python < 3.7
+    dataclasses = None
+
+
+__all__ = [
+    'BENCHMARKS',
+    'benchmark',
+    'run',
+    'diff',
+    'main',
+]
+
+
+#: Registered benchmarks: mapping of name to function which prepares data and
+#: returns tuple of benchmarked callable and number of operations it performs
+BENCHMARKS = OrderedDict()
+
+#: Number of values processed by a single call of benchmarked callable
+BATCH_SIZE = 100
+
+#: Random seed for generated data
+SEED = 0
+
+
+def benchmark(name):
+    """Decorator which registers benchmark setup function under given name.
+    Setup function should return tuple of callable to benchmark and number of
+    operations performed by a single call.
+
+    Example: ::
+
+        @benchmark('types.MyType.load')
+        def _():
+            values = [...]
+            def load():
+                for value in values:
+                    MyType().load(value)
+            return load, len(values)
+
+    :param str name: Benchmark name.
+    """
+    def decorator(func):
+        BENCHMARKS[name] = func
+        return func
+    return decorator
+
+
+# Data generators
+
+def _random():
+    return random.Random(SEED)
+
+
+def _strings(rnd, count=BATCH_SIZE):
+    return ['%s %d' % (rnd.choice(['foo', 'bar', 'baz']), rnd.randint(0, 1000))
+            for _ in range(count)]
+
+
+def _datetimes(rnd, count=BATCH_SIZE):
+    start = datetime.datetime(2016, 1, 1)
+    return [start + datetime.timedelta(seconds=rnd.randint(0, 10 ** 8))
+            for _ in range(count)]
+
+
+Person = namedtuple('Person', ['name', 'email', 'age', 'height', 'active'])
+
+PERSON_FIELDS = {
+    'name': String(),
+    'email': String(),
+    'age': Integer(),
+    'height': Float(),
+    'active': Boolean(),
+}
+
+
+def _people(rnd, count=BATCH_SIZE):
+    return [Person('Person %d' % idx, 'person%d@example.com' % idx,
+                   rnd.randint(0, 99), rnd.uniform(1.5, 2.0), rnd.random() < 0.5)
+            for idx in range(count)]
+
+
+def _person_data(person):
+    return dict(person._asdict())
+
+
+class _Person(object):
+    def __init__(self, name, email, age, height, active):
+        self.name = name
+        self.email = email
+        self.age = age
+        self.height = height
+        self.active = active
+
+
+def _person_dataclass():
+    if dataclasses is None:
+        raise ImportError('dataclasses module is not available')
+    return dataclasses.make_dataclass('PersonData', list(Person._fields))
+
+
+def _levels():
+    """Returns choices for Enum benchmarks: enum class if enum module is
+    available, mapping otherwise."""
+    if enum is None:
+        return {'low': 1, 'medium': 2, 'high': 3}
+    return enum.Enum('Level', [('LOW', 'low'), ('MEDIUM', 'medium'),
+                               ('HIGH', 'high')])
+
+
+class _Account(object):
+    def __init__(self, login, balance):
+        self.login = login
+        self.balance = balance
+
+    def get_label(self):
+        return self.login.upper()
+
+
+# Benchmarks of types
+
+def _register_type(name, make_type, data, values=None, directions=None):
+    """Registers load, dump and validate benchmarks of given type.
+
+    :param str name: Type name.
+    :param callable make_type: Function that returns type to benchmark.
+    :param callable data: Function that takes Random and returns list of
+        serialized values.
+    :param callable values: Function that takes Random and returns list of
+        values to dump. Loaded data is dumped by default.
+    :param list directions: Subset of 'load', 'dump' and 'validate'.
+    """
+    directions = directions or ['load', 'dump', 'validate']
+
+    def loader(method):
+        def setup():
+            type = make_type()
+            items = data(_random())
+            func = getattr(type, method)
+
+            def run():
+                for item in items:
+                    func(item)
+            return run, len(items)
+        return setup
+
+    def dumper():
+        type = make_type()
+        items = values(_random()) if values is not None else \
+            [type.load(item) for item in data(_random())]
+        dump = type.dump
+
+        def run():
+            for item in items:
+                dump(item)
+        return run, len(items)
+
+    for direction in directions:
+        benchmark('types.%s.%s' % (name, direction))(
+            dumper if direction == 'dump' else loader(direction)
+        )
+
+
+_register_type('Any', Any, lambda rnd: list(range(BATCH_SIZE)))
+_register_type('String', String, _strings)
+_register_type('String[validated]', lambda: String(validate=[
+    Length(min=1, max=64), Regexp('^[a-z]+ [0-9]+$'), NoneOf(['admin', 'root']),
+]), _strings, directions=['load'])
+_register_type('Integer', Integer,
+               lambda rnd: [rnd.randint(0, 10 ** 6) for _ in range(BATCH_SIZE)])
+_register_type('Float', Float,
+               lambda rnd: [rnd.random() for _ in range(BATCH_SIZE)])
+_register_type('Boolean', Boolean,
+               lambda rnd: [rnd.random() < 0.5 for _ in range(BATCH_SIZE)])
+_register_type('Enum', lambda: Enum(_levels()),
+               lambda rnd: [rnd.choice(['low', 'medium', 'high'])
+                            for _ in range(BATCH_SIZE)])
+_register_type('DateTime', DateTime,
+               lambda rnd: [value.isoformat() for value in _datetimes(rnd)],
+               _datetimes)
+_register_type('DateTime[compiled]', lambda: DateTime().compile(),
+               lambda rnd: [value.isoformat() for value in _datetimes(rnd)],
+               _datetimes, directions=['load', 'dump'])
+_register_type('DateTime[format]',
+               lambda: DateTime(format='%Y-%m-%dT%H:%M:%SUTC'),
+               lambda rnd: [value.strftime('%Y-%m-%dT%H:%M:%SUTC')
+                            for value in _datetimes(rnd)],
+               _datetimes, directions=['load', 'dump'])
+_register_type('Date', Date,
+               lambda rnd: [value.date().isoformat()
+                            for value in _datetimes(rnd)],
+               lambda rnd: [value.date() for value in _datetimes(rnd)])
+_register_type('Time', Time,
+               lambda rnd: [value.time().strftime('%H:%M:%S')
+                            for value in _datetimes(rnd)],
+               lambda rnd: [value.time() for value in _datetimes(rnd)])
+_register_type('List', lambda: List(Integer()),
+               lambda rnd: [[rnd.randint(0, 100) for _ in range(10)]
+                            for _ in range(BATCH_SIZE)])
+_register_type('Tuple', lambda: Tuple([String(), Integer(), Boolean()]),
+               lambda rnd: [['foo', rnd.randint(0, 100), True]
+                            for _ in range(BATCH_SIZE)])
+_register_type('Dict', lambda: Dict(Integer()),
+               lambda rnd: [{'key%d' % idx: rnd.randint(0, 100)
+                             for idx in range(10)}
+                            for _ in range(BATCH_SIZE)])
+_register_type('Dict[fixed]',
+               lambda: Dict({'name': String(), 'age': Integer()}),
+               lambda rnd: [{'name': name, 'age': rnd.randint(0, 100)}
+                            for name in _strings(rnd)])
+_register_type('Object', lambda: Object(PERSON_FIELDS),
+               lambda rnd: [_person_data(p) for p in _people(rnd)],
+               _people)
+_register_type('Object[namedtuple]',
+               lambda: Object(PERSON_FIELDS, constructor=Person),
+               lambda rnd: [_person_data(p) for p in _people(rnd)])
+_register_type('Object[record]',
+               lambda: Object(PERSON_FIELDS, constructor=record('Record')),
+               lambda rnd: [_person_data(p) for p in _people(rnd)])
+_register_type('Object[class]',
+               lambda: Object(PERSON_FIELDS, constructor=_Person),
+               lambda rnd: [_person_data(p) for p in _people(rnd)],
+               directions=['load'])
+_register_type('Object[dataclass]',
+               lambda: Object(PERSON_FIELDS, constructor=_person_dataclass()),
+               lambda rnd: [_person_data(p) for p in _people(rnd)],
+               directions=['load'])
+_register_type('Object[compiled]',
+               lambda: Object(PERSON_FIELDS, constructor=Person).compile(),
+               lambda rnd: [_person_data(p) for p in _people(rnd)])
+_register_type('Object[dataclass,compiled]',
+               lambda: Object(PERSON_FIELDS,
+                              constructor=_person_dataclass()).compile(),
+               lambda rnd: [_person_data(p) for p in _people(rnd)],
+               directions=['load'])
+_register_type('Object[fields]', lambda: Object({
+    'login': String(),
+    'balance': Integer(),
+    'label': MethodField(String(), 'get_label'),
+    'summary': FunctionField(String(),
+                             lambda name, obj: '%s: %d' % (obj.login,
+                                                           obj.balance)),
+    'kind': ConstantField(String(), 'account'),
+}), None, lambda rnd: [_Account(name, rnd.randint(0, 1000))
+                       for name in _strings(rnd)], directions=['dump'])
+_register_type('Optional', lambda: Optional(String()),
+               lambda rnd: [name if rnd.random() < 0.5 else None
+                            for name in _strings(rnd)])
+_register_type('LoadOnly', lambda: LoadOnly(String()), _strings,
+               directions=['load', 'validate'])
+_register_type('DumpOnly', lambda: DumpOnly(String()), _strings, _strings)
+_register_type('Cached', lambda: Cached(Object(PERSON_FIELDS)),
+               lambda rnd: [_person_data(p) for p in _people(rnd, 10)] * 10,
+               directions=['load', 'validate'])
+
+
+# Benchmarks of validators
+
+def _register_validator(name, validator, data):
+    @benchmark('validators.%s' % name)
+    def setup():
+        items = data(_random())
+
+        def run():
+            for item in items:
+                try:
+                    validator(item)
+                except ValidationError:
+                    pass
+        return run, len(items)
+
+
+_register_validator('Predicate', Predicate(lambda x: x > 10, 'Too small'),
+                    lambda rnd: [rnd.randint(0, 100) for _ in range(BATCH_SIZE)])
+_register_validator('Range', Range(min=10, max=90),
+                    lambda rnd: [rnd.randint(0, 100) for _ in range(BATCH_SIZE)])
+_register_validator('Length', Length(min=5, max=10), _strings)
+_register_validator('AnyOf', AnyOf(['choice%d' % idx for idx in range(20)]),
+                    lambda rnd: ['choice%d' % rnd.randint(0, 25)
+                                 for _ in range(BATCH_SIZE)])
+_register_validator('AnyOf[5000]',
+                    AnyOf(['choice%d' % idx for idx in range(5000)]),
+                    lambda rnd: ['choice%d' % rnd.randint(0, 6000)
+                                 for _ in range(BATCH_SIZE)])
+_register_validator('NoneOf', NoneOf(['choice%d' % idx for idx in range(20)]),
+                    lambda rnd: ['choice%d' % rnd.randint(0, 25)
+                                 for _ in range(BATCH_SIZE)])
+_register_validator('Regexp', Regexp('^[a-z]+ [0-9]+$'), _strings)
+
+
+# Scaling benchmarks
+
+def _register_scaling(name, values, make_type, make_data, repeat=BATCH_SIZE):
+    """Registers benchmarks of loading data for each of parameter values.
+    Operation is loading a single value."""
+    for value in values:
+        def setup(value=value):
+            type = make_type(value)
+            data = make_data(_random(), value)
+
+            def run():
+                for _ in range(repeat):
+                    try:
+                        type.load(data)
+                    except ValidationError:
+                        pass
+            return run, repeat
+        benchmark('scaling.%s.%s' % (name, value))(setup)
+
+
+def _wide_object(width):
+    return Object({'field%d' % idx: Integer() for idx in range(width)})
+
+
+def _deep_object(depth):
+    type = Object({'value': Integer()})
+    for _ in range(depth - 1):
+        type = Object({'value': Integer(), 'child': type})
+    return type
+
+
+def _deep_data(rnd, depth):
+    data = {'value': 0}
+    for idx in range(depth - 1):
+        data = {'value': idx + 1, 'child': data}
+    return data
+
+
+def _invalid_items(rnd, percent):
+    return [rnd.randint(0, 100) if rnd.random() * 100 >= percent else 'x'
+            for _ in range(1000)]
+
+
+_register_scaling('width', [1, 4, 16, 64], _wide_object,
+                  lambda rnd, width: {'field%d' % idx: idx
+                                      for idx in range(width)})
+_register_scaling('depth', [1, 2, 4, 8, 16], _deep_object, _deep_data)
+_register_scaling('length', [10, 100, 1000, 10000],
+                  lambda length: List(Object({'name': String(),
+                                              'age': Integer()})),
+                  lambda rnd, length: [{'name': 'Person %d' % idx,
+                                        'age': rnd.randint(0, 99)}
+                                       for idx in range(length)],
+                  repeat=1)
+_register_scaling('errors', [0, 1, 10, 50, 100],
+                  lambda percent: List(Integer()), _invalid_items,
+                  repeat=1)
+
+
+# Batch benchmarks
+
+def _register_batch(name, make_type, data, counts=(10, 100, 500)):
+    """Registers benchmarks comparing loading and dumping of batches of values
+    of given sizes one by one, with :class:`~lollipop.types.List` and with
+    batch methods (:meth:`~lollipop.types.Type.load_many` and
+    :meth:`~lollipop.types.Type.dump_many`). Operation is processing
+    a single value."""
+    def setup(method, count):
+        def setup():
+            type = make_type()
+            items = data(_random(), count)
+            if method.startswith('dump'):
+                items = [type.load(item) for item in items]
+            if method in ('load', 'dump'):
+                func = getattr(type, method)
+                return (lambda: [func(item) for item in items]), len(items)
+            elif method in ('load[List]', 'dump[List]'):
+                func = getattr(List(type), method[:4])
+            else:
+                func = getattr(type, method)
+            return (lambda: func(items)), len(items)
+        return setup
+
+    for count in counts:
+        for method in ['load', 'load[List]', 'load_many',
+                       'dump', 'dump[List]', 'dump_many']:
+            benchmark('batch.%s.%d.%s' % (name, count, method))(
+                setup(method, count)
+            )
+
+
+def _batch_object(width):
+    return Object({
+        'field%d' % idx: String(validate=Length(max=64)) if idx % 2 else
+        Integer(validate=Range(min=0)) for idx in range(width)
+    }, constructor=record('Record'))
+
+
+def _batch_data(width):
+    def data(rnd, count):
+        return [{'field%d' % idx: 'value %d' % idx if idx % 2 else
+                 rnd.randint(0, 100) for idx in range(width)}
+                for _ in range(count)]
+    return data
+
+
+_register_batch('Object', lambda: _batch_object(10), _batch_data(10))
+_register_batch('Object[40]', lambda: _batch_object(40), _batch_data(40),
+                counts=(10, 150))
+
+
+# Benchmarks of schema construction
+
+def _register_construction(name, make_node, count=BATCH_SIZE):
+    """Registers benchmark of creating schema node. Operation is creating
+    `count` nodes (e.g. fields of a wide schema) with a single call."""
+    @benchmark('construction.%s' % name)
+    def setup():
+        return make_node, count
+
+
+def _wide_schema(width):
+    fields = {}
+    for idx in range(width):
+        kind = idx % 4
+        if kind == 0:
+            field_type = String()
+        elif kind == 1:
+            field_type = Integer(validate=Range(min=0))
+        elif kind == 2:
+            field_type = Optional(String(validate=Length(max=100)))
+        else:
+            field_type = List(Integer())
+        fields['field%d' % idx] = field_type
+    return Object(fields)
+
+
+_string = String()
+_fields = {'foo': _string}
+
+_register_construction('Any', Any, 1)
+_register_construction('String', String, 1)
+_register_construction('String[validated]',
+                       lambda: String(validate=lambda value: None), 1)
+_register_construction('String[error_messages]',
+                       lambda: String(error_messages={'invalid': 'Bad'}), 1)
+_register_construction('Integer', Integer, 1)
+_register_construction('DateTime', DateTime, 1)
+_register_construction('List', lambda: List(_string), 1)
+_register_construction('Dict', lambda: Dict(_string), 1)
+_register_construction('DictWithDefault',
+                       lambda: DictWithDefault(_fields), 1)
+_register_construction('Object', lambda: Object(_fields), 1)
+_register_construction('Optional', lambda: Optional(_string), 1)
+_register_construction('AttributeField', lambda: AttributeField(_string), 1)
+_register_construction('MethodField',
+                       lambda: MethodField(_string, 'get_foo'), 1)
+_register_construction('ConstantField', lambda: ConstantField(_string, 1), 1)
+_register_construction('Predicate', lambda: Predicate(lambda value: True), 1)
+_register_construction('Range', lambda: Range(min=0), 1)
+_register_construction('Length', lambda: Length(max=10), 1)
+_register_construction('AnyOf', lambda: AnyOf(['foo']), 1)
+_register_construction('Regexp', lambda: Regexp('foo'), 1)
+for _width in [100, 1000]:
+    _register_construction('Object[%d fields]' % _width,
+                           lambda width=_width: _wide_schema(width), _width)
+_register_construction('Object[small]', lambda: Object({
+    'name': String(validate=Length(min=1),
+                   error_messages={'required': 'Name is required'}),
+    'age': Optional(Integer(validate=Range(min=0))),
+    'tags': List(String()),
+}), 1)
+
+
+# Benchmarks of error reporting
+
+def _register_errors(name, counts, make_run):
+    """Registers benchmarks of reporting given numbers of errors.
+    Operation is reporting a single error."""
+    for count in counts:
+        def setup(count=count):
+            return make_run(count), count
+        benchmark('errors.%s.%d' % (name, count))(setup)
+
+
+def _build_errors(count):
+    def run():
+        builder = ValidationErrorBuilder()
+        for idx in range(count):
+            builder.add_errors({idx: 'Invalid'})
+        return builder.errors
+    return run
+
+
+def _load_invalid_list(count):
+    type = List(Integer())
+    data = ['x'] * count
+
+    def run():
+        try:
+            type.load(data)
+        except ValidationError as ve:
+            return ve.messages
+    return run
+
+
+_register_errors('ValidationErrorBuilder', [1000, 10000], _build_errors)
+_register_errors('List.load', [1000, 10000], _load_invalid_list)
+
+
+# Benchmarks of parallel processing
+
+#: Item of parallel benchmarks (item type should be picklable)
+Record = namedtuple('Record', ['id', 'name', 'email', 'score', 'active',
+                               'tags'])
+
+
+def _register_parallel(workers, count=10000):
+    """Registers benchmarks of loading and dumping list of objects with pools
+    of given sizes of worker processes (see :mod:`lollipop.parallel`) and
+    sequentially. Pool is started for each call. Operation is processing
+    a single item."""
+    def setup(method, parallel):
+        def setup():
+            type = List(Object({
+                'id': Integer(validate=Range(min=0)),
+                'name': String(validate=Length(min=1, max=100)),
+                'email': String(),
+                'score': Float(),
+                'active': Boolean(),
+                'tags': Optional(List(String())),
+            }, constructor=Record))
+            rnd = _random()
+            items = [{
+                'id': idx,
+                'name': 'Record %d' % idx,
+                'email': 'user%d@example.com' % idx,
+                'score': rnd.random(),
+                'active': rnd.random() < 0.5,
+                'tags': ['foo', 'bar'],
+            } for idx in range(count)]
+            if method == 'dump':
+                items = type.load(items)
+            func = getattr(type, method)
+            if parallel is None:
+                return (lambda: func(items)), count
+            return (lambda: func(items, parallel=parallel)), count
+        return setup
+
+    for method in ['load', 'dump']:
+        benchmark('parallel.List.%s.sequential' % method)(setup(method, None))
+        for parallel in workers:
+            benchmark('parallel.List.%s.%d' % (method, parallel))(
+                setup(method, parallel)
+            )
+
+
+_register_parallel([2, 4])
+
+
+# Running
+
+def _measure(func, min_time, repeat):
+    """Returns list of run times in nanoseconds of a single func call."""
+    timer = timeit.Timer(func)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 10 ** 6:
+            break
+        number *= 2 if elapsed * 10 >= min_time else 10
+    times = [elapsed] + timer.repeat(repeat=max(repeat - 1, 0), number=number)
+    return [int(t * 1e9 / number) for t in times]
+
+
+def _metadata(min_time, repeat):
+    return OrderedDict([
+        ('lollipop', __version__),
+        ('python', platform.python_version()),
+        ('implementation', platform.python_implementation()),
+        ('platform', platform.platform()),
+        ('timestamp', time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime())),
+        ('min_time', min_time),
+        ('repeat', repeat),
+    ])
+
+
+def _select(patterns):
+    if not patterns:
+        return list(BENCHMARKS)
+    return [name for name in BENCHMARKS
+            if any(fnmatch.fnmatchcase(name, pattern) or
+                   name.startswith(pattern) for pattern in patterns)]
+
+
+def run(patterns=None, min_time=0.2, repeat=5, callback=None):
+    """Runs benchmarks and returns results as JSON serializable dict with
+    'meta' (information about environment) and 'results' (mapping of
+    benchmark name to result) keys. Result contains best and median time per
+    operation in nanoseconds ('ns_per_op', 'median_ns_per_op'), operations
+    per second and number of operations in a single call, or 'error' if
+    benchmark has failed.
+
+    :param list patterns: Benchmark name prefixes or glob patterns
+        (e.g. 'types.Object' or '*.load'). All benchmarks run by default.
+    :param float min_time: Minimal time of a single run in seconds.
+    :param int repeat: Number of runs.
+    :param callable callback: Function called with benchmark name and result
+        after each benchmark.
+    """
+    results = OrderedDict()
+    for name in _select(patterns):
+        try:
+            func, ops = BENCHMARKS[name]()
+            times = sorted(_measure(func, min_time, repeat))
+        except Exception as e:
+            result = OrderedDict([
+                ('error', '%s: %s' % (e.__class__.__name__, e)),
+            ])
+        else:
+            best = times[0] / float(ops)
+            result = OrderedDict([
+                ('ns_per_op', round(best, 1)),
+                ('median_ns_per_op', round(times[len(times) // 2] / float(ops), 1)),
+                ('ops_per_sec', int(1e9 / best) if best else None),
+                ('ops', ops),
+            ])
+        results[name] = result
+        if callback is not None:
+            callback(name, result)
+    gc.collect()
+    return OrderedDict([
+        ('meta', _metadata(min_time, repeat)),
+        ('results', results),
+    ])
+
+
+def diff(old, new, threshold=5.0):
+    """Compares two results of :func:`run`. Returns list of tuples of
+    benchmark name, old and new time per operation (None if benchmark is
+    absent or failed in one of results), relative change in percent
+    (positive is slower) and flag whether change exceeds threshold.
+
+    :param dict old: Baseline results.
+    :param dict new: New results.
+    :param float threshold: Change in percent which is considered significant.
+    """
+    old_results = old.get('results', {})
+    new_results = new.get('results', {})
+    names = list(old_results) + \
+        [name for name in new_results if name not in old_results]
+
+    rows = []
+    for name in names:
+        old_time = old_results.get(name, {}).get('ns_per_op')
+        new_time = new_results.get(name, {}).get('ns_per_op')
+        change = None
+        if old_time and new_time is not None:
+            change = (new_time - old_time) * 100.0 / old_time
+        rows.append((name, old_time, new_time, change,
+                     change is not None and abs(change) >= threshold))
+    return rows
+
+
+def _format_time(ns):
+    if ns is None:
+        return '-'
+    elif ns >= 1e6:
+        return '%.2f ms' % (ns / 1e6)
+    elif ns >= 1e3:
+        return '%.2f us' % (ns / 1e3)
+    return '%.1f ns' % ns
+
+
+def _print_result(name, result, file=None):
+    file = file or sys.stdout
+    if 'error' in result:
+        print('%-40s %14s' % (name, 'ERROR'), result['error'], file=file)
+    else:
+        print('%-40s %14s %14s ops/s' % (
+            name, _format_time(result['ns_per_op']), result['ops_per_sec'],
+        ), file=file)
+    file.flush()
+
+
+def _print_diff(rows, file=None):
+    file = file or sys.stdout
+    print('%-40s %14s %14s %10s' % ('benchmark', 'old', 'new', 'change'),
+          file=file)
+    for name, old_time, new_time, change, significant in rows:
+        print('%-40s %14s %14s %10s%s' % (
+            name, _format_time(old_time), _format_time(new_time),
+            '-' if change is None else '%+.1f%%' % change,
+            (' slower' if change > 0 else ' faster') if significant else '',
+        ), file=file)
+
+
+def main(argv=None):
+    """Command line entry point. Returns exit status."""
+    parser = argparse.ArgumentParser(
+        prog='python -m lollipop.benchmarks',
+        description='Lollipop benchmark suite',
+    )
+    commands = parser.add_subparsers(dest='command')
+
+    list_parser = commands.add_parser('list', help='list benchmarks')
+    list_parser.add_argument('patterns', nargs='*', metavar='PATTERN')
+
+    run_parser = commands.add_parser('run', help='run benchmarks')
+    run_parser.add_argument('-k', dest='patterns', action='append',
+                            metavar='PATTERN',
+                            help='run benchmarks with matching names only')
+    run_parser.add_argument('-o', '--output', metavar='FILE',
+                            help='save results as JSON to given file')
+    run_parser.add_argument('--repeat', type=int, default=5,
+                            help='number of runs (default: 5)')
+    run_parser.add_argument('--min-time', type=float, default=0.2,
+                            help='minimal run time in seconds (default: 0.2)')
+    run_parser.add_argument('--quick', action='store_true',
+                            help='fast, less precise measurements')
+
+    diff_parser = commands.add_parser('diff', help='compare two results')
+    diff_parser.add_argument('old', metavar='OLD')
+    diff_parser.add_argument('new', metavar='NEW')
+    diff_parser.add_argument('--threshold', type=float, default=5.0,
+                             help='significant change in percent (default: 5)')
+    diff_parser.add_argument('--fail', action='store_true',
+                             help='exit with status 1 if anything became '
+                                  'significantly slower')
+
+    args = parser.parse_args(argv)
+    if args.command == 'list':
+        for name in _select(args.patterns):
+            print(name)
+    elif args.command == 'run':
+        min_time, repeat = args.min_time, args.repeat
+        if args.quick:
+            min_time, repeat = min(min_time, 0.02), min(repeat, 3)
+        results = run(args.patterns, min_time, repeat, callback=_print_result)
+        if args.output:
+            with open(args.output, 'w') as f:
+                json.dump(results, f, indent=2)
+    elif args.command == 'diff':
+        with open(args.old) as f:
+            old = json.load(f)
+        with open(args.new) as f:
+            new = json.load(f)
+        rows = diff(old, new, args.threshold)
+        _print_diff(rows)
+        if args.fail and any(significant and change > 0
+                             for _, _, _, change, significant in rows):
+            return 1
+    else:
+        parser.print_help()
+        return 2
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,825 @@
+"""Schema compiler.
+
+Walks a type tree once and generates specialized Python source for loading and
+dumping data of that type. Generated functions produce the same results and the
+same error messages as :meth:`Type.load() <lollipop.types.Type.load>` and
+:meth:`Type.dump() <lollipop.types.Type.dump>`, but avoid per-call dispatch
+through the type hierarchy.
+
+Example: ::
+
+    PersonType = Object({
+        'name': String(),
+        'age': Integer(),
+    }, constructor=Person)
+
+    CompiledPersonType = PersonType.compile()
+    CompiledPersonType.load({'name': 'John', 'age': 42})
+    # => Person(name='John', age=42)
+
+Built-in types are compiled into straight-line code. Custom types (and subclasses
+of built-in types that override ``load()`` or ``dump()``) are called as is.
+Type tree is inspected at compile time, so it should not be modified after
+compilation.
+"""
+from lollipop.types import MISSING, Type, Number, String, Boolean, Enum, \
+    DateTime, Date, Time, List, Dict, DictWithDefault, Field, ConstantField, \
+    AttributeField, Object, Optional, LoadOnly, DumpOnly, \
+    _DUMPING, _dump_state, _with_dump_memo, _load_lazy
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+from lollipop.utils import _function
+from lollipop.compat import string_types, iteritems
+from contextlib import contextmanager
+import datetime
+import itertools
+import weakref
+
+
+__all__ = [
+    'CompiledType',
+    'compile_type',
+]
+
+
+def _overrides(obj, klass, name):
+    """Returns True if `obj` class has it's own implementation of `klass` method
+    with given name."""
+    return _function(getattr(obj.__class__, name)) is not \
+        _function(getattr(klass, name))
+
+
+class _SourceWriter(object):
+    def __init__(self):
+        self.lines = []
+        self.level = 0
+
+    def line(self, line):
+        self.lines.append('    ' * self.level + line)
+
+    @contextmanager
+    def indent(self):
+        self.level += 1
+        yield
+        self.level -= 1
+
+    def source(self):
+        return '\n'.join(self.lines) + '\n'
+
+
+#: Mapping of (direction, type method function) to (emitter, inline, may_be_missing)
+_EMITTERS = {}
+
+
+def _emitter(direction, type_class, inline=True, may_be_missing=True):
+    """Registers code emitter for given type class loading or dumping.
+
+    Emitter is a function that takes compiler, type object, name of source
+    variable and name of destination variable and writes code that assigns
+    loaded/dumped value to destination variable or raises
+    :exc:`~lollipop.errors.ValidationError`.
+
+    :param str direction: Either 'load' or 'dump'.
+    :param type_class: Type class which method emitter replicates.
+    :param bool inline: If False, code will be emitted into separate function.
+    :param bool may_be_missing: If False, generated code never produces
+        :obj:`~lollipop.types.MISSING` value.
+    """
+    def decorator(func):
+        method = _function(getattr(type_class, direction))
+        _EMITTERS[(direction, method)] = (func, inline, may_be_missing)
+        return func
+    return decorator
+
+
+def _find_emitter(node, direction):
+    return _EMITTERS.get((direction, _function(getattr(node.__class__, direction))))
+
+
+class _Compiler(object):
+    def __init__(self):
+        self.namespace = {
+            'MISSING': MISSING,
+            'ValidationError': ValidationError,
+            'ValidationErrorBuilder': ValidationErrorBuilder,
+            'string_types': string_types,
+            'iteritems': iteritems,
+        }
+        self._counter = itertools.count()
+        self._constants = {}
+        self._functions = {}
+        self._sources = []
+        self._definitions = []
+        self.writer = None
+
+    def name(self, prefix):
+        return '%s_%d' % (prefix, next(self._counter))
+
+    def constant(self, value, prefix='c'):
+        """Binds value to a global name in generated code. Returns that name."""
+        key = id(value)
+        if key not in self._constants:
+            name = self.name(prefix)
+            self.namespace[name] = value
+            # Keep reference to value so it's id() stays valid
+            self._constants[key] = (name, value)
+        return self._constants[key][0]
+
+    def literal(self, value):
+        """Returns source code expression that evaluates to given value."""
+        if isinstance(value, string_types) or value is None or \
+                isinstance(value, (bool, int)):
+            return repr(value)
+        return self.constant(value)
+
+    def define(self, name, expression):
+        """Adds global variable definition which is evaluated after all
+        functions are defined."""
+        self._definitions.append('%s = %s' % (name, expression))
+
+    def may_be_missing(self, node, direction):
+        emitter = _find_emitter(node, direction)
+        return emitter is None or emitter[2]
+
+    def function(self, node, direction):
+        """Generates function that loads/dumps data of given type.
+        Returns name of generated function."""
+        key = (id(node), direction)
+        if key not in self._functions:
+            name = self.name('_' + direction)
+            self._functions[key] = name
+            self.constant(node, 't')
+
+            writer, self.writer = self.writer, _SourceWriter()
+            self.writer.line('def %s(data, context=None):' % name)
+            with self.writer.indent():
+                result = self.name('result')
+                emitter = _find_emitter(node, direction)
+                if emitter is None:
+                    self._emit_call(node, direction, 'data', result)
+                else:
+                    emitter[0](self, node, 'data', result)
+                self.writer.line('return %s' % result)
+            self._sources.append(self.writer.source())
+            self.writer = writer
+        return self._functions[key]
+
+    def emit(self, node, direction, src, dst):
+        """Writes code that loads/dumps value from variable `src` into variable
+        `dst` according to given type."""
+        emitter = _find_emitter(node, direction)
+        if emitter is None:
+            self._emit_call(node, direction, src, dst)
+        elif not emitter[1]:
+            self.writer.line('%s = %s(%s, context)' % (
+                dst, self.function(node, direction), src,
+            ))
+        else:
+            emitter[0](self, node, src, dst)
+
+    def _emit_call(self, node, direction, src, dst):
+        self.writer.line('%s = %s.%s(%s, context)' % (
+            dst, self.constant(node, 't'), direction, src,
+        ))
+
+    def emit_required_check(self, node, src):
+        self.writer.line('if %s is MISSING or %s is None:' % (src, src))
+        with self.writer.indent():
+            self.writer.line("%s._fail('required')" % self.constant(node, 't'))
+
+    def emit_validators(self, node, src):
+        """Writes code that runs type validators against value in `src`
+        variable (see :meth:`Type.load() <lollipop.types.Type.load>`)."""
+        if not node._validator_plans:
+            return
+
+        if node._fused_validator is not None:
+            self.writer.line('%s(%s, context)' % (
+                self.constant(node._fused_validator.check, 'v'), src,
+            ))
+            return
+
+        errors = self.name('errors')
+        self.writer.line('%s = None' % errors)
+        for validator, with_context in node._validator_plans:
+            error = self.name('e')
+            self.writer.line('try:')
+            with self.writer.indent():
+                self.writer.line('%s(%s%s)' % (
+                    self.constant(validator, 'v'), src,
+                    ', context' if with_context else '',
+                ))
+            self.writer.line('except ValidationError as %s:' % error)
+            with self.writer.indent():
+                self.emit_add_error(errors, 'add_errors(%s.raw_messages)' % error)
+        self.emit_raise_errors(errors)
+
+    def emit_add_error(self, errors, call):
+        self.writer.line('if %s is None:' % errors)
+        with self.writer.indent():
+            self.writer.line('%s = ValidationErrorBuilder()' % errors)
+        self.writer.line('%s.%s' % (errors, call))
+
+    def emit_raise_errors(self, errors):
+        self.writer.line('if %s is not None:' % errors)
+        with self.writer.indent():
+            self.writer.line('%s.raise_errors()' % errors)
+
+    def compile(self, node):
+        """Compiles given type. Returns tuple of generated load and dump
+        functions."""
+        load = self.function(node, 'load')
+        dump = self.function(node, 'dump')
+        code = compile(self.source, '<lollipop compiled %r>' % node, 'exec')
+        exec(code, self.namespace)
+        return self.namespace[load], self.namespace[dump]
+
+    @property
+    def source(self):
+        return '\n'.join(self._sources + self._definitions)
+
+
+@_emitter('load', Type)
+def _emit_type_load(c, node, src, dst):
+    c.emit_validators(node, src)
+    c.writer.line('%s = %s' % (dst, src))
+
+
+@_emitter('dump', Type)
+def _emit_type_dump(c, node, src, dst):
+    c.writer.line('%s = %s' % (dst, src))
+
+
+def _emit_number_normalize(c, node, src, dst):
+    t = c.constant(node, 't')
+    if _overrides(node, Number, '_normalize'):
+        c.writer.line('%s = %s._normalize(%s)' % (dst, t, src))
+        return
+
+    c.writer.line('try:')
+    with c.writer.indent():
+        c.writer.line('%s = %s(%s)' % (dst, c.constant(node.num_type), src))
+    c.writer.line('except (TypeError, ValueError):')
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % t)
+
+
+@_emitter('load', Number, may_be_missing=False)
+def _emit_number_load(c, node, src, dst):
+    c.emit_required_check(node, src)
+    _emit_number_normalize(c, node, src, dst)
+    c.emit_validators(node, dst)
+
+
+@_emitter('dump', Number, may_be_missing=False)
+def _emit_number_dump(c, node, src, dst):
+    c.emit_required_check(node, src)
+    _emit_number_normalize(c, node, src, dst)
+
+
+@_emitter('load', String, may_be_missing=False)
+def _emit_string_load(c, node, src, dst):
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, string_types):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % c.constant(node, 't'))
+    c.emit_validators(node, src)
+    c.writer.line('%s = %s' % (dst, src))
+
+
+@_emitter('dump', String, may_be_missing=False)
+def _emit_string_dump(c, node, src, dst):
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, string_types):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % c.constant(node, 't'))
+    c.writer.line('%s = str(%s)' % (dst, src))
+
+
+@_emitter('load', Boolean, may_be_missing=False)
+def _emit_boolean_load(c, node, src, dst):
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, bool):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % c.constant(node, 't'))
+    c.emit_validators(node, src)
+    c.writer.line('%s = %s' % (dst, src))
+
+
+@_emitter('dump', Boolean, may_be_missing=False)
+def _emit_boolean_dump(c, node, src, dst):
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, bool):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % c.constant(node, 't'))
+    c.writer.line('%s = bool(%s)' % (dst, src))
+
+
+@_emitter('load', Enum, may_be_missing=False)
+def _emit_enum_load(c, node, src, dst):
+    c.emit_required_check(node, src)
+    c.writer.line('try:')
+    with c.writer.indent():
+        c.writer.line('%s = %s[%s]' % (
+            dst, c.constant(node._load_map, 'choices'), src,
+        ))
+    c.writer.line('except (KeyError, TypeError):')
+    with c.writer.indent():
+        if node._load_pairs:
+            # Unhashable raw values are compared with data one by one
+            c.writer.line('%s = %s._load_value(%s)' % (
+                dst, c.constant(node, 't'), src,
+            ))
+        else:
+            c.writer.line('%s._fail_invalid(%s)' % (c.constant(node, 't'), src))
+    c.emit_validators(node, dst)
+
+
+@_emitter('dump', Enum, may_be_missing=False)
+def _emit_enum_dump(c, node, src, dst):
+    t = c.constant(node, 't')
+    if node._dump_map is None:
+        c.writer.line('%s = %s._dump_value(%s)' % (dst, t, src))
+        return
+
+    c.emit_required_check(node, src)
+    c.writer.line('try:')
+    with c.writer.indent():
+        c.writer.line('%s = %s[%s]' % (
+            dst, c.constant(node._dump_map, 'choices'), src,
+        ))
+    c.writer.line('except (KeyError, TypeError):')
+    with c.writer.indent():
+        # Unhashable values are compared with each choice
+        c.writer.line('%s = %s._dump_value(%s)' % (dst, t, src))
+
+
+_CONVERT_VALUE_EXPRESSIONS = {
+    _function(DateTime._convert_value): '%s',
+    _function(Date._convert_value): '%s.date()',
+    _function(Time._convert_value): '%s.time()',
+}
+
+
+@_emitter('load', DateTime, may_be_missing=False)
+def _emit_datetime_load(c, node, src, dst):
+    t = c.constant(node, 't')
+    format_str = node.FORMATS.get(node.format, node.format)
+
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, string_types):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid_type', data=%s)" % (t, src))
+
+    parse = '%s(%s, %s)' % (
+        c.constant(datetime.datetime.strptime, 'strptime'), src,
+        c.literal(format_str),
+    )
+    expression = _CONVERT_VALUE_EXPRESSIONS.get(
+        _function(node.__class__._convert_value),
+        '%s._convert_value(%%s)' % t,
+    )
+
+    c.writer.line('try:')
+    with c.writer.indent():
+        if format_str == node.ISO_FORMAT:
+            c.writer.line('%s = %s(%s)' % (
+                dst, c.constant(node._parse_iso, 'parse_iso'), src,
+            ))
+            c.writer.line('if %s is None:' % dst)
+            with c.writer.indent():
+                c.writer.line('%s = %s' % (dst, expression % parse))
+        else:
+            c.writer.line('%s = %s' % (dst, expression % parse))
+        c.emit_validators(node, dst)
+    c.writer.line('except ValueError:')
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid_format', data=%s, format=%s)" % (
+            t, src, c.literal(format_str),
+        ))
+
+
+@_emitter('dump', DateTime, may_be_missing=False)
+def _emit_datetime_dump(c, node, src, dst):
+    t = c.constant(node, 't')
+    format_str = node.FORMATS.get(node.format, node.format)
+
+    c.emit_required_check(node, src)
+    strftime = '%s = %s.strftime(%s)' % (dst, src, c.literal(format_str))
+
+    c.writer.line('try:')
+    with c.writer.indent():
+        if format_str == node.ISO_FORMAT:
+            c.writer.line('%s = %s(%s)' % (
+                dst, c.constant(node._format_iso, 'format_iso'), src,
+            ))
+            c.writer.line('if %s is None:' % dst)
+            with c.writer.indent():
+                c.writer.line(strftime)
+        else:
+            c.writer.line(strftime)
+    c.writer.line('except (AttributeError, ValueError):')
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid', data=%s)" % (t, src))
+
+
+def _emit_list(c, node, direction, src, dst):
+    t = c.constant(node, 't')
+    errors = c.name('errors')
+    idx, item, error, loaded = \
+        c.name('idx'), c.name('item'), c.name('e'), c.name('loaded')
+
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, list):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % t)
+
+    c.writer.line('%s = None' % errors)
+    c.writer.line('%s = []' % dst)
+    c.writer.line('for %s, %s in enumerate(%s):' % (idx, item, src))
+    with c.writer.indent():
+        c.writer.line('try:')
+        with c.writer.indent():
+            c.emit(node.item_type, direction, item, loaded)
+            c.writer.line('%s.append(%s)' % (dst, loaded))
+        c.writer.line('except ValidationError as %s:' % error)
+        with c.writer.indent():
+            c.emit_add_error(errors, 'add_errors({%s: %s.raw_messages})' % (idx, error))
+    c.emit_raise_errors(errors)
+
+
+@_emitter('load', List, inline=False, may_be_missing=False)
+def _emit_list_load(c, node, src, dst):
+    _emit_list(c, node, 'load', src, dst)
+    c.emit_validators(node, dst)
+
+
+@_emitter('dump', List, inline=False, may_be_missing=False)
+def _emit_list_dump(c, node, src, dst):
+    _emit_list(c, node, 'dump', src, dst)
+
+
+def _emit_dict(c, node, direction, src, dst):
+    value_types = node.value_types
+    if isinstance(value_types, DictWithDefault):
+        value_types, default = value_types.values, value_types.default
+    elif type(value_types) is dict:
+        default = None
+    else:
+        # Arbitrary mapping objects can return different types for the
+        # same key, so there is nothing to precompute
+        c._emit_call(node, direction, src, dst)
+        return False
+
+    t = c.constant(node, 't')
+    errors = c.name('errors')
+    key, value, error, result = \
+        c.name('key'), c.name('value'), c.name('e'), c.name('result')
+
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, dict):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % t)
+
+    c.writer.line('%s = None' % errors)
+    c.writer.line('%s = {}' % dst)
+    c.writer.line('for %s, %s in iteritems(%s):' % (key, value, src))
+    with c.writer.indent():
+        if value_types:
+            functions = c.name('functions')
+            c.define(functions, '{%s}' % ', '.join([
+                '%s: %s' % (
+                    c.literal(k), 'None' if v is None else c.function(v, direction),
+                )
+                for k, v in iteritems(value_types)
+            ]))
+            function = c.name('function')
+            c.writer.line('%s = %s.get(%s, %s)' % (
+                function, functions, key,
+                'None' if default is None else c.function(default, direction),
+            ))
+            c.writer.line('if %s is None:' % function)
+            with c.writer.indent():
+                c.writer.line('continue')
+        elif default is None:
+            c.writer.line('continue')
+
+        c.writer.line('try:')
+        with c.writer.indent():
+            if value_types:
+                c.writer.line('%s = %s(%s, context)' % (result, function, value))
+            else:
+                c.emit(default, direction, value, result)
+            c.writer.line('%s[%s] = %s' % (dst, key, result))
+        c.writer.line('except ValidationError as %s:' % error)
+        with c.writer.indent():
+            c.emit_add_error(errors, 'add_error(%s, %s.raw_messages)' % (key, error))
+    c.emit_raise_errors(errors)
+    return True
+
+
+@_emitter('load', Dict, inline=False, may_be_missing=False)
+def _emit_dict_load(c, node, src, dst):
+    if _emit_dict(c, node, 'load', src, dst):
+        c.emit_validators(node, dst)
+
+
+@_emitter('dump', Dict, inline=False, may_be_missing=False)
+def _emit_dict_dump(c, node, src, dst):
+    _emit_dict(c, node, 'dump', src, dst)
+
+
+def _emit_field(c, name, call, errors, result, value):
+    """Writes code that stores field value (if it is not MISSING) and
+    collects errors. If `result` is None, value which can't be MISSING
+    is only stored in `value` variable."""
+    error = c.name('e')
+    c.writer.line('try:')
+    with c.writer.indent():
+        may_be_missing = call()
+        if may_be_missing:
+            c.writer.line('if %s is not MISSING:' % value)
+            with c.writer.indent():
+                c.writer.line('%s[%s] = %s' % (result, c.literal(name), value))
+        elif result is not None:
+            c.writer.line('%s[%s] = %s' % (result, c.literal(name), value))
+    c.writer.line('except ValidationError as %s:' % error)
+    with c.writer.indent():
+        c.emit_add_error(errors, 'add_error(%s, %s.raw_messages)' % (
+            c.literal(name), error,
+        ))
+
+
+@_emitter('load', Object, inline=False)
+def _emit_object_load(c, node, src, dst):
+    t = c.constant(node, 't')
+    errors, result = c.name('errors'), c.name('result')
+
+    c.emit_required_check(node, src)
+    c.writer.line('if not isinstance(%s, dict):' % src)
+    with c.writer.indent():
+        c.writer.line("%s._fail('invalid')" % t)
+
+    fields = [
+        (name, field) for name, field in iteritems(node.fields)
+        # Field does not participate in loading
+        if _function(field.__class__.load) is not _function(Field.load)
+    ]
+    plan = node._get_constructor_plan()
+    # If all constructor arguments are always loaded, pass them positionally
+    # from local variables without building result dict
+    positional = plan is not None and not node._validator_plans and \
+        sorted(plan[0]) == sorted(name for name, _ in fields) and all(
+            _function(field.__class__.load) is _function(AttributeField.load) and
+            not c.may_be_missing(field.field_type, 'load')
+            for _, field in fields
+        )
+    values = {}
+
+    c.writer.line('%s = None' % errors)
+    if not positional:
+        c.writer.line('%s = {}' % result)
+    for name, field in fields:
+        value = values[name] = c.name('value')
+        load = _function(field.__class__.load)
+        if load is _function(AttributeField.load):
+            def call(name=name, field=field, value=value):
+                raw = c.name('raw')
+                c.writer.line('%s = %s.get(%s, MISSING)' % (
+                    raw, src, c.literal(name),
+                ))
+                c.emit(field.field_type, 'load', raw, value)
+                return c.may_be_missing(field.field_type, 'load')
+        else:
+            def call(name=name, field=field, value=value):
+                c.writer.line('%s = %s.load(%s, %s, context)' % (
+                    value, c.constant(field, 'f'), c.literal(name), src,
+                ))
+                return True
+
+        _emit_field(c, name, call, errors, None if positional else result,
+                    value)
+
+    if not node.allow_extra_fields:
+        key = c.name('key')
+        c.writer.line('for %s in %s:' % (key, src))
+        with c.writer.indent():
+            c.writer.line('if %s not in %s:' % (key, c.constant(node.fields)))
+            with c.writer.indent():
+                c.emit_add_error(
+                    errors,
+                    "add_error(%s, %s._error_message('unknown'))" % (key, t),
+                )
+
+    c.emit_raise_errors(errors)
+    constructor = c.constant(node.constructor, 'constructor')
+    if positional:
+        names, _, is_tuple = plan
+        args = ''.join('%s, ' % values[name] for name in names)
+        if is_tuple:
+            c.writer.line('%s = tuple.__new__(%s, (%s))' % (
+                dst, constructor, args,
+            ))
+        else:
+            c.writer.line('%s = %s(%s)' % (dst, constructor, args))
+        return
+
+    c.emit_validators(node, result)
+    if node.constructor is dict:
+        # No need to make another copy of result dict
+        c.writer.line('%s = %s' % (dst, result))
+    elif plan is not None:
+        c.writer.line('%s = %s._construct(%s)' % (dst, t, result))
+    else:
+        c.writer.line('%s = %s(**%s)' % (dst, constructor, result))
+
+
+@_emitter('dump', Object, inline=False, may_be_missing=False)
+def _emit_object_dump(c, node, src, dst):
+    t = c.constant(node, 't')
+    errors = c.name('errors')
+    memo, key, entry = c.name('memo'), c.name('key'), c.name('entry')
+    dumping = c.constant(_DUMPING, 'DUMPING')
+
+    c.emit_required_check(node, src)
+
+    # Dump objects referenced multiple times once (see Object._dump())
+    c.writer.line('%s = %s.memo' % (memo, c.constant(_dump_state, 'dump_state')))
+    c.writer.line('%s = None' % key)
+    c.writer.line('if %s is not None:' % memo)
+    with c.writer.indent():
+        c.writer.line('%s = (id(%s), %d)' % (key, src, id(node)))
+        c.writer.line('%s = %s.get(%s)' % (entry, memo, key))
+        c.writer.line('if %s is not None:' % entry)
+        with c.writer.indent():
+            c.writer.line('if %s[1] is %s:' % (entry, dumping))
+            with c.writer.indent():
+                c.writer.line("%s._fail('cycle')" % t)
+            c.writer.line('return %s[1]' % entry)
+        c.writer.line('%s = %s[%s] = [%s, %s]' % (entry, memo, key, src, dumping))
+
+    c.writer.line('try:')
+    with c.writer.indent():
+        _emit_object_dump_fields(c, node, src, dst, errors)
+    c.writer.line('except BaseException:')
+    with c.writer.indent():
+        c.writer.line('if %s is not None:' % key)
+        with c.writer.indent():
+            c.writer.line('del %s[%s]' % (memo, key))
+        c.writer.line('raise')
+    c.writer.line('if %s is not None:' % key)
+    with c.writer.indent():
+        c.writer.line('%s[1] = %s' % (entry, dst))
+
+
+def _emit_object_dump_fields(c, node, src, dst, errors):
+    c.writer.line('%s = None' % errors)
+    c.writer.line('%s = {}' % dst)
+    for name, field in iteritems(node.fields):
+        value = c.name('value')
+        if _overrides(field, Field, 'dump'):
+            def call(name=name, field=field, value=value):
+                c.writer.line('%s = %s.dump(%s, %s, context)' % (
+                    value, c.constant(field, 'f'), c.literal(name), src,
+                ))
+                return True
+        else:
+            def call(name=name, field=field, value=value):
+                raw = c.name('raw')
+                get_value = _function(field.__class__._get_value)
+                if get_value is _function(AttributeField._get_value):
+                    c.writer.line('%s = getattr(%s, %s, MISSING)' % (
+                        raw, src, c.literal(field.attribute or name),
+                    ))
+                elif get_value is _function(ConstantField._get_value):
+                    c.writer.line('%s = %s' % (raw, c.constant(field.value)))
+                else:
+                    c.writer.line('%s = %s._get_value(%s, %s)' % (
+                        raw, c.constant(field, 'f'), c.literal(name), src,
+                    ))
+                c.emit(field.field_type, 'dump', raw, value)
+                return c.may_be_missing(field.field_type, 'dump')
+
+        _emit_field(c, name, call, errors, dst, value)
+
+    c.emit_raise_errors(errors)
+
+
+@_emitter('load', Optional)
+def _emit_optional_load(c, node, src, dst):
+    c.writer.line('if %s is MISSING or %s is None:' % (src, src))
+    with c.writer.indent():
+        c.writer.line('%s = %s' % (dst, c.constant(node.load_default)))
+    c.writer.line('else:')
+    with c.writer.indent():
+        c.emit(node.inner_type, 'load', src, dst)
+        c.emit_validators(node, dst)
+
+
+@_emitter('dump', Optional)
+def _emit_optional_dump(c, node, src, dst):
+    c.writer.line('if %s is MISSING or %s is None:' % (src, src))
+    with c.writer.indent():
+        c.writer.line('%s = %s' % (dst, c.constant(node.dump_default)))
+    c.writer.line('else:')
+    with c.writer.indent():
+        c.emit(node.inner_type, 'dump', src, dst)
+
+
+@_emitter('load', LoadOnly)
+def _emit_load_only_load(c, node, src, dst):
+    c.emit(node.inner_type, 'load', src, dst)
+
+
+@_emitter('dump', LoadOnly)
+def _emit_load_only_dump(c, node, src, dst):
+    c.writer.line('%s = MISSING' % dst)
+
+
+@_emitter('load', DumpOnly)
+def _emit_dump_only_load(c, node, src, dst):
+    c.writer.line('%s = MISSING' % dst)
+
+
+@_emitter('dump', DumpOnly)
+def _emit_dump_only_dump(c, node, src, dst):
+    c.emit(node.inner_type, 'dump', src, dst)
+
+
+class CompiledType(Type):
+    """A wrapper type which loads and dumps data with functions generated
+    specifically for given type. Results and error messages are the same as
+    with given type.
+
+    Usually created with :meth:`Type.compile() <lollipop.types.Type.compile>`.
+
+    :param Type inner_type: Type to compile.
+    """
+
+    __slots__ = ('inner_type', '_load', '_dump', 'source', '_projections')
+
+    def __init__(self, inner_type):
+        super(CompiledType, self).__init__()
+        self.inner_type = inner_type
+        compiler = _Compiler()
+        self._load, self._dump = compiler.compile(inner_type)
+        #: Generated source code (useful for debugging).
+        self.source = compiler.source
+        self._projections = None
+
+    def load(self, data, context=None, **kwargs):
+        if kwargs.pop('lazy', False):
+            # Lazy views load values with inner type
+            return _load_lazy(self.inner_type, data, (context,), kwargs)
+        if not kwargs.get('fail_fast') and kwargs.get('max_errors') is None:
+            kwargs.pop('fail_fast', None)
+            kwargs.pop('max_errors', None)
+        if kwargs:
+            # Error limits and other options (e.g. parallel) are handled
+            # by inner type
+            return self.inner_type.load(data, context, **kwargs)
+        return self._load(data, context)
+
+    def _load_limited(self, data, context, limit):
+        return self.inner_type._load_limited(data, context, limit)
+
+    def iter_errors(self, data, context=None):
+        return self.inner_type.iter_errors(data, context)
+
+    def dump(self, value, context=None, only=None, exclude=None):
+        if only is not None or exclude is not None:
+            return self.project(only, exclude).dump(value, context)
+        return _with_dump_memo(self._dump, value, (context,), {})
+
+    def project(self, only=None, exclude=None):
+        """Returns compiled projection of inner :class:`~lollipop.types.Object`
+        type (see :meth:`Object.project() <lollipop.types.Object.project>`).
+        Compiled projections are cached."""
+        if not isinstance(self.inner_type, Object):
+            raise ValueError('Fields can be selected only for Object types')
+
+        projection = self.inner_type.project(only, exclude)
+        if self._projections is None:
+            self._projections = weakref.WeakKeyDictionary()
+
+        compiled = self._projections.get(projection)
+        if compiled is None:
+            compiled = self._projections[projection] = projection.compile()
+        return compiled
+
+    def compile(self):
+        return self
+
+    def __repr__(self):
+        return '<{klass} {inner_type}>'.format(
+            klass=self.__class__.__name__,
+            inner_type=repr(self.inner_type),
+        )
+
+
+def compile_type(type):
+    """Generates specialized load and dump functions for given type.
+    Returns :class:`CompiledType` instance.
+
+    :param Type type: Type to compile.
+    """
+    return CompiledType(type)
@@ -1,11 +1,17 @@
-from lollipop.compat import iteritems
+from lollipop.compat import string_types, iteritems
+from collections import namedtuple
+import weakref
 
 
 __all__ = [
     'SCHEMA',
+    'ErrorMessage',
+    'ItemError',
     'ValidationError',
     'ValidationErrorBuilder',
+    'flatten_errors',
     'merge_errors',
+    'render_errors',
 ]
 
 
@@ -18,6 +24,46 @@ SCHEMA = '_schema'
 MISSING_ERROR_MESSAGE = 'Error message "{key}" in class {class_name} does not exist'
 
 
+class ErrorMessage(namedtuple('ErrorMessage', ['code', 'template', 'params'])):
+    """Error message which is formatted only when it is rendered.
+    Types and validators report errors with these records, so failing
+    validation does not pay for formatting messages nobody reads.
+
+    :param str code: Machine-readable error code, e.g. 'required'.
+    :param str template: Message template in :meth:`str.format` syntax.
+    :param dict params: Template parameters.
+    """
+    __slots__ = ()
+
+    def __str__(self):
+        return self.template.format(**self.params)
+
+
+def _map_messages(errors, func):
+    if isinstance(errors, dict):
+        return dict((k, _map_messages(v, func)) for k, v in iteritems(errors))
+    elif isinstance(errors, list):
+        return [_map_messages(v, func) for v in errors]
+    return func(errors)
+
+
+def _render_message(message):
+    return str(message) if isinstance(message, ErrorMessage) else message
+
+
+def _message_code(message):
+    return message.code if isinstance(message, ErrorMessage) else None
+
+
+def render_errors(errors):
+    """Returns copy of error messages with all :class:`ErrorMessage` records
+    formatted into strings.
+
+    :param errors: Error messages.
+    """
+    return _map_messages(errors, _render_message)
+
+
 class ValidationError(Exception):
     """Exception to report validation errors.
 
@@ -34,32 +80,104 @@ class ValidationError(Exception):
         where keys are nested fields and values are error messages.
     """
     def __init__(self, messages):
-        super(ValidationError, self).__init__('Invalid data: %r' % messages)
+        super(ValidationError, self).__init__(messages)
         # TODO: normalize messages
-        self.messages = messages
+        #: Error messages as they were reported. Can contain
+        #: :class:`ErrorMessage` records which are not formatted yet.
+        self.raw_messages = messages
+        self._messages = None
+
+    @property
+    def messages(self):
+        """Error messages with all messages formatted into strings."""
+        if self._messages is None:
+            self._messages = render_errors(self.raw_messages)
+        return self._messages
+
+    @messages.setter
+    def messages(self, messages):
+        self.raw_messages = messages
+        self._messages = None
+
+    @property
+    def codes(self):
+        """Error codes in the same format as error messages. Messages that
+        were not reported with a code (e.g. custom messages raised directly)
+        have None code.
+
+        Example: ::
+
+            ValidationError({'foo': ErrorMessage('required', 'Required', {})}).codes
+            # => {'foo': 'required'}
+        """
+        return _map_messages(self.raw_messages, _message_code)
+
+    def __str__(self):
+        return 'Invalid data: %r' % (self.messages,)
+
+
+#: Record of a single invalid item reported when loading streams of items
+#: (see :meth:`Type.load_iter() <lollipop.types.Type.load_iter>`).
+ItemError = namedtuple('ItemError', ['index', 'messages'])
+
+
+#: Cache of default error messages merged through class hierarchy
+_class_error_messages = weakref.WeakKeyDictionary()
+
+
+def _get_class_error_messages(klass):
+    """Returns default error messages of given class merged with default error
+    messages of it's base classes. Result is computed once per class and
+    should not be modified."""
+    try:
+        return _class_error_messages[klass]
+    except KeyError:
+        pass
+
+    messages = {}
+    for cls in reversed(klass.__mro__):
+        messages.update(getattr(cls, 'default_error_messages', {}))
+    _class_error_messages[klass] = messages
+    return messages
 
 
 class ErrorMessagesMixin(object):
+    __slots__ = ('_error_overrides', '__weakref__')
+
     def __init__(self, error_messages=None, *args, **kwargs):
         super(ErrorMessagesMixin, self).__init__(*args, **kwargs)
-        self._error_messages = {}
-        for cls in reversed(self.__class__.__mro__):
-            self._error_messages.update(getattr(cls, 'default_error_messages', {}))
-        self._error_messages.update(error_messages or {})
-
-    def _fail(self, key, **kwargs):
-        if key not in self._error_messages:
-            msg = MISSING_ERROR_MESSAGE.format(
-                class_name=self.__class__.__name__,
-                key=key
-            )
-            raise ValueError(msg)
+        # Instances keep only their custom messages; default messages are
+        # looked up in table shared by all instances of their class
+        self._error_overrides = dict(error_messages) if error_messages else None
+
+    def _set_error_message(self, key, message):
+        """Overrides error message for given key for this instance only."""
+        if self._error_overrides is None:
+            self._error_overrides = {}
+        self._error_overrides[key] = message
+
+    def _error_message(self, key, **kwargs):
+        """Returns error message for given key. String messages are wrapped
+        into :class:`ErrorMessage` records to be formatted later."""
+        overrides = self._error_overrides
+        if overrides is not None and key in overrides:
+            msg = overrides[key]
+        else:
+            messages = _get_class_error_messages(self.__class__)
+            if key not in messages:
+                msg = MISSING_ERROR_MESSAGE.format(
+                    class_name=self.__class__.__name__,
+                    key=key
+                )
+                raise ValueError(msg)
+            msg = messages[key]
 
-        msg = self._error_messages[key]
         if isinstance(msg, str):
-            msg = msg.format(**kwargs)
+            msg = ErrorMessage(key, msg, kwargs)
+        return msg
 
-        raise ValidationError(msg)
+    def _fail(self, key, **kwargs):
+        raise ValidationError(self._error_message(key, **kwargs))
 
 
 def merge_errors(errors1, errors2):
@@ -117,9 +235,90 @@ def merge_errors(errors1, errors2):
             return [errors1, errors2]
 
 
+def flatten_errors(errors, path=()):
+    """Iterates over error messages yielding tuples of message path and message.
+    Format of error messages is the same as accepted by :exc:`ValidationError`.
+
+    Example: ::
+
+        list(flatten_errors({'foo': {'bar': ['Error 1', 'Error 2']}}))
+        # => [(('foo', 'bar'), 'Error 1'), (('foo', 'bar'), 'Error 2')]
+
+    :param errors: Error messages.
+    :param tuple path: Path to prepend to message paths.
+    """
+    if isinstance(errors, dict):
+        for k, v in iteritems(errors):
+            for error in flatten_errors(v, path + (k,)):
+                yield error
+    elif isinstance(errors, list):
+        for v in errors:
+            for error in flatten_errors(v, path):
+                yield error
+    else:
+        yield path, errors
+
+
+def _copy_errors(errors):
+    """Copies error messages structure, so it can be modified in place."""
+    if isinstance(errors, dict):
+        return dict((k, _copy_errors(v)) for k, v in iteritems(errors))
+    elif isinstance(errors, list):
+        return list(errors)
+    return errors
+
+
+def _merge_errors_into(errors1, errors2):
+    """Same as :func:`merge_errors`, but modifies `errors1` in place when
+    possible. `errors1` should be owned by caller; `errors2` is not modified.
+    """
+    if errors1 is None:
+        return _copy_errors(errors2)
+    elif errors2 is None:
+        return errors1
+
+    if isinstance(errors1, list):
+        if not errors1:
+            return _copy_errors(errors2)
+
+        if isinstance(errors2, list):
+            errors1.extend(errors2)
+            return errors1
+        elif isinstance(errors2, dict):
+            errors = _copy_errors(errors2)
+            errors[SCHEMA] = _merge_errors_into(errors1, errors2.get(SCHEMA))
+            return errors
+        else:
+            errors1.append(errors2)
+            return errors1
+    elif isinstance(errors1, dict):
+        if isinstance(errors2, dict):
+            for k, v in iteritems(errors2):
+                if k in errors1:
+                    errors1[k] = _merge_errors_into(errors1[k], v)
+                else:
+                    errors1[k] = _copy_errors(v)
+        else:
+            errors1[SCHEMA] = _merge_errors_into(errors1.get(SCHEMA), errors2)
+        return errors1
+    else:
+        if isinstance(errors2, list):
+            return [errors1] + errors2 if errors2 else errors1
+        elif isinstance(errors2, dict):
+            errors = _copy_errors(errors2)
+            errors[SCHEMA] = _merge_errors_into(errors1, errors2.get(SCHEMA))
+            return errors
+        else:
+            return [errors1, errors2]
+
+
 class ValidationErrorBuilder(object):
     """Helper class to report multiple errors.
 
+    Errors are collected into a flat list and merged into nested error
+    messages only when :attr:`errors` are accessed (or raised), so adding
+    many errors takes linear time.
+
     Example: ::
 
         def validate_all(data):
@@ -133,15 +332,22 @@ class ValidationErrorBuilder(object):
     """
 
     def __init__(self):
-        self.errors = None
-
-    def _make_error(self, path, error):
-        parts = path.split('.', 1)
-
-        if len(parts) == 1:
-            return {path: error}
-        else:
-            return {parts[0]: self._make_error(parts[1], error)}
+        self._entries = []
+        self._errors = None
+        self._built = True
+
+    @property
+    def errors(self):
+        """Merged error messages or None if there were no errors."""
+        if not self._built:
+            errors = None
+            for path, error in self._entries:
+                for key in reversed(path):
+                    error = {key: error}
+                errors = _merge_errors_into(errors, error)
+            self._errors = errors
+            self._built = True
+        return self._errors
 
     def add_error(self, path, error):
         """Add error message for given field path.
@@ -156,7 +362,12 @@ class ValidationErrorBuilder(object):
         :param str path: '.'-separated list of field names
         :param str error: Error message
         """
-        self.errors = merge_errors(self.errors, self._make_error(path, error))
+        if isinstance(path, string_types):
+            path = tuple(path.split('.'))
+        else:
+            path = (path,)
+        self._entries.append((path, error))
+        self._built = False
 
     def add_errors(self, errors):
         """Add errors in dict format.
@@ -171,11 +382,12 @@ class ValidationErrorBuilder(object):
 
         :param str, list or dict errors: Errors to merge
         """
-        self.errors = merge_errors(self.errors, errors)
+        self._entries.append(((), errors))
+        self._built = False
 
     def raise_errors(self):
         """Raise :exc:`ValidationError` if errors are not empty;
         do nothing otherwise.
         """
-        if self.errors:
+        if self._entries and self.errors:
             raise ValidationError(self.errors)
@@ -0,0 +1,452 @@
+"""Profiling hooks for loading and dumping.
+
+Installed hooks are called around every :meth:`Type.load()
+<lollipop.types.Type.load>` and :meth:`Type.dump()
+<lollipop.types.Type.dump>`, :meth:`Field.load()
+<lollipop.types.Field.load>` and :meth:`Field.dump()
+<lollipop.types.Field.dump>` and every validator call: ::
+
+    def on_exit(node, path, direction, elapsed_ns, error):
+        if elapsed_ns > 1000000:
+            log.warning('%s at %s took %dns', node, format_path(path),
+                        elapsed_ns)
+
+    with hooks(on_exit=on_exit):
+        BookType.load(data)
+
+Hook arguments are:
+
+* `node` - :class:`~lollipop.types.Type`, :class:`~lollipop.types.Field` or
+  validator being called;
+* `path` - tuple of field names from the outermost loaded (or dumped) type.
+  Items of lists and tuples are denoted with '[]' and values of dicts with
+  '{}', so that calls for all items are reported under the same path;
+* `direction` - 'load', 'dump' or 'validate';
+* `elapsed_ns` - call duration in nanoseconds (`on_exit` only);
+* `error` - exception raised by call or None (`on_exit` only).
+
+Installing the first hook replaces `load()` and `dump()` methods of all
+:class:`~lollipop.types.Type` and :class:`~lollipop.types.Field` classes
+(including custom subclasses defined by then) with instrumented versions;
+removing the last hook restores original methods. So when no hooks are
+installed, there is no overhead at all.
+
+Compiled types (see :mod:`lollipop.compiler`) are reported as a single node.
+
+:class:`Profiler` is a built-in hook which aggregates time spent per path: ::
+
+    with Profiler() as profiler:
+        BookType.load(data)
+    print(profiler.report())
+"""
+from lollipop.types import Type, Field, List, Tuple, Dict, \
+    _error_limit
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+import collections
+import contextlib
+import functools
+import threading
+import time
+
+
+__all__ = [
+    'install',
+    'uninstall',
+    'hooks',
+    'format_path',
+    'Profiler',
+]
+
+
+try:
+    _clock_ns = time.perf_counter_ns
+except AttributeError:  # Python < 3.7
+    _clock = getattr(time, 'perf_counter', time.time)
+
+    def _clock_ns():
+        return int(_clock() * 1e9)
+
+
+#: Path segment for items of lists and tuples
+ITEMS = '[]'
+#: Path segment for values of dicts
+VALUES = '{}'
+
+
+class _Hook(object):
+    __slots__ = ('on_enter', 'on_exit')
+
+    def __init__(self, on_enter=None, on_exit=None):
+        self.on_enter = on_enter
+        self.on_exit = on_exit
+
+
+#: Installed hooks
+_hooks = ()
+_hooks_lock = threading.RLock()
+#: Original methods of instrumented classes: list of (class, name, function)
+_originals = []
+
+
+class _State(threading.local):
+    def __init__(self):
+        #: Current path
+        self.path = []
+        #: Stack of nodes being called as tuples of node and direction
+        self.calls = []
+
+
+_state = _State()
+
+
+def _call(node, direction, func, args, kwargs, segment=None):
+    """Calls function reporting it to hooks. If segment is given, it is
+    added to path of nested calls."""
+    state = _state
+    path = tuple(state.path)
+    hooks = _hooks
+    for hook in hooks:
+        if hook.on_enter is not None:
+            hook.on_enter(node, path, direction)
+
+    state.calls.append((node, direction))
+    if segment is not None:
+        state.path.append(segment)
+    error = None
+    start = _clock_ns()
+    try:
+        return func(*args, **kwargs)
+    except BaseException as e:
+        error = e
+        raise
+    finally:
+        elapsed = _clock_ns() - start
+        if segment is not None:
+            state.path.pop()
+        state.calls.pop()
+        for hook in hooks:
+            if hook.on_exit is not None:
+                hook.on_exit(node, path, direction, elapsed, error)
+
+
+def _is_super_call(node, direction):
+    """Returns True if node method is called from the same method of
+    node subclass."""
+    calls = _state.calls
+    return bool(calls) and calls[-1][0] is node and calls[-1][1] == direction
+
+
+def _items_segment(type):
+    if isinstance(type, (List, Tuple)):
+        return ITEMS
+    elif isinstance(type, Dict):
+        return VALUES
+    return None
+
+
+def _instrument_type_method(func, direction):
+    @functools.wraps(func)
+    def method(self, *args, **kwargs):
+        if _is_super_call(self, direction):
+            return func(self, *args, **kwargs)
+        return _call(self, direction, func, (self,) + args, kwargs,
+                     _items_segment(self))
+    return method
+
+
+def _instrument_field_method(func, direction):
+    @functools.wraps(func)
+    def method(self, name, *args, **kwargs):
+        if _is_super_call(self, direction):
+            return func(self, name, *args, **kwargs)
+
+        _state.path.append(name)
+        try:
+            return _call(self, direction, func, (self, name) + args, kwargs)
+        finally:
+            _state.path.pop()
+    return method
+
+
+def _run_validators(type, data, context):
+    path = _state.path
+    segment = None
+    if _is_super_call(type, 'load') and _items_segment(type) is not None:
+        # Validators of lists and dicts are reported at their own path
+        segment = path.pop()
+
+    errors_builder = ValidationErrorBuilder()
+    try:
+        for validator, with_context in type._validator_plans:
+            try:
+                _call(validator, 'validate', validator,
+                      (data, context) if with_context else (data,), {})
+            except ValidationError as ve:
+                errors_builder.add_errors(ve.raw_messages)
+    finally:
+        if segment is not None:
+            path.append(segment)
+    errors_builder.raise_errors()
+    return data
+
+
+def _instrument_base_load(func):
+    """Instruments :meth:`Type.load` so that each validator is reported."""
+    @functools.wraps(func)
+    def load(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or \
+                not self._validator_plans:
+            run, args = func, (self, data, context, fail_fast, max_errors)
+        else:
+            run, args = _run_validators, (self, data, context)
+
+        if _is_super_call(self, 'load'):
+            return run(*args)
+        return _call(self, 'load', run, args, {})
+    return load
+
+
+def _subclasses(klass):
+    result = [klass]
+    for subclass in klass.__subclasses__():
+        for item in _subclasses(subclass):
+            if item not in result:
+                result.append(item)
+    return result
+
+
+def _instrument():
+    for klass, instrument_method in [(Type, _instrument_type_method),
+                                     (Field, _instrument_field_method)]:
+        for subclass in _subclasses(klass):
+            for direction in ['load', 'dump']:
+                func = vars(subclass).get(direction)
+                if func is None:
+                    continue
+                if subclass is Type and direction == 'load':
+                    method = _instrument_base_load(func)
+                else:
+                    method = instrument_method(func, direction)
+                method._original_method = func
+                setattr(subclass, direction, method)
+                _originals.append((subclass, direction, func))
+
+
+def _restore():
+    while _originals:
+        klass, name, func = _originals.pop()
+        setattr(klass, name, func)
+
+
+def install(on_enter=None, on_exit=None):
+    """Installs profiling hooks. Returns a handle to pass to
+    :func:`uninstall`.
+
+    :param callable on_enter: Function called before each call with node,
+        path and direction.
+    :param callable on_exit: Function called after each call with node,
+        path, direction, elapsed time in nanoseconds and raised exception
+        (or None).
+    """
+    global _hooks
+    hook = _Hook(on_enter, on_exit)
+    with _hooks_lock:
+        if not _hooks:
+            _instrument()
+        _hooks = _hooks + (hook,)
+    return hook
+
+
+def uninstall(hook):
+    """Removes hooks installed with :func:`install`.
+
+    :param hook: Handle returned by :func:`install`.
+    """
+    global _hooks
+    with _hooks_lock:
+        if hook not in _hooks:
+            return
+        _hooks = tuple(h for h in _hooks if h is not hook)
+        if not _hooks:
+            _restore()
+
+
+@contextlib.contextmanager
+def hooks(on_enter=None, on_exit=None):
+    """Context manager which installs profiling hooks for the duration of
+    `with` block (see :func:`install`)."""
+    hook = install(on_enter, on_exit)
+    try:
+        yield hook
+    finally:
+        uninstall(hook)
+
+
+def format_path(path):
+    """Formats path reported to hooks as a string, e.g. 'books[].title'.
+
+    :param tuple path: Path.
+    """
+    result = ''
+    for segment in path:
+        if segment in (ITEMS, VALUES):
+            result += segment
+        else:
+            result += ('.' if result else '') + str(segment)
+    return result
+
+
+def _node_name(node):
+    validator = getattr(node, 'validator', node)  # Coroutine validator calls
+    if isinstance(validator, (Type, Field)):
+        return validator.__class__.__name__
+    return getattr(validator, '__name__', None) or \
+        validator.__class__.__name__
+
+
+class PathStats(object):
+    """Aggregated calls of a single path collected by :class:`Profiler`.
+
+    :ivar list nodes: Names of called nodes (types, fields and validators).
+    :ivar int calls: Number of calls of the outermost node.
+    :ivar int errors: Number of calls which raised exceptions.
+    :ivar int total_ns: Total time in nanoseconds.
+    :ivar int self_ns: Time in nanoseconds excluding nested paths.
+    """
+
+    __slots__ = ('nodes', 'calls', 'errors', 'total_ns', 'self_ns')
+
+    def __init__(self):
+        self.nodes = []
+        self.calls = 0
+        self.errors = 0
+        self.total_ns = 0
+        self.self_ns = 0
+
+    def __repr__(self):
+        return '<PathStats calls={calls} total_ns={total_ns} ' \
+            'self_ns={self_ns}>'.format(calls=self.calls,
+                                        total_ns=self.total_ns,
+                                        self_ns=self.self_ns)
+
+
+class Profiler(object):
+    """Hook which aggregates calls by direction and path. Nested calls on
+    the same path (e.g. field, it's type and validators) are aggregated
+    into a single entry.
+
+    Example: ::
+
+        with Profiler() as profiler:
+            for data in requests:
+                RequestType.load(data)
+        print(profiler.report())
+
+    :ivar dict stats: Mapping of tuples of direction and path to
+        :class:`PathStats`.
+    """
+
+    def __init__(self):
+        self.stats = collections.OrderedDict()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._hook = None
+
+    def _stack(self):
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def on_enter(self, node, path, direction):
+        # Entry is a list of path and time spent in nested paths
+        self._stack().append([path, 0])
+
+    def on_exit(self, node, path, direction, elapsed_ns, error):
+        stack = self._stack()
+        _, nested_ns = stack.pop()
+        parent = stack[-1] if stack else None
+        if direction == 'validate':
+            # Validators are accounted as part of loading
+            direction = 'load'
+
+        if parent is not None and parent[0] == path:
+            # Inner node of the same path: it's time is accounted by parent
+            parent[1] += nested_ns
+            self._add_node(direction, path, node)
+            return
+
+        if parent is not None:
+            parent[1] += elapsed_ns
+
+        key = (direction, path)
+        with self._lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = PathStats()
+            stats.calls += 1
+            stats.errors += error is not None
+            stats.total_ns += elapsed_ns
+            stats.self_ns += elapsed_ns - nested_ns
+        self._add_node(direction, path, node, outer=True)
+
+    def _add_node(self, direction, path, node, outer=False):
+        # Inner nodes exit before outer ones, so outer node is put first
+        with self._lock:
+            stats = self.stats.get((direction, path))
+            if stats is None:
+                stats = self.stats[(direction, path)] = PathStats()
+            name = _node_name(node)
+            if name in stats.nodes:
+                return
+            if outer:
+                stats.nodes.insert(0, name)
+            else:
+                stats.nodes.append(name)
+
+    def start(self):
+        """Starts collecting stats."""
+        if self._hook is None:
+            self._hook = install(self.on_enter, self.on_exit)
+        return self
+
+    def stop(self):
+        """Stops collecting stats."""
+        if self._hook is not None:
+            uninstall(self._hook)
+            self._hook = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def reset(self):
+        """Clears collected stats."""
+        with self._lock:
+            self.stats.clear()
+
+    def report(self):
+        """Returns collected stats formatted as a tree of paths with
+        number of calls, total and self time in milliseconds and number
+        of errors."""
+        lines = ['%-48s %8s %10s %10s %7s' % (
+            'path', 'calls', 'total ms', 'self ms', 'errors',
+        )]
+        with self._lock:
+            items = sorted(
+                self.stats.items(),
+                key=lambda item: (item[0][0], tuple(map(str, item[0][1]))),
+            )
+        for (direction, path), stats in items:
+            if path:
+                name = '  ' * len(path) + format_path(path[-1:])
+            else:
+                name = direction
+            name += ' (%s)' % ', '.join(stats.nodes)
+            lines.append('%-48s %8d %10.3f %10.3f %7d' % (
+                name, stats.calls, stats.total_ns / 1e6, stats.self_ns / 1e6,
+                stats.errors,
+            ))
+        return '\n'.join(lines)
@@ -0,0 +1,201 @@
+"""Fast ISO 8601 (RFC 3339) parsing and formatting.
+
+Used by :class:`~lollipop.types.DateTime`, :class:`~lollipop.types.Date` and
+:class:`~lollipop.types.Time` for their predefined ISO formats instead of
+:func:`~datetime.datetime.strptime` and :meth:`~datetime.datetime.strftime`,
+which are much slower.
+
+Parsers accept only strict (zero padded) representations and return None for
+anything else, so that caller can fall back to strptime. Formatters return
+None for values they do not handle (e.g. years before 1000 or subclasses of
+datetime types) for the same reason.
+"""
+import datetime
+import re
+
+
+__all__ = [
+    'parse_datetime',
+    'parse_date',
+    'parse_time',
+    'format_datetime',
+    'format_date',
+    'format_time',
+    'tzoffset',
+]
+
+
+_DATETIME_RE = re.compile(
+    r'([0-9]{4})-([0-9]{2})-([0-9]{2})T([0-9]{2}):([0-9]{2}):([0-9]{2})'
+    r'(?:\.([0-9]{1,6}))?(Z|UTC|GMT|[+-][0-9]{2}:?[0-9]{2})?\Z'
+)
+_DATE_RE = re.compile(r'([0-9]{4})-([0-9]{2})-([0-9]{2})\Z')
+_TIME_RE = re.compile(r'([0-9]{2}):([0-9]{2}):([0-9]{2})\Z')
+
+
+try:
+    _timezone = datetime.timezone
+except AttributeError:  # Python 2
+    _timezone = None
+
+
+class _FixedOffset(datetime.tzinfo):
+    """Fixed offset from UTC for Pythons without :class:`datetime.timezone`."""
+
+    def __init__(self, offset):
+        self._offset = offset
+
+    def utcoffset(self, dt):
+        return self._offset
+
+    def dst(self, dt):
+        return datetime.timedelta(0)
+
+    def tzname(self, dt):
+        minutes = self._offset.days * 1440 + self._offset.seconds // 60
+        sign = '-' if minutes < 0 else '+'
+        return 'UTC%s%02d:%02d' % ((sign,) + divmod(abs(minutes), 60))
+
+    def __repr__(self):
+        return '<%s %s>' % (self.__class__.__name__, self.tzname(None))
+
+
+#: Cached tzinfo objects by offset in minutes
+_tzinfos = {}
+
+
+def tzoffset(minutes):
+    """Returns (cached) tzinfo for given fixed offset from UTC.
+
+    :param int minutes: Offset from UTC in minutes.
+    """
+    try:
+        return _tzinfos[minutes]
+    except KeyError:
+        pass
+
+    offset = datetime.timedelta(minutes=minutes)
+    if _timezone is None:
+        tzinfo = _FixedOffset(offset)
+    elif minutes == 0:
+        tzinfo = _timezone.utc
+    else:
+        tzinfo = _timezone(offset)
+    _tzinfos[minutes] = tzinfo
+    return tzinfo
+
+
+#: Cached tzinfo objects by offset designator (e.g. '+02:00')
+_designators = {'Z': tzoffset(0), 'UTC': None, 'GMT': None}
+
+
+def _parse_tzinfo(designator):
+    try:
+        return _designators[designator]
+    except KeyError:
+        pass
+
+    hours, minutes = int(designator[1:3]), int(designator[-2:])
+    if hours > 23 or minutes > 59:
+        raise ValueError('Invalid UTC offset: %s' % designator)
+
+    offset = hours * 60 + minutes
+    tzinfo = _designators[designator] = \
+        tzoffset(-offset if designator[0] == '-' else offset)
+    return tzinfo
+
+
+def parse_datetime(value):
+    """Parses date and time in 'YYYY-MM-DDTHH:MM:SS[.ffffff][TZ]' format,
+    where TZ is 'Z', UTC offset (e.g. '+02:00' or '+0200') or one of 'UTC' and
+    'GMT' names (which give naive datetime, same as strptime's '%Z').
+    Returns None if value does not match the format.
+    Raises :exc:`ValueError` if value matches, but is not a valid datetime.
+
+    :param str value: String to parse.
+    """
+    match = _DATETIME_RE.match(value)
+    if match is None:
+        return None
+
+    year, month, day, hour, minute, second, fraction, designator = \
+        match.groups()
+    return datetime.datetime(
+        int(year), int(month), int(day), int(hour), int(minute), int(second),
+        int(fraction.ljust(6, '0')) if fraction else 0,
+        _parse_tzinfo(designator) if designator else None,
+    )
+
+
+def parse_date(value):
+    """Parses date in 'YYYY-MM-DD' format. Returns None if value does not
+    match the format.
+    Raises :exc:`ValueError` if value matches, but is not a valid date.
+
+    :param str value: String to parse.
+    """
+    match = _DATE_RE.match(value)
+    if match is None:
+        return None
+
+    year, month, day = match.groups()
+    return datetime.date(int(year), int(month), int(day))
+
+
+def parse_time(value):
+    """Parses time in 'HH:MM:SS' format. Returns None if value does not
+    match the format.
+    Raises :exc:`ValueError` if value matches, but is not a valid time.
+
+    :param str value: String to parse.
+    """
+    match = _TIME_RE.match(value)
+    if match is None:
+        return None
+
+    hour, minute, second = match.groups()
+    return datetime.time(int(hour), int(minute), int(second))
+
+
+def format_datetime(value):
+    """Formats datetime as 'YYYY-MM-DDTHH:MM:SS' followed by timezone name of
+    timezone aware values (e.g. 'UTC'), exactly as strftime does with
+    '%Y-%m-%dT%H:%M:%S%Z' format. Fractions of seconds are dropped. Returns
+    None if value is not a :class:`datetime.datetime` (subclasses are not
+    handled either) or is before year 1000.
+
+    :param datetime.datetime value: Value to format.
+    """
+    if value.__class__ is not datetime.datetime or value.year < 1000:
+        return None
+
+    result = '%04d-%02d-%02dT%02d:%02d:%02d' % (
+        value.year, value.month, value.day,
+        value.hour, value.minute, value.second,
+    )
+    if value.tzinfo is None:
+        return result
+    return result + (value.tzname() or '')
+
+
+def format_date(value):
+    """Formats date as 'YYYY-MM-DD'. Returns None if value is not a
+    :class:`datetime.date` (subclasses, including datetimes, are not handled
+    either) or is before year 1000.
+
+    :param datetime.date value: Value to format.
+    """
+    if value.__class__ is not datetime.date or value.year < 1000:
+        return None
+    return '%04d-%02d-%02d' % (value.year, value.month, value.day)
+
+
+def format_time(value):
+    """Formats time as 'HH:MM:SS'. Fractions of seconds and timezone are
+    dropped. Returns None if value is not a :class:`datetime.time`.
+
+    :param datetime.time value: Value to format.
+    """
+    if value.__class__ is not datetime.time:
+        return None
+    return '%02d:%02d:%02d' % (value.hour, value.minute, value.second)
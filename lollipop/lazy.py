@@ -0,0 +1,347 @@
+"""Lazy loading of large documents.
+
+Loading with `lazy=True` argument of :meth:`Object.load()
+<lollipop.types.Object.load>`, :meth:`List.load() <lollipop.types.List.load>`
+and :meth:`Dict.load() <lollipop.types.Dict.load>` returns a read-only view
+over raw data instead of loaded value: ::
+
+    request = RequestType.load(data, lazy=True)
+    if request['user']['role'] == 'admin':
+        ...
+
+Objects and dicts are viewed as mappings (:class:`LazyObject` and
+:class:`LazyDict`), lists - as sequences (:class:`LazyList`). Each field, key
+or item is loaded on first access and the result (or validation error) is
+memoized. Nested objects, dicts and lists are loaded as views too, so that
+accessing a single deeply nested field loads only values on the way to it.
+
+Accessing an invalid value raises :exc:`~lollipop.errors.ValidationError` with
+messages nested under the value path, the same as they appear in errors of
+eager loading. Checks which need the whole value (validators of objects, lists
+and dicts, unknown fields of objects) and object constructors run only when
+view is materialized with :meth:`~LazyObject.materialize` (which returns the
+same value as eager loading) or validated with :meth:`~LazyObject.errors`.
+
+Types with custom `load()` methods are loaded eagerly on access.
+"""
+from lollipop.types import MISSING, Type, List, Dict, Field, AttributeField, \
+    Object, Optional, LoadOnly
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+from lollipop.compiler import CompiledType
+from lollipop.utils import is_list, is_dict, _function
+
+try:
+    from collections.abc import Mapping, Sequence
+except ImportError:  # Python 2
+    from collections import Mapping, Sequence
+
+
+__all__ = [
+    'LazyObject',
+    'LazyList',
+    'LazyDict',
+    'load_lazy',
+]
+
+
+def _nest(path, messages):
+    for key in reversed(path):
+        messages = {key: messages}
+    return messages
+
+
+class _LazyView(object):
+    """Base class of lazy views. Subclasses define :meth:`_load_item`
+    and :meth:`_materialize`."""
+
+    __slots__ = ('_type', '_data', '_context', '_path', '_values', '_errors',
+                 '_result', '__weakref__')
+
+    def __init__(self, type, data, context=None, path=()):
+        self._type = type
+        self._data = data
+        self._context = context
+        self._path = path
+        self._values = {}
+        self._errors = {}
+        self._result = MISSING
+
+    def _get(self, key):
+        """Returns memoized loaded value for given key. Raises
+        :exc:`~lollipop.errors.ValidationError` with messages relative to
+        the value."""
+        try:
+            return self._values[key]
+        except KeyError:
+            pass
+
+        errors = self._errors.get(key)
+        if errors is None:
+            try:
+                value = self._values[key] = self._load_item(key)
+                return value
+            except ValidationError as ve:
+                errors = self._errors[key] = ve.raw_messages
+        raise ValidationError(errors)
+
+    def _access(self, key):
+        """Returns loaded value for given key. Raises
+        :exc:`~lollipop.errors.ValidationError` with messages nested under
+        the value path."""
+        try:
+            return self._get(key)
+        except ValidationError as ve:
+            errors = ve.raw_messages
+        raise ValidationError(_nest(self._path + (key,), errors))
+
+    def _get_materialized(self, key):
+        value = self._get(key)
+        if isinstance(value, _LazyView):
+            return value._materialize_once()
+        return value
+
+    def _materialize_once(self):
+        """Materializes view raising errors relative to the view."""
+        if self._result is MISSING:
+            self._result = self._materialize()
+        return self._result
+
+    def materialize(self):
+        """Loads and validates all remaining values and returns the same
+        value as eager loading would. Raises
+        :exc:`~lollipop.errors.ValidationError` if data is invalid.
+        Result is memoized."""
+        try:
+            return self._materialize_once()
+        except ValidationError as ve:
+            errors = ve.raw_messages
+        raise ValidationError(_nest(self._path, errors))
+
+    def errors(self):
+        """Validates the whole view (see :meth:`materialize`) and returns
+        validation errors or empty dict."""
+        try:
+            self.materialize()
+            return {}
+        except ValidationError as ve:
+            return ve.messages
+
+    def is_valid(self):
+        """Returns True if the whole view is valid, False - otherwise."""
+        return not self.errors()
+
+    def __repr__(self):
+        return '<{klass} {path}>'.format(
+            klass=self.__class__.__name__,
+            path='.'.join(str(key) for key in self._path) or '(root)',
+        )
+
+
+class LazyObject(_LazyView, Mapping):
+    """Lazy view of data loaded with :class:`~lollipop.types.Object` type.
+    Maps field names to loaded field values; fields which loaded to
+    :data:`~lollipop.types.MISSING` are absent. Iterating over view loads
+    all fields (nested objects and lists stay lazy).
+
+    :param Object type: Object type.
+    :param data: Raw data.
+    :param context: Context data.
+    :param tuple path: Path of data in the whole loaded document.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, type, data, context=None, path=()):
+        if data is MISSING or data is None:
+            type._fail('required')
+
+        if not is_dict(data):
+            type._fail('invalid')
+
+        super(LazyObject, self).__init__(type, data, context, path)
+
+    def _load_item(self, name):
+        field = self._type.fields[name]
+        field_load = _function(field.__class__.load)
+        if field_load is _function(Field.load):
+            return MISSING
+        elif field_load is _function(AttributeField.load):
+            return _load(field.field_type, self._data.get(name, MISSING),
+                         self._context, self._path + (name,))
+        return field.load(name, self._data, self._context)
+
+    def __getitem__(self, name):
+        if name not in self._type.fields:
+            raise KeyError(name)
+        value = self._access(name)
+        if value is MISSING:
+            raise KeyError(name)
+        return value
+
+    def __iter__(self):
+        for name in self._type.fields:
+            if self._access(name) is not MISSING:
+                yield name
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def _materialize(self):
+        type = self._type
+        errors_builder = ValidationErrorBuilder()
+        result = {}
+        for name in type.fields:
+            try:
+                value = self._get_materialized(name)
+                if value is not MISSING:
+                    result[name] = value
+            except ValidationError as ve:
+                errors_builder.add_error(name, ve.raw_messages)
+
+        if not type.allow_extra_fields:
+            for name in self._data:
+                if name not in type.fields:
+                    errors_builder.add_error(name, type._error_message('unknown'))
+
+        errors_builder.raise_errors()
+        return type._construct(Type.load(type, result, self._context))
+
+
+class LazyList(_LazyView, Sequence):
+    """Lazy view of data loaded with :class:`~lollipop.types.List` type.
+    Length of the view is the length of raw data.
+
+    :param List type: List type.
+    :param data: Raw data.
+    :param context: Context data.
+    :param tuple path: Path of data in the whole loaded document.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, type, data, context=None, path=()):
+        if data is MISSING or data is None:
+            type._fail('required')
+
+        if not is_list(data):
+            type._fail('invalid')
+
+        super(LazyList, self).__init__(type, data, context, path)
+
+    def _load_item(self, idx):
+        return _load(self._type.item_type, self._data[idx],
+                     self._context, self._path + (idx,))
+
+    def __getitem__(self, idx):
+        if isinstance(idx, slice):
+            return [self[i] for i in range(*idx.indices(len(self._data)))]
+
+        if idx < 0:
+            idx += len(self._data)
+        if not 0 <= idx < len(self._data):
+            raise IndexError('list index out of range')
+        return self._access(idx)
+
+    def __len__(self):
+        return len(self._data)
+
+    def _materialize(self):
+        errors_builder = ValidationErrorBuilder()
+        items = []
+        for idx in range(len(self._data)):
+            try:
+                items.append(self._get_materialized(idx))
+            except ValidationError as ve:
+                errors_builder.add_errors({idx: ve.raw_messages})
+        errors_builder.raise_errors()
+        return Type.load(self._type, items, self._context)
+
+
+class LazyDict(_LazyView, Mapping):
+    """Lazy view of data loaded with :class:`~lollipop.types.Dict` type.
+    Keys without value type are absent.
+
+    :param Dict type: Dict type.
+    :param data: Raw data.
+    :param context: Context data.
+    :param tuple path: Path of data in the whole loaded document.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, type, data, context=None, path=()):
+        if data is MISSING or data is None:
+            type._fail('required')
+
+        if not is_dict(data):
+            type._fail('invalid')
+
+        super(LazyDict, self).__init__(type, data, context, path)
+
+    def _load_item(self, key):
+        return _load(self._type.value_types.get(key), self._data[key],
+                     self._context, self._path + (key,))
+
+    def __getitem__(self, key):
+        if key not in self._data or self._type.value_types.get(key) is None:
+            raise KeyError(key)
+        return self._access(key)
+
+    def __iter__(self):
+        value_types = self._type.value_types
+        for key in self._data:
+            if value_types.get(key) is not None:
+                yield key
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def _materialize(self):
+        errors_builder = ValidationErrorBuilder()
+        result = {}
+        for key in self:
+            try:
+                result[key] = self._get_materialized(key)
+            except ValidationError as ve:
+                errors_builder.add_error(key, ve.raw_messages)
+        errors_builder.raise_errors()
+        return Type.load(self._type, result, self._context)
+
+
+#: Lazy view classes by type class load method
+_VIEWS = {
+    _function(Object.load): LazyObject,
+    _function(List.load): LazyList,
+    _function(Dict.load): LazyDict,
+}
+
+
+def _load(type, data, context=None, path=()):
+    """Loads data with given type returning lazy views for objects, lists
+    and dicts."""
+    if isinstance(type, CompiledType):
+        type = type.inner_type
+
+    type_load = _function(type.__class__.load)
+    view_class = _VIEWS.get(type_load)
+    if view_class is not None:
+        return view_class(type, data, context, path)
+    elif type_load is _function(Optional.load) and not type._validator_plans:
+        if data is MISSING or data is None:
+            return type.load_default
+        return _load(type.inner_type, data, context, path)
+    elif type_load is _function(LoadOnly.load):
+        return _load(type.inner_type, data, context, path)
+    return type.load(data, context)
+
+
+def load_lazy(type, data, context=None):
+    """Loads data with given type lazily (see :mod:`lollipop.lazy`).
+    Returns a lazy view for objects, lists and dicts; other types are
+    loaded eagerly.
+
+    :param Type type: Type to load data with.
+    :param data: Data to deserialize.
+    :param context: Context data.
+    """
+    return _load(type, data, context)
@@ -0,0 +1,199 @@
+"""Parallel loading and dumping of large lists.
+
+Items of a :class:`~lollipop.types.List` are split into chunks which are
+processed by a pool of worker processes. Item type is pickled once per call.
+Pools started for a single call get item type installed in each worker process
+on start. With executors passed by caller, type is sent only with the first chunk
+for each worker; other chunks carry just a token of the type, which workers
+look up in their cache of unpickled types (chunks that reach a worker without
+cached type are resubmitted together with the type).
+Results and errors are merged back in original order, so results, error
+messages and error codes are the same as with sequential processing.
+
+Usually used through `parallel` argument of
+:meth:`List.load() <lollipop.types.List.load>` and
+:meth:`List.dump() <lollipop.types.List.dump>`: ::
+
+    with ProcessPoolExecutor() as executor:
+        items = List(ItemType).load(data, parallel=executor)
+
+    items = List(ItemType).load(data, parallel=4)  # pool of 4 processes
+
+Item type (including it's validators and constructors) and context should be
+picklable.
+"""
+from lollipop.types import Type
+from lollipop.errors import ValidationError
+import hashlib
+import multiprocessing
+import pickle
+
+try:
+    from concurrent.futures import Executor, ProcessPoolExecutor
+except ImportError:  # Python 2 without futures package
+    Executor = ProcessPoolExecutor = None
+
+
+__all__ = [
+    'default_chunk_size',
+    'dump_list',
+    'load_list',
+]
+
+
+#: Minimal number of items in a chunk, so that scheduling overhead
+#: does not outweigh processing time
+MIN_CHUNK_SIZE = 256
+#: Number of chunks per worker to balance load between workers
+CHUNKS_PER_WORKER = 4
+
+#: Worker side cache of unpickled item types by token
+_worker_types = {}
+_WORKER_TYPES_LIMIT = 16
+
+
+def _pickle_type(type):
+    """Returns tuple of token and pickled type. Type is pickled on every call,
+    as it could be modified since previous one; token is a digest of pickled
+    data, so workers reuse cached type as long as it stays the same."""
+    try:
+        data = pickle.dumps(type, pickle.HIGHEST_PROTOCOL)
+    except Exception as e:
+        raise ValueError('Parallel processing requires picklable type: %s' % e)
+
+    return hashlib.sha1(data).hexdigest(), data
+
+
+def _install_type(token, pickled_type):
+    """Worker function: unpickles item type into worker cache.
+    Returns item type."""
+    if len(_worker_types) >= _WORKER_TYPES_LIMIT:
+        _worker_types.clear()
+    type = _worker_types[token] = pickle.loads(pickled_type)
+    return type
+
+
+def _process_chunk(token, pickled_type, direction, items, context):
+    """Worker function: loads or dumps chunk of items with item type.
+    Returns None if type is not cached and was not sent. Errors are returned
+    as they were raised, so that parent process gets error codes as well."""
+    type = _worker_types.get(token)
+    if type is None:
+        if pickled_type is None:
+            return None
+        type = _install_type(token, pickled_type)
+
+    if direction == 'load':
+        return type._load_many(items, context)
+    return type._dump_many(items, context)
+
+
+def _worker_count(executor):
+    return getattr(executor, '_max_workers', None) or \
+        multiprocessing.cpu_count()
+
+
+def default_chunk_size(items_count, workers):
+    """Returns number of items per chunk for given number of items and
+    workers: several chunks per worker, but not less than
+    :data:`MIN_CHUNK_SIZE` items.
+
+    :param int items_count: Total number of items.
+    :param int workers: Number of workers.
+    """
+    return max(MIN_CHUNK_SIZE, -(-items_count // (workers * CHUNKS_PER_WORKER)))
+
+
+def _start_pool(processes, token, pickled_type):
+    """Starts pool of worker processes with item type installed in each of
+    them. Returns tuple of executor and flag whether type is installed."""
+    try:
+        return ProcessPoolExecutor(max_workers=processes,
+                                   initializer=_install_type,
+                                   initargs=(token, pickled_type)), True
+    except TypeError:  # Python < 3.7
+        return ProcessPoolExecutor(max_workers=processes), False
+
+
+def _process(list_type, direction, items, parallel, context, size):
+    token, pickled_type = _pickle_type(list_type.item_type)
+    if isinstance(parallel, int) and not isinstance(parallel, bool):
+        if ProcessPoolExecutor is None:
+            raise ImportError('Parallel processing requires concurrent.futures')
+        executor, installed = _start_pool(parallel, token, pickled_type)
+        with executor:
+            return _process_chunks(executor, installed, token, pickled_type,
+                                   direction, items, context, size)
+
+    if Executor is not None and not isinstance(parallel, Executor):
+        raise ValueError('parallel should be an Executor or number of processes')
+
+    return _process_chunks(parallel, False, token, pickled_type,
+                           direction, items, context, size)
+
+
+def _process_chunks(executor, installed, token, pickled_type,
+                    direction, items, context, size):
+    workers = _worker_count(executor)
+    size = size or default_chunk_size(len(items), workers)
+    chunks = [items[start:start + size] for start in range(0, len(items), size)]
+    futures = [
+        executor.submit(_process_chunk, token,
+                        pickled_type if idx < workers and not installed
+                        else None,
+                        direction, chunk, context)
+        for idx, chunk in enumerate(chunks)
+    ]
+
+    for idx, (chunk, future) in enumerate(zip(chunks, futures)):
+        if future.result() is None:
+            # Chunk got to a worker which has not received item type yet:
+            # resubmit it with the type without waiting for it
+            futures[idx] = executor.submit(_process_chunk, token, pickled_type,
+                                           direction, chunk, context)
+
+    results = []
+    errors = {}
+    for future in futures:
+        chunk_results, chunk_errors = future.result()
+        offset = len(results)
+        for idx, messages in chunk_errors.items():
+            errors[offset + idx] = messages
+        results.extend(chunk_results)
+
+    if errors:
+        raise ValidationError(errors)
+    return results
+
+
+def load_list(list_type, data, parallel, context=None, chunk_size=None):
+    """Loads list items in parallel. Returns the same result as
+    :meth:`List.load() <lollipop.types.List.load>`.
+
+    :param List list_type: List type.
+    :param list data: Data to deserialize.
+    :param parallel: :class:`concurrent.futures.Executor` to use or
+        number of processes to start.
+    :param context: Context data.
+    :param int chunk_size: Number of items per chunk. By default is computed
+        from number of items and workers.
+    """
+    items = _process(list_type, 'load', data, parallel, context, chunk_size)
+    # Run validators of the list itself
+    return Type.load(list_type, items, context)
+
+
+def dump_list(list_type, value, parallel, context=None, chunk_size=None):
+    """Dumps list items in parallel. Returns the same result as
+    :meth:`List.dump() <lollipop.types.List.dump>`.
+
+    :param List list_type: List type.
+    :param list value: Value to serialize.
+    :param parallel: :class:`concurrent.futures.Executor` to use or
+        number of processes to start.
+    :param context: Context data.
+    :param int chunk_size: Number of items per chunk. By default is computed
+        from number of items and workers.
+    """
+    items = _process(list_type, 'dump', value, parallel, context, chunk_size)
+    return Type.dump(list_type, items, context)
@@ -0,0 +1,275 @@
+"""Incremental loading of large JSON documents.
+
+Parses JSON document from a file object piece by piece and loads items of one
+(possibly huge) array as soon as each of them is parsed, so that memory usage is
+bounded by the size of a single item rather than the whole document. The rest of
+the document ("envelope") is loaded with regular :class:`~lollipop.types.Object`
+fields.
+
+Example: ::
+
+    # {"meta": {"source": "export"}, "items": [{...}, {...}, ...]}
+    ExportType = Object({
+        'meta': Object({'source': String()}),
+        'items': List(ItemType),
+    })
+
+    with open('export.json') as f:
+        envelope = ExportType.load_stream(f, 'items', on_item=save_item)
+    # => {'meta': {'source': 'export'}}
+"""
+from lollipop.types import MISSING, List, Object, AttributeField
+from lollipop.errors import ValidationError, ValidationErrorBuilder
+from lollipop.compat import string_types, iteritems
+import codecs
+import json
+
+
+__all__ = [
+    'load_stream',
+]
+
+
+WHITESPACE = ' \t\n\r'
+
+
+#: Characters which can continue a number
+_NUMBER_CHARS = frozenset('0123456789.eE+-')
+
+
+def _is_number(value):
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class _JSONReader(object):
+    """Reads JSON values from file object incrementally."""
+
+    def __init__(self, fp, chunk_size):
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+        self._decoder = json.JSONDecoder()
+        self._bytes_decoder = None
+
+    def _fill(self):
+        """Reads more data into buffer. Amount of data read grows with buffer
+        size, so big values do not have to be re-parsed too many times."""
+        chunk = self.fp.read(max(self.chunk_size, len(self.buffer) - self.pos))
+        if isinstance(chunk, bytes) and not isinstance(chunk, str):
+            if self._bytes_decoder is None:
+                self._bytes_decoder = codecs.getincrementaldecoder('utf-8')()
+            chunk = self._bytes_decoder.decode(chunk, final=not chunk)
+        if not chunk:
+            self.eof = True
+        self.buffer = self.buffer[self.pos:] + chunk
+        self.pos = 0
+
+    def peek(self):
+        """Skips whitespace and returns next character without consuming it.
+        Returns empty string at the end of data."""
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or self.eof:
+                return self.buffer[self.pos:self.pos + 1]
+            self._fill()
+
+    def next(self):
+        """Consumes next non-whitespace character and returns it."""
+        char = self.peek()
+        self.pos += len(char)
+        return char
+
+    def expect(self, expected):
+        char = self.next()
+        if char != expected:
+            raise ValueError('Expected %r at position %d, got %r' % (
+                expected, self.pos, char or 'end of data',
+            ))
+
+    def value(self):
+        """Parses next JSON value."""
+        self.peek()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except ValueError:
+                if self.eof:
+                    raise
+                self._fill()
+                continue
+
+            # Number at the end of buffer can continue in next chunk (decoder
+            # stops before '.', 'e' etc. if fraction or exponent is cut off)
+            if not self.eof and _is_number(value) and \
+                    (end == len(self.buffer) or
+                     self.buffer[end] in _NUMBER_CHARS):
+                self._fill()
+                continue
+
+            self.pos = end
+            return value
+
+    def iter_array(self):
+        """Parses JSON array yielding it's items one by one."""
+        self.expect('[')
+        if self.peek() == ']':
+            self.next()
+            return
+
+        while True:
+            yield self.value()
+            char = self.next()
+            if char == ']':
+                return
+            elif char != ',':
+                raise ValueError('Expected "," or "]" at position %d, got %r' % (
+                    self.pos, char or 'end of data',
+                ))
+
+
+def _resolve_path(object_type, path):
+    """Checks that given path points to a list field through nested objects."""
+    for name in path:
+        if not isinstance(object_type, Object) or name not in object_type.fields:
+            raise ValueError('Invalid stream path: %s' % '.'.join(path))
+        field = object_type.fields[name]
+        if not isinstance(field, AttributeField):
+            raise ValueError('Stream path should consist of attribute fields')
+        object_type = field.field_type
+
+    if not isinstance(object_type, List):
+        raise ValueError('Stream path should point to a List field')
+
+
+class _StreamLoader(object):
+    def __init__(self, reader, on_item, context, errors):
+        self.reader = reader
+        self.on_item = on_item
+        self.context = context
+        self.errors = errors
+
+    def load_list(self, list_type):
+        reader = self.reader
+        if reader.peek() == '[':
+            data = reader.iter_array()
+        else:
+            data = reader.value()
+            if data is not None:
+                list_type._fail('invalid')
+
+        for item in list_type.load_iter(data, self.context, self.errors):
+            self.on_item(item)
+
+    def load_object(self, object_type, path):
+        """Loads JSON object with given type streaming the list at given path.
+        Returns dict of loaded field values except for streamed list."""
+        reader = self.reader
+        stream_name = path[0]
+        stream_type = object_type.fields[stream_name].field_type
+
+        if reader.peek() != '{':
+            object_type.load(reader.value(), self.context)
+            # Valid data has to be an object, so code above should have failed
+            object_type._fail('invalid')
+
+        reader.expect('{')
+        data = {}
+        nested = MISSING
+        streamed = False
+        if reader.peek() == '}':
+            reader.next()
+        else:
+            while True:
+                key = reader.value()
+                if not isinstance(key, string_types):
+                    raise ValueError('Object key should be string')
+                reader.expect(':')
+                if key == stream_name:
+                    try:
+                        if len(path) == 1:
+                            self.load_list(stream_type)
+                            streamed = True
+                        else:
+                            nested = self.load_object(stream_type, path[1:])
+                    except ValidationError as ve:
+                        raise ValidationError({key: ve.raw_messages})
+                else:
+                    data[key] = reader.value()
+
+                char = reader.next()
+                if char == '}':
+                    break
+                elif char != ',':
+                    raise ValueError(
+                        'Expected "," or "}" at position %d, got %r' % (
+                            reader.pos, char or 'end of data',
+                        )
+                    )
+
+        errors_builder = ValidationErrorBuilder()
+        result = {}
+        for name, field in iteritems(object_type.fields):
+            try:
+                if name == stream_name:
+                    if nested is not MISSING:
+                        result[name] = nested
+                    elif not streamed:
+                        # Stream data is missing
+                        stream_type.load(MISSING, self.context)
+                    continue
+
+                loaded = field.load(name, data, self.context)
+                if loaded is not MISSING:
+                    result[name] = loaded
+            except ValidationError as ve:
+                errors_builder.add_error(name, ve.raw_messages)
+
+        if not object_type.allow_extra_fields:
+            for name in data:
+                if name not in object_type.fields:
+                    errors_builder.add_error(
+                        name, object_type._error_message('unknown'),
+                    )
+
+        errors_builder.raise_errors()
+        return result
+
+
+def load_stream(object_type, fp, stream_path, on_item, context=None,
+                errors='raise', chunk_size=65536):
+    """Incrementally loads JSON document from file object. Items of the list
+    at `stream_path` are loaded one by one and passed to `on_item` callback
+    as soon as they are parsed. The rest of the document is loaded according
+    to `object_type` fields.
+
+    Since the object is never fully loaded, object validators and object
+    constructor are not applied: a dict of loaded field values (without the
+    streamed list) is returned instead.
+
+    :param Object object_type: Type of the whole document.
+    :param fp: File object to read JSON from. Can produce either text or
+        UTF-8 encoded bytes.
+    :param str stream_path: '.'-separated path to list field to stream
+        through nested objects, e.g. 'items' or 'data.items'.
+    :param callable on_item: Function that is called with each loaded item.
+    :param context: Context data.
+    :param str errors: What to do with invalid items. If 'raise', stop loading
+        and raise :exc:`~lollipop.errors.ValidationError`. If 'yield', pass
+        :class:`~lollipop.errors.ItemError` records to `on_item` and continue.
+    :param int chunk_size: Number of characters to read from file at once.
+    :returns: dict of loaded envelope field values.
+    """
+    path = stream_path.split('.')
+    _resolve_path(object_type, path)
+    if errors not in ('raise', 'yield'):
+        raise ValueError('Unknown errors mode: %s' % errors)
+
+    reader = _JSONReader(fp, chunk_size)
+    result = _StreamLoader(reader, on_item, context, errors)\
+        .load_object(object_type, path)
+    if reader.peek() != '':
+        raise ValueError('Extra data at position %d' % reader.pos)
+    return result
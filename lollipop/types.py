@@ -1,8 +1,30 @@
 from lollipop.errors import ValidationError, ValidationErrorBuilder, \
-    ErrorMessagesMixin, merge_errors
-from lollipop.utils import is_list, is_dict, call_with_context
+    ErrorMessagesMixin, ItemError, merge_errors, flatten_errors, \
+    render_errors
+from lollipop.validators import Length, Predicate, _fuse
+from lollipop.utils import is_list, is_dict, call_with_context, takes_context, \
+    is_coroutine_function
 from lollipop.compat import string_types, int_types, iteritems
+from lollipop import iso8601
+import array
+import collections
+import copy
 import datetime
+import inspect
+import itertools
+import operator
+import threading
+import time
+
+try:
+    import dataclasses
+except ImportError:  # Python < 3.7
+    dataclasses = None
+
+try:
+    import enum
+except ImportError:  # Python 2 without enum34 package
+    enum = None
 
 
 __all__ = [
@@ -12,6 +34,7 @@ __all__ = [
     'String',
     'Integer',
     'Boolean',
+    'Enum',
     'List',
     'Tuple',
     'Dict',
@@ -24,12 +47,20 @@ __all__ = [
     'Optional',
     'LoadOnly',
     'DumpOnly',
+    'Cached',
+    'record',
 ]
 
 class MissingType(object):
+    __slots__ = ()
+
     def __repr__(self):
         return '<MISSING>'
 
+    def __reduce__(self):
+        # Unpickle to the singleton
+        return 'MISSING'
+
 
 #: Special singleton value (like None) to represent case when value is missing.
 MISSING = MissingType()
@@ -41,9 +72,12 @@ class Type(ErrorMessagesMixin, object):
     :param list validate: A validator or list of validators for this data type.
         Validator is a callable that takes serialized data and raises
         :exc:`~lollipop.errors.ValidationError` if data is invalid.
-        Validator return value is ignored.
+        Validator return value is ignored. Built-in validators are combined
+        into a single check when type is created.
     """
 
+    __slots__ = ('_validators', '_validator_plans', '_fused_validator')
+
     default_error_messages = {
         'invalid': 'Invalid value type',
         'required': 'Value is required',
@@ -57,35 +91,162 @@ class Type(ErrorMessagesMixin, object):
             validate = [validate]
 
         self._validators = validate
-
-    def validate(self, data, context=None):
+        # Resolve once whether validators take context argument,
+        # so there is no need to introspect them on each load
+        self._validator_plans = [
+            (validator, takes_context(validator, 1))
+            for validator in validate
+        ] if validate else ()
+        # Built-in validators are combined into a single check
+        self._fused_validator = _fuse(self._validator_plans) \
+            if validate else None
+        if any(is_coroutine_function(validator) for validator in validate):
+            self._validator_plans = [
+                (_ValidatorCall(self, validator, with_context), True)
+                for validator, with_context in self._validator_plans
+            ]
+            self._fused_validator = None
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
         """Takes serialized data and returns validation errors or None.
 
         :param data: Data to validate.
         :param context: Context data.
+        :param bool fail_fast: If True, stop validation on first error.
+        :param int max_errors: Stop validation once given number of errors
+            is found. Should be positive.
         """
+        limit = _error_limit(fail_fast, max_errors)
+        if limit is not None:
+            return _limit_errors(self.iter_errors(data, context), limit) or {}
+
         try:
             self.load(data, context)
             return {}
         except ValidationError as ve:
             return ve.messages
 
-    def load(self, data, context=None):
+    def load_async(self, data, context=None, concurrency=None):
+        """Asynchronous version of :meth:`load` which supports coroutine
+        function validators. Returns awaitable. Asynchronous validators of
+        sibling fields and list items run concurrently. Types without
+        asynchronous validators are loaded synchronously. Requires Python 3.
+
+        Example: ::
+
+            async def unique_email(email):
+                if await users.exists(email=email):
+                    raise ValidationError('Email is already taken')
+
+            UserType = Object({'email': String(validate=unique_email)})
+            user = await UserType.load_async(data)
+
+        :param data: Data to deserialize.
+        :param context: Context data.
+        :param int concurrency: Maximum number of asynchronous validators
+            running at the same time. Unlimited by default.
+        """
+        from lollipop.aio import load_async
+        return load_async(self, data, context, concurrency)
+
+    def validate_async(self, data, context=None, concurrency=None):
+        """Asynchronous version of :meth:`validate` (see :meth:`load_async`).
+        Returns awaitable.
+
+        :param data: Data to validate.
+        :param context: Context data.
+        :param int concurrency: Maximum number of asynchronous validators
+            running at the same time. Unlimited by default.
+        """
+        from lollipop.aio import validate_async
+        return validate_async(self, data, context, concurrency)
+
+    def is_valid(self, data, context=None):
+        """Returns True if serialized data is valid, False - otherwise.
+        Unlike :meth:`validate`, does not collect error messages and stops
+        on first error. Containers check their items without building
+        loaded values.
+
+        :param data: Data to validate.
+        :param context: Context data.
+        """
+        try:
+            self.load(data, context)
+            return True
+        except ValidationError:
+            return False
+
+    def iter_errors(self, data, context=None):
+        """Validates serialized data lazily yielding validation errors as
+        tuples of error path and error message. Path is a tuple of field names
+        and list indexes; it is empty for errors of the value itself.
+
+        Example: ::
+
+            for path, message in PersonType.iter_errors(data):
+                print('.'.join(map(str, path)), message)
+
+        :param data: Data to validate.
+        :param context: Context data.
+        """
+        try:
+            self.load(data, context)
+        except ValidationError as ve:
+            for error in flatten_errors(ve.messages):
+                yield error
+
+    def load(self, data, context=None, fail_fast=False, max_errors=None):
         """Deserialize data from primitive types. Raises
         :exc:`~lollipop.errors.ValidationError` if data is invalid.
 
         :param data: Data to deserialize.
         :param context: Context data.
+        :param bool fail_fast: If True, stop validation on first error.
+        :param int max_errors: Stop validation once given number of errors
+            is found. Should be positive.
         """
+        limit = _error_limit(fail_fast, max_errors)
+        if limit is None and self._fused_validator is not None:
+            self._fused_validator.check(data, context)
+            return data
+
         errors_builder = ValidationErrorBuilder()
-        for validator in self._validators:
+        for validator, with_context in self._validator_plans:
             try:
-                call_with_context(validator, context, data)
+                if with_context:
+                    validator(data, context)
+                else:
+                    validator(data)
             except ValidationError as ve:
-                errors_builder.add_errors(ve.messages)
+                errors_builder.add_errors(ve.raw_messages)
+                if limit is not None and \
+                        _count_errors(errors_builder.errors) >= limit:
+                    break
+
+        if limit is not None and errors_builder.errors:
+            raise ValidationError(
+                _limit_errors(flatten_errors(errors_builder.errors), limit)
+            )
         errors_builder.raise_errors()
         return data
 
+    def _load_with_error_limit(self, data, context=None,
+                               fail_fast=False, max_errors=None):
+        """Loads data in a single pass stopping as soon as error limit
+        is reached."""
+        return self._load_limited(data, context,
+                                  _error_limit(fail_fast, max_errors))
+
+    def _load_limited(self, data, context, limit):
+        """Loads data raising at most `limit` errors. Containers override it
+        to stop loading their items once limit is reached."""
+        try:
+            return self.load(data, context)
+        except ValidationError as ve:
+            raise ValidationError(
+                _limit_errors(flatten_errors(ve.raw_messages), limit)
+            )
+
     def dump(self, value, context=None):
         """Serialize data to primitive types. Raises
         :exc:`~lollipop.errors.ValidationError` if data is invalid.
@@ -95,16 +256,229 @@ class Type(ErrorMessagesMixin, object):
         """
         return value
 
+    def load_many(self, data, context=None):
+        """Deserialize each item of given iterable. Unlike loading with
+        :class:`List`, does not stop on invalid items and does not raise
+        :exc:`~lollipop.errors.ValidationError`.
+
+        Example: ::
+
+            values, errors = Integer().load_many([1, 'foo', 3])
+            # => values == [1, MISSING, 3]
+            # => errors == {1: 'Value should be integer'}
+
+        :param iterable data: Items to deserialize.
+        :param context: Context data.
+        :returns: Tuple of list of deserialized values (with :obj:`MISSING` in
+            place of invalid items) and dict of invalid item indexes to
+            their error messages.
+        """
+        items, errors = self._load_many(data, context)
+        return items, render_errors(errors)
+
+    def _load_many(self, data, context):
+        """Same as :meth:`load_many`, but errors are reported as they were
+        raised (see :attr:`ValidationError.raw_messages`)."""
+        return _process_many(self.load, data, context)
+
+    def dump_many(self, values, context=None):
+        """Serialize each item of given iterable. Does not raise
+        :exc:`~lollipop.errors.ValidationError`.
+
+        :param iterable values: Items to serialize.
+        :param context: Context data.
+        :returns: Tuple of list of serialized values (with :obj:`MISSING` in
+            place of invalid items) and dict of invalid item indexes to
+            their error messages.
+        """
+        values, errors = self._dump_many(values, context)
+        return values, render_errors(errors)
+
+    def _dump_many(self, values, context):
+        """Same as :meth:`dump_many`, but errors are reported as they were
+        raised (see :attr:`ValidationError.raw_messages`)."""
+        return _process_many(self.dump, values, context)
+
+    def load_iter(self, data, context=None, errors='raise'):
+        """Lazily deserialize items of given iterable (e.g. generator or file).
+        Returns iterator over deserialized items.
+
+        Example: ::
+
+            for person in PersonType.load_iter(read_records(fp)):
+                save(person)
+
+        :param iterable data: Items to deserialize.
+        :param context: Context data.
+        :param str errors: What to do with invalid items. If 'raise', raise
+            :exc:`~lollipop.errors.ValidationError` with errors for invalid
+            item index. If 'yield', yield :class:`~lollipop.errors.ItemError`
+            record in place of invalid item and continue.
+        """
+        if errors not in ('raise', 'yield'):
+            raise ValueError('Unknown errors mode: %s' % errors)
+        return self._load_iter(data, context, errors == 'raise')
+
+    def _load_iter(self, data, context, raise_errors):
+        load = self.load
+        for idx, item in enumerate(data):
+            try:
+                loaded = load(item, context)
+            except ValidationError as ve:
+                if raise_errors:
+                    raise ValidationError({idx: ve.raw_messages})
+                yield ItemError(idx, ve.messages)
+            else:
+                yield loaded
+
+    def compile(self):
+        """Generates specialized load and dump functions for this type.
+        Returns :class:`~lollipop.compiler.CompiledType` which produces the same
+        results and errors as this type, but faster. Type should not be
+        modified after compilation.
+        """
+        from lollipop.compiler import compile_type
+        return compile_type(self)
+
     def __repr__(self):
         return '<{klass}>'.format(klass=self.__class__.__name__)
 
 
+#: Type which validators are currently run asynchronously (per thread)
+_async_validation = threading.local()
+
+
+class _ValidatorCall(object):
+    """Validator plan entry for types that have coroutine function validators.
+    On synchronous load, calls synchronous validators and raises `TypeError`
+    for asynchronous ones, since they can not be run. When type is loaded with
+    :meth:`Type.load_async`, validators are skipped here and run by
+    :mod:`lollipop.aio` instead."""
+
+    __slots__ = ('type', 'validator', 'with_context', 'is_async')
+
+    def __init__(self, type, validator, with_context):
+        self.type = type
+        self.validator = validator
+        self.with_context = with_context
+        self.is_async = is_coroutine_function(validator)
+
+    def __call__(self, data, context=None):
+        if getattr(_async_validation, 'type', None) is self.type:
+            return
+        if self.is_async:
+            raise TypeError(
+                '%r has asynchronous validator %r, use load_async() or '
+                'validate_async() instead' % (self.type, self.validator)
+            )
+        if self.with_context:
+            self.validator(data, context)
+        else:
+            self.validator(data)
+
+
+class _DumpState(threading.local):
+    #: Memo of current outermost dump call: dict of (object id, type id) to
+    #: list of object and it's dumped value, or None outside of dump
+    memo = None
+
+
+_dump_state = _DumpState()
+#: Memo entry marker for objects that are being dumped
+_DUMPING = object()
+
+
+def _with_dump_memo(dump, value, args, kwargs):
+    """Calls dump function with a new dump memo (unless there is one already),
+    which is shared by all nested dumps and discarded once dump is finished."""
+    if _dump_state.memo is not None:
+        return dump(value, *args, **kwargs)
+
+    _dump_state.memo = {}
+    try:
+        return dump(value, *args, **kwargs)
+    finally:
+        _dump_state.memo = None
+
+
+def _load_lazy(type, data, args, kwargs):
+    """Loads data lazily (see :mod:`lollipop.lazy`) with arguments passed to
+    :meth:`Type.load`. Errors of lazy views are raised on access, so they can
+    not be limited."""
+    if _has_error_limit(kwargs):
+        raise ValueError('Lazy loading does not support fail_fast and max_errors')
+    kwargs.pop('fail_fast', None)
+    kwargs.pop('max_errors', None)
+
+    from lollipop.lazy import load_lazy
+    return load_lazy(type, data, *args, **kwargs)
+
+
+def _error_limit(fail_fast, max_errors):
+    if fail_fast:
+        return 1
+    if max_errors is not None and max_errors < 1:
+        raise ValueError('max_errors should be a positive number')
+    return max_errors
+
+
+def _has_error_limit(kwargs):
+    return _error_limit(kwargs.get('fail_fast'),
+                        kwargs.get('max_errors')) is not None
+
+
+def _count_errors(errors):
+    return sum(1 for _ in flatten_errors(errors))
+
+
+def _limit_errors(errors, limit):
+    """Builds error messages from first `limit` (path, message) tuples."""
+    result = None
+    for path, message in itertools.islice(errors, limit):
+        for key in reversed(path):
+            message = {key: message}
+        result = merge_errors(result, message)
+    return result
+
+
+def _error_path(name):
+    """Returns path of errors added with
+    :meth:`~lollipop.errors.ValidationErrorBuilder.add_error`."""
+    if isinstance(name, string_types):
+        return tuple(name.split('.'))
+    return (name,)
+
+
+def _iter_field_errors(field, name, data, context):
+    try:
+        field.load(name, data, context)
+    except ValidationError as ve:
+        for error in flatten_errors(ve.messages):
+            yield error
+
+
+def _process_many(func, items, context):
+    results = []
+    append = results.append
+    errors = {}
+    for idx, item in enumerate(items):
+        try:
+            append(func(item, context))
+        except ValidationError as ve:
+            errors[idx] = ve.raw_messages
+            append(MISSING)
+    return results, errors
+
+
 class Any(Type):
     """Any type. Does not transform/validate given data."""
-    pass
+
+    __slots__ = ()
 
 
 class Number(Type):
+    __slots__ = ()
+
     num_type = float
     default_error_messages = {
         'invalid': 'Value should be number',
@@ -132,6 +506,8 @@ class Number(Type):
 class Integer(Number):
     """An integer type."""
 
+    __slots__ = ()
+
     num_type = int
     default_error_messages = {
         'invalid': 'Value should be integer'
@@ -141,6 +517,8 @@ class Integer(Number):
 class Float(Number):
     """A float type."""
 
+    __slots__ = ()
+
     num_type = float
     default_error_messages = {
         'invalid': 'Value should be float'
@@ -150,6 +528,8 @@ class Float(Number):
 class String(Type):
     """A string type."""
 
+    __slots__ = ()
+
     default_error_messages = {
         'invalid': 'Value should be string',
     }
@@ -174,6 +554,8 @@ class String(Type):
 class Boolean(Type):
     """A boolean type."""
 
+    __slots__ = ()
+
     default_error_messages = {
         'invalid': 'Value should be boolean',
     }
@@ -200,12 +582,20 @@ class Boolean(Type):
 class DateTime(Type):
     """A date and time type which serializes into string.
 
+    ISO 8601 formats ('iso', 'iso8601' and 'rfc3339') are parsed and formatted
+    with fast routines from :mod:`lollipop.iso8601`. Besides timezone names
+    accepted by strptime, they accept fractions of seconds and UTC offsets
+    (e.g. '2016-07-28T11:22:33.123+02:00' loads into timezone aware datetime).
+    Dumped values are the same as with strftime.
+
     :param str format: Format string (see :func:`datetime.datetime.strptime`) or
         one of predefined format names (e.g. 'iso8601', 'rfc3339', etc.
         See :const:`~DateTime.FORMATS`)
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
 
+    __slots__ = ('format',)
+
     FORMATS = {
         'iso': '%Y-%m-%dT%H:%M:%S%Z',  # shortcut for iso8601
         'iso8601': '%Y-%m-%dT%H:%M:%S%Z',
@@ -216,6 +606,12 @@ class DateTime(Type):
 
     DEFAULT_FORMAT = 'iso'
 
+    #: Format string which is handled by fast ISO 8601 parser and formatter
+    ISO_FORMAT = '%Y-%m-%dT%H:%M:%S%Z'
+
+    _parse_iso = staticmethod(iso8601.parse_datetime)
+    _format_iso = staticmethod(iso8601.format_datetime)
+
     default_error_messages = {
         'invalid': 'Invalid datetime value',
         'invalid_type': 'Value should be string',
@@ -238,7 +634,13 @@ class DateTime(Type):
 
         format_str = self.FORMATS.get(self.format, self.format)
         try:
-            date = self._convert_value(datetime.datetime.strptime(data, format_str))
+            date = None
+            if format_str == self.ISO_FORMAT:
+                date = self._parse_iso(data)
+            if date is None:
+                date = self._convert_value(
+                    datetime.datetime.strptime(data, format_str),
+                )
             return super(DateTime, self).load(date, *args, **kwargs)
         except ValueError:
             self._fail('invalid_format', data=data, format=format_str)
@@ -249,8 +651,12 @@ class DateTime(Type):
 
         format_str = self.FORMATS.get(self.format, self.format)
         try:
-            return super(DateTime, self)\
-                .dump(value.strftime(format_str), *args, **kwargs)
+            result = None
+            if format_str == self.ISO_FORMAT:
+                result = self._format_iso(value)
+            if result is None:
+                result = value.strftime(format_str)
+            return super(DateTime, self).dump(result, *args, **kwargs)
         except (AttributeError, ValueError):
             self._fail('invalid', data=value)
 
@@ -264,6 +670,8 @@ class Date(DateTime):
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
 
+    __slots__ = ()
+
     FORMATS = {
         'iso': '%Y-%m-%d',  # shortcut for iso8601
         'iso8601': '%Y-%m-%d',
@@ -274,6 +682,11 @@ class Date(DateTime):
 
     DEFAULT_FORMAT = 'iso'
 
+    ISO_FORMAT = '%Y-%m-%d'
+
+    _parse_iso = staticmethod(iso8601.parse_date)
+    _format_iso = staticmethod(iso8601.format_date)
+
     default_error_messages = {
         'invalid': 'Invalid date value',
         'invalid_type': 'Value should be string',
@@ -292,6 +705,8 @@ class Time(DateTime):
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
 
+    __slots__ = ()
+
     FORMATS = {
         'iso': '%H:%M:%S',  # shortcut for iso8601
         'iso8601': '%H:%M:%S',
@@ -299,6 +714,11 @@ class Time(DateTime):
 
     DEFAULT_FORMAT = 'iso'
 
+    ISO_FORMAT = '%H:%M:%S'
+
+    _parse_iso = staticmethod(iso8601.parse_time)
+    _format_iso = staticmethod(iso8601.format_time)
+
     default_error_messages = {
         'invalid': 'Invalid time value',
         'invalid_type': 'Value should be string',
@@ -309,6 +729,132 @@ class Time(DateTime):
         return value.time()
 
 
+class Enum(Type):
+    """A type of values which are one of given choices. Raw values are mapped
+    to loaded values (and back) with dicts built on construction, so loading
+    and dumping take constant time regardless of number of choices.
+
+    Example: ::
+
+        class Color(enum.Enum):
+            RED = 'red'
+            GREEN = 'green'
+
+        Enum(Color).load('red')  # => Color.RED
+        Enum(Color).dump(Color.GREEN)  # => 'green'
+        Enum(Color, by_name=True).load('RED')  # => Color.RED
+
+        Enum({1: 'low', 2: 'high'}).load(2)  # => 'high'
+
+    :param choices: :class:`enum.Enum` subclass or a mapping of raw values to
+        loaded values. Raw and loaded values which are not hashable are
+        loaded and dumped by comparing them with each choice.
+    :param bool by_name: If True, :class:`enum.Enum` members are loaded from
+        and dumped to their names instead of values.
+    :param kwargs: Same keyword arguments as for :class:`Type`.
+    """
+
+    __slots__ = ('_choices', '_by_name', '_load_map', '_load_pairs',
+                 '_dump_map', '_dump_pairs')
+
+    default_error_messages = {
+        'invalid': 'Invalid choice',
+    }
+
+    def __init__(self, choices, by_name=False, **kwargs):
+        super(Enum, self).__init__(**kwargs)
+        self._choices = choices
+        self._by_name = by_name
+
+        if enum is not None and inspect.isclass(choices) and \
+                issubclass(choices, enum.Enum):
+            if by_name:
+                pairs = list(iteritems(choices.__members__))
+            else:
+                pairs = [(member.value, member) for member in choices]
+        else:
+            pairs = list(iteritems(choices))
+
+        # Unhashable raw values (e.g. values of enum members which are lists)
+        # can not be looked up in a dict, they are compared with data one by one
+        load_map = {}
+        load_pairs = []
+        for raw, value in pairs:
+            try:
+                load_map.setdefault(raw, value)
+            except TypeError:
+                load_pairs.append((raw, value))
+        self._load_map = load_map
+        self._load_pairs = tuple(load_pairs)
+
+        # Aliases of enum members go after canonical names,
+        # so the first raw value of each choice is used for dumping
+        self._dump_pairs = tuple((value, raw) for raw, value in pairs)
+        try:
+            dump_map = {}
+            for value, raw in self._dump_pairs:
+                dump_map.setdefault(value, raw)
+            self._dump_map = dump_map
+        except TypeError:
+            self._dump_map = None
+
+    @property
+    def choices(self):
+        """Choices given on construction."""
+        return self._choices
+
+    @property
+    def by_name(self):
+        return self._by_name
+
+    def _fail_invalid(self, data):
+        self._fail('invalid', data=data,
+                   choices=[raw for _, raw in self._dump_pairs])
+
+    def _load_value(self, data):
+        """Returns choice of given raw value."""
+        if data is MISSING or data is None:
+            self._fail('required')
+
+        try:
+            return self._load_map[data]
+        except (KeyError, TypeError):
+            pass
+        for raw, value in self._load_pairs:
+            if raw == data:
+                return value
+        self._fail_invalid(data)
+
+    def load(self, data, *args, **kwargs):
+        return super(Enum, self).load(self._load_value(data), *args, **kwargs)
+
+    def _dump_value(self, value):
+        """Returns raw value of given choice."""
+        if value is MISSING or value is None:
+            self._fail('required')
+
+        if self._dump_map is not None:
+            try:
+                return self._dump_map[value]
+            except (KeyError, TypeError):
+                pass
+        else:
+            for choice, raw in self._dump_pairs:
+                if choice == value:
+                    return raw
+        self._fail_invalid(value)
+
+    def dump(self, value, *args, **kwargs):
+        return super(Enum, self).dump(self._dump_value(value), *args, **kwargs)
+
+    def __repr__(self):
+        return '<{klass} {choices}>'.format(
+            klass=self.__class__.__name__,
+            choices=getattr(self._choices, '__name__', None) or
+            repr(sorted((raw for _, raw in self._dump_pairs), key=repr)),
+        )
+
+
 class List(Type):
     """A homogenous list type.
 
@@ -316,9 +862,25 @@ class List(Type):
 
         List(String()).load(['foo', 'bar', 'baz'])
 
+    Large lists can be loaded and dumped in parallel by passing `parallel`
+    argument: either a :class:`concurrent.futures.Executor` or a number of
+    worker processes to start (see :mod:`lollipop.parallel`). Optional
+    `chunk_size` argument controls number of items sent to a worker at once: ::
+
+        List(ItemType).load(data, parallel=4)
+
+    Passing `lazy=True` returns a sequence view over data which loads items on
+    first access (see :mod:`lollipop.lazy`).
+
+    Validation checks items without loading them; list validators need loaded
+    items, so list with validators is loaded once all items are valid.
+
     :param Type item_type: Type of list elements.
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
+
+    __slots__ = ('item_type',)
+
     default_error_messages = {
         'invalid': 'Value should be list',
     }
@@ -328,6 +890,19 @@ class List(Type):
         self.item_type = item_type
 
     def load(self, data, *args, **kwargs):
+        if kwargs.pop('lazy', False):
+            return _load_lazy(self, data, args, kwargs)
+
+        parallel = kwargs.pop('parallel', None)
+        chunk_size = kwargs.pop('chunk_size', None)
+
+        if _has_error_limit(kwargs):
+            if parallel is not None:
+                raise ValueError(
+                    'Parallel loading does not support fail_fast and max_errors'
+                )
+            return self._load_with_error_limit(data, *args, **kwargs)
+
         if data is MISSING or data is None:
             self._fail('required')
 
@@ -335,35 +910,189 @@ class List(Type):
         if not is_list(data):
             self._fail('invalid')
 
+        if parallel is not None:
+            from lollipop.parallel import load_list
+            return load_list(self, data, parallel, *args, chunk_size=chunk_size,
+                             **kwargs)
+
         errors_builder = ValidationErrorBuilder()
         items = []
         for idx, item in enumerate(data):
             try:
                 items.append(self.item_type.load(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
+                errors_builder.add_errors({idx: ve.raw_messages})
         errors_builder.raise_errors()
 
         return super(List, self).load(items, *args, **kwargs)
 
     def dump(self, value, *args, **kwargs):
+        if _dump_state.memo is None:
+            return _with_dump_memo(self.dump, value, args, kwargs)
+
+        parallel = kwargs.pop('parallel', None)
+        chunk_size = kwargs.pop('chunk_size', None)
+
         if value is MISSING or value is None:
             self._fail('required')
 
         if not is_list(value):
             self._fail('invalid')
 
+        if parallel is not None:
+            from lollipop.parallel import dump_list
+            return dump_list(self, value, parallel, *args, chunk_size=chunk_size,
+                             **kwargs)
+
         errors_builder = ValidationErrorBuilder()
         items = []
         for idx, item in enumerate(value):
             try:
                 items.append(self.item_type.dump(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
+                errors_builder.add_errors({idx: ve.raw_messages})
         errors_builder.raise_errors()
 
         return super(List, self).dump(items, *args, **kwargs)
 
+    def _can_check_items(self, data):
+        """Returns True if data can be validated item by item without loading
+        the whole list."""
+        return is_list(data) and self.__class__.load == List.load
+
+    def _load_limited(self, data, context, limit):
+        if not self._can_check_items(data):
+            return super(List, self)._load_limited(data, context, limit)
+
+        errors_builder = ValidationErrorBuilder()
+        count = 0
+        items = []
+        for idx, item in enumerate(data):
+            try:
+                items.append(
+                    self.item_type._load_limited(item, context, limit - count)
+                )
+            except ValidationError as ve:
+                errors_builder.add_errors({idx: ve.raw_messages})
+                count += _count_errors(ve.raw_messages)
+                if count >= limit:
+                    break
+        errors_builder.raise_errors()
+
+        return super(List, self).load(items, context, max_errors=limit)
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or \
+                not self._can_check_items(data):
+            return super(List, self).validate(
+                data, context, fail_fast=fail_fast, max_errors=max_errors,
+            )
+
+        errors_builder = ValidationErrorBuilder()
+        for idx, item in enumerate(data):
+            errors = self.item_type.validate(item, context)
+            if errors:
+                errors_builder.add_errors({idx: errors})
+
+        if not errors_builder.errors and self._validators:
+            # Validators need loaded items
+            return super(List, self).validate(data, context)
+        return errors_builder.errors or {}
+
+    def is_valid(self, data, context=None):
+        if not self._can_check_items(data):
+            return super(List, self).is_valid(data, context)
+
+        item_type = self.item_type
+        for item in data:
+            if not item_type.is_valid(item, context):
+                return False
+
+        if self._validators:
+            # Validators need loaded items
+            return super(List, self).is_valid(data, context)
+        return True
+
+    def iter_errors(self, data, context=None):
+        if not self._can_check_items(data):
+            for error in super(List, self).iter_errors(data, context):
+                yield error
+            return
+
+        has_errors = False
+        for idx, item in enumerate(data):
+            for path, message in self.item_type.iter_errors(item, context):
+                has_errors = True
+                yield (idx,) + path, message
+
+        if not has_errors and self._validators:
+            # Validators need loaded items
+            for error in super(List, self).iter_errors(data, context):
+                yield error
+
+    def load_iter(self, data, context=None, errors='raise'):
+        """Lazily deserialize items of given iterable with item type.
+        Unlike :meth:`load`, accepts any iterable and does not hold all items
+        in memory. See :meth:`Type.load_iter` for details.
+
+        List validators are applied as items are consumed, so only validators
+        that do not need whole list are supported:
+        :class:`~lollipop.validators.Length` checks maximum length as soon as
+        it is exceeded and minimum length when iterable is exhausted.
+
+        :param iterable data: Items to deserialize.
+        :param context: Context data.
+        :param str errors: Either 'raise' or 'yield'.
+        """
+        if data is MISSING or data is None:
+            self._fail('required')
+
+        for validator in self._validators:
+            if not isinstance(validator, Length) or \
+                    validator.__class__.__call__ != Length.__call__:
+                raise ValueError(
+                    'Validator %r does not support streaming' % validator
+                )
+
+        try:
+            data = iter(data)
+        except TypeError:
+            self._fail('invalid')
+
+        items = self.item_type.load_iter(data, context, errors)
+        return self._validate_stream(items)
+
+    def _validate_stream(self, items):
+        length = 0
+        for item in items:
+            length += 1
+            for validator in self._validators:
+                validator.validate_partial_length(length)
+            yield item
+
+        for validator in self._validators:
+            validator.validate_length(length)
+
+    def dump_columns(self, value, context=None, array_type=None):
+        """Serialize list of objects into columns: a dict of field names to
+        lists of serialized field values. Item type should be :class:`Object`.
+        See :meth:`Object.dump_columns` for details.
+
+        :param list value: Objects to serialize.
+        :param context: Context data.
+        :param str array_type: Either None, 'array' or 'numpy'.
+        """
+        if not isinstance(self.item_type, Object):
+            raise ValueError('Columnar dump requires list of objects')
+
+        if value is MISSING or value is None:
+            self._fail('required')
+
+        if not is_list(value):
+            self._fail('invalid')
+
+        return self.item_type.dump_columns(value, context, array_type=array_type)
+
     def __repr__(self):
         return '<{klass} of {item_type}>'.format(
             klass=self.__class__.__name__,
@@ -378,9 +1107,15 @@ class Tuple(Type):
 
         Tuple([String(), Integer(), Boolean()]).load(['foo', 123, False])
 
+    Validation checks items without loading them; tuple validators need loaded
+    items, so tuple with validators is loaded once all items are valid.
+
     :param list item_types: List of item types.
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
+
+    __slots__ = ('item_types',)
+
     default_error_messages = dict(Type.default_error_messages, **{
         'invalid': 'Value should be list',
         'invalid_length': 'Value length should be {expected_length}',
@@ -391,6 +1126,9 @@ class Tuple(Type):
         self.item_types = item_types
 
     def load(self, data, *args, **kwargs):
+        if _has_error_limit(kwargs):
+            return self._load_with_error_limit(data, *args, **kwargs)
+
         if data is MISSING or data is None:
             self._fail('required')
 
@@ -404,9 +1142,9 @@ class Tuple(Type):
         result = []
         for idx, (item_type, item) in enumerate(zip(self.item_types, data)):
             try:
-                result.add(item_type.load(item, *args, **kwargs))
+                result.append(item_type.load(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
+                errors_builder.add_errors({idx: ve.raw_messages})
         errors_builder.raise_errors()
 
         return super(Tuple, self).load(result, *args, **kwargs)
@@ -415,7 +1153,7 @@ class Tuple(Type):
         if value is MISSING or value is None:
             self._fail('required')
 
-        if not is_list(data):
+        if not is_list(value) and not isinstance(value, tuple):
             self._fail('invalid')
 
         if len(value) != len(self.item_types):
@@ -425,21 +1163,97 @@ class Tuple(Type):
         result = []
         for idx, (item_type, item) in enumerate(zip(self.item_types, value)):
             try:
-                result.add(item_type.dump(item, *args, **kwargs))
+                result.append(item_type.dump(item, *args, **kwargs))
             except ValidationError as ve:
-                errors_builder.add_errors({idx: ve.messages})
+                errors_builder.add_errors({idx: ve.raw_messages})
         errors_builder.raise_errors()
 
         return super(Tuple, self).dump(result, *args, **kwargs)
 
+    def _can_check_items(self, data):
+        """Returns True if data can be validated item by item without loading
+        the whole tuple."""
+        return is_list(data) and len(data) == len(self.item_types) and \
+            self.__class__.load == Tuple.load
+
+    def _load_limited(self, data, context, limit):
+        if not self._can_check_items(data):
+            return super(Tuple, self)._load_limited(data, context, limit)
+
+        errors_builder = ValidationErrorBuilder()
+        count = 0
+        result = []
+        for idx, (item_type, item) in enumerate(zip(self.item_types, data)):
+            try:
+                result.append(item_type._load_limited(item, context,
+                                                      limit - count))
+            except ValidationError as ve:
+                errors_builder.add_errors({idx: ve.raw_messages})
+                count += _count_errors(ve.raw_messages)
+                if count >= limit:
+                    break
+        errors_builder.raise_errors()
+
+        return super(Tuple, self).load(result, context, max_errors=limit)
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or \
+                not self._can_check_items(data):
+            return super(Tuple, self).validate(
+                data, context, fail_fast=fail_fast, max_errors=max_errors,
+            )
+
+        errors_builder = ValidationErrorBuilder()
+        for idx, (item_type, item) in enumerate(zip(self.item_types, data)):
+            errors = item_type.validate(item, context)
+            if errors:
+                errors_builder.add_errors({idx: errors})
+
+        if not errors_builder.errors and self._validators:
+            # Validators need loaded items
+            return super(Tuple, self).validate(data, context)
+        return errors_builder.errors or {}
+
+    def is_valid(self, data, context=None):
+        if not self._can_check_items(data):
+            return super(Tuple, self).is_valid(data, context)
+
+        for item_type, item in zip(self.item_types, data):
+            if not item_type.is_valid(item, context):
+                return False
+
+        if self._validators:
+            # Validators need loaded items
+            return super(Tuple, self).is_valid(data, context)
+        return True
+
+    def iter_errors(self, data, context=None):
+        if not self._can_check_items(data):
+            for error in super(Tuple, self).iter_errors(data, context):
+                yield error
+            return
+
+        has_errors = False
+        for idx, (item_type, item) in enumerate(zip(self.item_types, data)):
+            for path, message in item_type.iter_errors(item, context):
+                has_errors = True
+                yield (idx,) + path, message
+
+        if not has_errors and self._validators:
+            # Validators need loaded items
+            for error in super(Tuple, self).iter_errors(data, context):
+                yield error
+
     def __repr__(self):
         return '<{klass} of {item_types}>'.format(
             klass=self.__class__.__name__,
-            item_type=repr(self.item_types),
+            item_types=repr(self.item_types),
         )
 
 
 class DictWithDefault(object):
+    __slots__ = ('values', 'default')
+
     def __init__(self, values={}, default=None):
         super(DictWithDefault, self).__init__()
         self.values = values
@@ -476,11 +1290,16 @@ class Dict(Type):
             'foo': 'hello', 'bar': 123,
         })
 
+    Passing `lazy=True` returns a mapping view over data which loads values on
+    first access (see :mod:`lollipop.lazy`).
+
     :param dict value_type: A single :class:`Type` for all dict values or mapping
         of allowed keys to :class:`Type` instances.
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
 
+    __slots__ = ('value_types',)
+
     default_error_messages = {
         'invalid': 'Value should be dict',
     }
@@ -492,6 +1311,12 @@ class Dict(Type):
         self.value_types = value_types
 
     def load(self, data, *args, **kwargs):
+        if kwargs.pop('lazy', False):
+            return _load_lazy(self, data, args, kwargs)
+
+        if _has_error_limit(kwargs):
+            return self._load_with_error_limit(data, *args, **kwargs)
+
         if data is MISSING or data is None:
             self._fail('required')
 
@@ -507,12 +1332,97 @@ class Dict(Type):
             try:
                 result[k] = value_type.load(v, *args, **kwargs)
             except ValidationError as ve:
-                errors_builder.add_error(k, ve.messages)
+                errors_builder.add_error(k, ve.raw_messages)
         errors_builder.raise_errors()
 
         return super(Dict, self).load(result, *args, **kwargs)
 
+    def _can_check_items(self, data):
+        """Returns True if data can be validated item by item without loading
+        the whole dict."""
+        return is_dict(data) and self.__class__.load == Dict.load
+
+    def _load_limited(self, data, context, limit):
+        if not self._can_check_items(data):
+            return super(Dict, self)._load_limited(data, context, limit)
+
+        errors_builder = ValidationErrorBuilder()
+        count = 0
+        result = {}
+        for k, v in iteritems(data):
+            value_type = self.value_types.get(k)
+            if value_type is None:
+                continue
+            try:
+                result[k] = value_type._load_limited(v, context, limit - count)
+            except ValidationError as ve:
+                errors_builder.add_error(k, ve.raw_messages)
+                count += _count_errors(ve.raw_messages)
+                if count >= limit:
+                    break
+        errors_builder.raise_errors()
+
+        return super(Dict, self).load(result, context, max_errors=limit)
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or \
+                not self._can_check_items(data):
+            return super(Dict, self).validate(
+                data, context, fail_fast=fail_fast, max_errors=max_errors,
+            )
+
+        errors_builder = ValidationErrorBuilder()
+        for k, v in iteritems(data):
+            value_type = self.value_types.get(k)
+            if value_type is None:
+                continue
+            errors = value_type.validate(v, context)
+            if errors:
+                errors_builder.add_error(k, errors)
+
+        if not errors_builder.errors and self._validators:
+            # Validators need loaded values
+            return super(Dict, self).validate(data, context)
+        return errors_builder.errors or {}
+
+    def is_valid(self, data, context=None):
+        if not self._can_check_items(data):
+            return super(Dict, self).is_valid(data, context)
+
+        value_types = self.value_types
+        for k, v in iteritems(data):
+            value_type = value_types.get(k)
+            if value_type is not None and not value_type.is_valid(v, context):
+                return False
+
+        if self._validators:
+            # Validators need loaded values
+            return super(Dict, self).is_valid(data, context)
+        return True
+
+    def iter_errors(self, data, context=None):
+        if not self._can_check_items(data):
+            for error in super(Dict, self).iter_errors(data, context):
+                yield error
+            return
+
+        has_errors = False
+        for k, v in iteritems(data):
+            value_type = self.value_types.get(k)
+            if value_type is None:
+                continue
+            for path, message in value_type.iter_errors(v, context):
+                has_errors = True
+                yield _error_path(k) + path, message
+
+        if not has_errors and self._validators:
+            for error in super(Dict, self).iter_errors(data, context):
+                yield error
+
     def dump(self, value, *args, **kwargs):
+        if _dump_state.memo is None:
+            return _with_dump_memo(self.dump, value, args, kwargs)
+
         if value is MISSING or value is None:
             self._fail('required')
 
@@ -528,7 +1438,7 @@ class Dict(Type):
             try:
                 result[k] = value_type.dump(v, *args, **kwargs)
             except ValidationError as ve:
-                errors_builder.add_error(k, ve.messages)
+                errors_builder.add_error(k, ve.raw_messages)
         errors_builder.raise_errors()
 
         return super(Dict, self).dump(result, *args, **kwargs)
@@ -545,6 +1455,9 @@ class Field(object):
 
     :param Type field_type: Field type.
     """
+
+    __slots__ = ('field_type',)
+
     def __init__(self, field_type):
         super(Field, self).__init__()
         self.field_type = field_type
@@ -577,6 +1490,9 @@ class ConstantField(Field):
 
     :param Type field_type: Field type.
     """
+
+    __slots__ = ('value',)
+
     def __init__(self, field_type, value):
         super(ConstantField, self).__init__(field_type)
         self.value = value
@@ -592,6 +1508,9 @@ class AttributeField(Field):
     :param str attribute: Use given attribute name instead of field name
         defined in object type.
     """
+
+    __slots__ = ('attribute',)
+
     def __init__(self, field_type, attribute=None):
         super(AttributeField, self).__init__(field_type)
         self.attribute = attribute
@@ -625,6 +1544,9 @@ class MethodField(Field):
     :param Type field_type: Field type.
     :param str method: Method name. Method should not take any arguments.
     """
+
+    __slots__ = ('method',)
+
     def __init__(self, field_type, method):
         super(MethodField, self).__init__(field_type)
         self.method = method
@@ -661,12 +1583,18 @@ class FunctionField(Field):
     :param callable function: Function that takes source object and returns
         field value.
     """
+
+    __slots__ = ('function', '_function_takes_context')
+
     def __init__(self, field_type, function):
         super(FunctionField, self).__init__(field_type)
         self.function = function
+        self._function_takes_context = takes_context(function, 2)
 
     def _get_value(self, name, obj, context=None):
-        return call_with_context(self.function, context, name, obj)
+        if self._function_takes_context:
+            return self.function(name, obj, context)
+        return self.function(name, obj)
 
 
 class Object(Type):
@@ -694,10 +1622,27 @@ class Object(Type):
         PersonType.load({'name': 'John', 'age': 42})
         # => Person(name='John', age=42)
 
+    During a single dump, an object referenced multiple times (e.g. the same
+    author of many books) is serialized once and all references share the
+    same dumped dict. An object that (directly or indirectly) references
+    itself raises :exc:`~lollipop.errors.ValidationError` with 'cycle' error
+    instead of recursing infinitely.
+
+    Passing `lazy=True` to :meth:`load` returns a mapping view over data which
+    loads fields on first access (see :mod:`lollipop.lazy`).
+
+    :meth:`validate`, :meth:`is_valid` and :meth:`iter_errors` check fields
+    without calling constructor. Object validators receive loaded field values
+    though, so if object has validators and all it's fields are valid, fields
+    are loaded before running validators (which calls constructors of nested
+    objects, but not of this object).
+
     :param dict fields: Mapping of object field names to :class:`Type` or
         :class:`Field` objects.
     :param callable contructor: Deserialized value constructor. Constructor
-        should take all fields values as keyword arguments.
+        should take all fields values as keyword arguments. Namedtuples and
+        dataclasses are called with positional arguments, which is faster.
+        Use :func:`record` to generate a compact record class from fields.
     :param Field default_field_type: Default field type to use for fields defined
         by their type.
     :param bool allow_extra_fields: If False, it will raise
@@ -706,9 +1651,16 @@ class Object(Type):
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
 
+    __slots__ = ('fields', 'constructor', 'allow_extra_fields', '_projections',
+                 '_constructor_plan')
+
+    #: Maximum number of cached projections (see :meth:`project`) per type
+    PROJECTIONS_CACHE_SIZE = 128
+
     default_error_messages = {
         'invalid': 'Value should be dict',
         'unknown': 'Unknown field',
+        'cycle': 'Object references itself',
     }
 
     def __init__(self, fields, constructor=dict,
@@ -716,14 +1668,60 @@ class Object(Type):
                  allow_extra_fields=True,
                  **kwargs):
         super(Object, self).__init__(**kwargs)
-        self.fields = dict([
+        self.fields = dict(
             (name, field if isinstance(field, Field) else default_field_type(field))
             for name, field in iteritems(fields)
-        ])
+        )
+        if isinstance(constructor, _Record):
+            constructor = constructor.make_class(list(self.fields))
         self.constructor = constructor
         self.allow_extra_fields = allow_extra_fields
+        self._projections = None
+        self._constructor_plan = None
 
     def load(self, data, *args, **kwargs):
+        if kwargs.pop('lazy', False):
+            return _load_lazy(self, data, args, kwargs)
+
+        if _has_error_limit(kwargs):
+            return self._load_with_error_limit(data, *args, **kwargs)
+
+        return self._load(data, iteritems(self.fields), *args, **kwargs)
+
+    def _load(self, data, fields, *args, **kwargs):
+        result = self._load_fields(data, fields, *args, **kwargs)
+        return self._construct(super(Object, self).load(result, *args, **kwargs))
+
+    def _get_constructor_plan(self):
+        """Returns positional call plan for constructor (see
+        :func:`_positional_plan`)."""
+        constructor = self.constructor
+        plan = self._constructor_plan
+        if plan is None or plan[0] is not constructor:
+            # Constructor can be replaced after type creation
+            plan = self._constructor_plan = \
+                (constructor, _positional_plan(constructor))
+        return plan[1]
+
+    def _construct(self, values):
+        """Calls constructor with dict of loaded field values."""
+        plan = self._get_constructor_plan()
+        if plan is not None:
+            names, getter, is_tuple = plan
+            if len(values) == len(names):
+                try:
+                    args = getter(values)
+                except KeyError:
+                    pass
+                else:
+                    if is_tuple:
+                        return tuple.__new__(self.constructor, args)
+                    return self.constructor(*args)
+        return self.constructor(**values)
+
+    def _load_fields(self, data, fields, *args, **kwargs):
+        """Loads given fields into dict without calling object validators
+        and constructor."""
         if data is MISSING or data is None:
             self._fail('required')
 
@@ -732,39 +1730,461 @@ class Object(Type):
 
         errors_builder = ValidationErrorBuilder()
         result = {}
-        for name, field in iteritems(self.fields):
+        for name, field in fields:
             try:
                 loaded = field.load(name, data, *args, **kwargs)
                 if loaded != MISSING:
                     result[name] = loaded
             except ValidationError as ve:
-                errors_builder.add_error(name, ve.messages)
+                errors_builder.add_error(name, ve.raw_messages)
 
         if not self.allow_extra_fields:
             for name in data:
                 if name not in self.fields:
-                    errors_builder.add_error(name, self._error_messages['unknown'])
+                    errors_builder.add_error(name, self._error_message('unknown'))
 
         errors_builder.raise_errors()
+        return result
 
-        return self.constructor(**super(Object, self).load(result, *args, **kwargs))
+    def _can_check_fields(self, data):
+        """Returns True if data can be validated field by field without
+        loading the whole object."""
+        return is_dict(data) and self.__class__.load == Object.load
 
-    def dump(self, obj, *args, **kwargs):
-        if obj is MISSING or obj is None:
-            self._fail('required')
+    def _load_limited(self, data, context, limit):
+        if not self._can_check_fields(data):
+            return super(Object, self)._load_limited(data, context, limit)
 
         errors_builder = ValidationErrorBuilder()
+        count = 0
         result = {}
         for name, field in iteritems(self.fields):
             try:
-                dumped = field.dump(name, obj, *args, **kwargs)
-                if dumped != MISSING:
-                    result[name] = dumped
+                if field.__class__.load == AttributeField.load:
+                    loaded = field.field_type._load_limited(
+                        data.get(name, MISSING), context, limit - count,
+                    )
+                else:
+                    loaded = field.load(name, data, context)
+                if loaded is not MISSING:
+                    result[name] = loaded
             except ValidationError as ve:
-                errors_builder.add_error(name, ve.messages)
+                errors = _limit_errors(flatten_errors(ve.raw_messages),
+                                       limit - count)
+                errors_builder.add_error(name, errors)
+                count += _count_errors(errors)
+                if count >= limit:
+                    break
+
+        if count < limit and not self.allow_extra_fields:
+            for name in data:
+                if name not in self.fields:
+                    errors_builder.add_error(name, self._error_message('unknown'))
+                    count += 1
+                    if count >= limit:
+                        break
+
         errors_builder.raise_errors()
+        return self._construct(
+            super(Object, self).load(result, context, max_errors=limit)
+        )
+
+    def _run_validators(self, data, context):
+        """Runs object validators against loaded fields.
+        Object constructor is not called."""
+        result = self._load_fields(data, iteritems(self.fields), context)
+        super(Object, self).load(result, context)
+
+    def _validate_field(self, name, field, data, context):
+        field_load = field.__class__.load
+        if field_load == Field.load:
+            return None
+        elif field_load == AttributeField.load:
+            return field.field_type.validate(data.get(name, MISSING), context)
+
+        try:
+            field.load(name, data, context)
+        except ValidationError as ve:
+            return ve.messages
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or \
+                not self._can_check_fields(data):
+            return super(Object, self).validate(
+                data, context, fail_fast=fail_fast, max_errors=max_errors,
+            )
+
+        errors_builder = ValidationErrorBuilder()
+        for name, field in iteritems(self.fields):
+            errors = self._validate_field(name, field, data, context)
+            if errors:
+                errors_builder.add_error(name, errors)
+
+        if not self.allow_extra_fields:
+            for name in data:
+                if name not in self.fields:
+                    errors_builder.add_error(name, self._error_message('unknown'))
+
+        if not errors_builder.errors and self._validators:
+            # Validators need all fields loaded
+            try:
+                self._run_validators(data, context)
+            except ValidationError as ve:
+                return ve.messages
+
+        return render_errors(errors_builder.errors) or {}
+
+    def is_valid(self, data, context=None):
+        if not self._can_check_fields(data):
+            return super(Object, self).is_valid(data, context)
+
+        for name, field in iteritems(self.fields):
+            field_load = field.__class__.load
+            if field_load == Field.load:
+                continue
+            elif field_load == AttributeField.load:
+                if not field.field_type.is_valid(data.get(name, MISSING), context):
+                    return False
+            elif self._validate_field(name, field, data, context):
+                return False
+
+        if not self.allow_extra_fields:
+            for name in data:
+                if name not in self.fields:
+                    return False
+
+        if self._validators:
+            # Validators need all fields loaded
+            try:
+                self._run_validators(data, context)
+            except ValidationError:
+                return False
+
+        return True
+
+    def iter_errors(self, data, context=None):
+        if not self._can_check_fields(data):
+            for error in super(Object, self).iter_errors(data, context):
+                yield error
+            return
+
+        has_errors = False
+        for name, field in iteritems(self.fields):
+            field_load = field.__class__.load
+            if field_load == Field.load:
+                continue
+            elif field_load == AttributeField.load:
+                errors = field.field_type.iter_errors(
+                    data.get(name, MISSING), context,
+                )
+            else:
+                errors = _iter_field_errors(field, name, data, context)
+
+            for path, message in errors:
+                has_errors = True
+                yield _error_path(name) + path, message
+
+        if not self.allow_extra_fields:
+            for name in data:
+                if name not in self.fields:
+                    has_errors = True
+                    yield _error_path(name), \
+                        render_errors(self._error_message('unknown'))
+
+        if not has_errors and self._validators:
+            # Validators need all fields loaded
+            try:
+                self._run_validators(data, context)
+            except ValidationError as ve:
+                for error in flatten_errors(ve.messages):
+                    yield error
+
+    def dump(self, obj, *args, **kwargs):
+        """Serialize object to a dict of field values.
+
+        :param obj: Object to serialize.
+        :param context: Context data.
+        :param list only: Names of fields to serialize; nested fields are
+            specified with dotted paths (e.g. 'author.name').
+            See :meth:`project`.
+        :param list exclude: Names of fields (or dotted paths of nested fields)
+            to skip.
+        """
+        if kwargs:
+            only = kwargs.pop('only', None)
+            exclude = kwargs.pop('exclude', None)
+            if only is not None or exclude is not None:
+                return self.project(only, exclude).dump(obj, *args, **kwargs)
+        return self._dump(obj, iteritems(self.fields), *args, **kwargs)
+
+    def project(self, only=None, exclude=None):
+        """Returns a copy of this type which dumps only given subset of
+        fields. Fields of nested objects (including objects inside
+        :class:`List`, :class:`Optional` and other wrapper types) are selected
+        with dotted paths. Fields that are not selected are not accessed at
+        all. Projections are cached per distinct set of fields.
+
+        Example: ::
+
+            BookType.project(only=['title', 'author.name'])
+            BookType.dump(book, only=['title', 'author.name'])  # same thing
+
+        :param list only: Field names or paths to keep. If None, keep all
+            fields. Selecting an object field without nested paths keeps all
+            of it's fields.
+        :param list exclude: Field names or paths to remove.
+        :raises ValueError: If path refers to unknown field or goes through
+            a type which fields can't be selected.
+        """
+        key = (_freeze_paths(only), _freeze_paths(exclude))
+        if self._projections is None:
+            self._projections = _LRUCache(self.PROJECTIONS_CACHE_SIZE)
+
+        projection = self._projections.get(key)
+        if projection is MISSING:
+            projection = _project(
+                self,
+                None if only is None else _paths_tree(key[0]),
+                None if exclude is None else _paths_tree(key[1]),
+                (),
+            )
+            self._projections.set(key, projection)
+        return projection
+
+    def _dump(self, obj, fields, *args, **kwargs):
+        if obj is MISSING or obj is None:
+            self._fail('required')
+
+        memo = _dump_state.memo
+        if memo is None:
+            return _with_dump_memo(self._dump, obj, (fields,) + args, kwargs)
+
+        # Object referenced multiple times is dumped once (memo also keeps
+        # reference to object, so that it's id is not reused during dump)
+        key = (id(obj), id(self))
+        entry = memo.get(key)
+        if entry is not None:
+            if entry[1] is _DUMPING:
+                self._fail('cycle')
+            return entry[1]
+
+        entry = memo[key] = [obj, _DUMPING]
+        try:
+            errors_builder = ValidationErrorBuilder()
+            result = {}
+            for name, field in fields:
+                try:
+                    dumped = field.dump(name, obj, *args, **kwargs)
+                    if dumped != MISSING:
+                        result[name] = dumped
+                except ValidationError as ve:
+                    errors_builder.add_error(name, ve.raw_messages)
+            errors_builder.raise_errors()
+
+            result = super(Object, self).dump(result, *args, **kwargs)
+        except BaseException:
+            del memo[key]
+            raise
+
+        entry[1] = result
+        return result
+
+    def _load_many(self, data, context):
+        if self.__class__.load != Object.load or \
+                hasattr(Type.load, '_original_method'):
+            # Overridden load or profiling hooks (see lollipop.instrument),
+            # which should see every call
+            return super(Object, self)._load_many(data, context)
+        return _process_many(self._batch_loader(), data, context)
+
+    def _batch_loader(self):
+        """Returns function which loads data the same way as :meth:`load`,
+        but with fields, their load methods and validators resolved once
+        for a batch of items."""
+        fields = []
+        for name, field in iteritems(self.fields):
+            if field.__class__.load == AttributeField.load:
+                fields.append((name, True, field.field_type.load))
+            else:
+                fields.append((name, False, field.load))
+        known_fields = None if self.allow_extra_fields else set(self.fields)
+        validate = self._validator_plans and super(Object, self).load
+        construct = self._construct
+        fail = self._fail
+
+        def load(data, context):
+            if data is MISSING or data is None:
+                fail('required')
+
+            if not is_dict(data):
+                fail('invalid')
+
+            errors_builder = None
+            result = {}
+            for name, is_attribute, field_load in fields:
+                try:
+                    if is_attribute:
+                        loaded = field_load(data.get(name, MISSING), context)
+                    else:
+                        loaded = field_load(name, data, context)
+                    if loaded is not MISSING:
+                        result[name] = loaded
+                except ValidationError as ve:
+                    if errors_builder is None:
+                        errors_builder = ValidationErrorBuilder()
+                    errors_builder.add_error(name, ve.raw_messages)
+
+            if known_fields is not None:
+                for name in data:
+                    if name not in known_fields:
+                        if errors_builder is None:
+                            errors_builder = ValidationErrorBuilder()
+                        errors_builder.add_error(
+                            name, self._error_message('unknown'),
+                        )
+
+            if errors_builder is not None:
+                errors_builder.raise_errors()
+            if validate:
+                result = validate(result, context)
+            return construct(result)
+        return load
+
+    def _dump_many(self, values, context):
+        if self.__class__.dump != Object.dump:
+            return super(Object, self)._dump_many(values, context)
+
+        fields = list(iteritems(self.fields))
+        # Objects shared between items are dumped once
+        return _with_dump_memo(_process_many, (
+            lambda item, context: self._dump(item, fields, context)
+        ), (values, context), {})
+
+    def load_stream(self, fp, stream_path, on_item, context=None,
+                    errors='raise', **kwargs):
+        """Incrementally load JSON document from file object passing items of
+        list at `stream_path` to `on_item` callback as soon as they are parsed.
+        Returns dict of other loaded fields.
+        See :func:`lollipop.streaming.load_stream` for details.
+
+        :param fp: File object to read JSON from.
+        :param str stream_path: '.'-separated path to list field to stream.
+        :param callable on_item: Function that is called with each loaded item.
+        :param context: Context data.
+        :param str errors: Either 'raise' or 'yield'.
+        """
+        from lollipop.streaming import load_stream
+        return load_stream(self, fp, stream_path, on_item, context=context,
+                           errors=errors, **kwargs)
+
+    def dump_columns(self, values, context=None, array_type=None):
+        """Serialize sequence of objects into columns: a dict of field names
+        to lists of serialized field values of all objects. Objects are
+        traversed once and values are obtained with the same fields as
+        :meth:`dump` uses. Values that were serialized to :obj:`MISSING`
+        are kept as :obj:`MISSING` so that all columns have the same length.
+        Fields of :class:`LoadOnly` type are omitted.
 
-        return super(Object, self).dump(result, *args, **kwargs)
+        Example: ::
+
+            PersonType.dump_columns([Person('John', 42), Person('Jane', 37)])
+            # => {'name': ['John', 'Jane'], 'age': [42, 37]}
+
+        :param iterable values: Objects to serialize.
+        :param context: Context data.
+        :param str array_type: If given, columns of :class:`Integer`,
+            :class:`Float` and :class:`Boolean` fields will be stored in
+            compact arrays. Either 'array' (for :class:`array.array`) or
+            'numpy' (for :class:`numpy.ndarray`, requires numpy).
+        :raises: :exc:`~lollipop.errors.ValidationError` with errors keyed by
+            object index if any object fails to serialize.
+        """
+        if array_type not in (None, 'array', 'numpy'):
+            raise ValueError('Unknown array type: %s' % array_type)
+
+        if self.__class__.dump != Object.dump:
+            return _columns_from_rows(self, values, context, array_type)
+
+        columns = {}
+        plan = []
+        for name, field in iteritems(self.fields):
+            if isinstance(field.field_type, LoadOnly):
+                continue
+            typecode = array_type and \
+                _COLUMN_TYPECODES.get(field.field_type.__class__)
+            columns[name] = array.array(typecode) if typecode else []
+            plan.append((name, field))
+
+        errors = {}
+        for idx, obj in enumerate(values):
+            if obj is MISSING or obj is None:
+                try:
+                    self._fail('required')
+                except ValidationError as ve:
+                    errors[idx] = ve.raw_messages
+                continue
+
+            errors_builder = ValidationErrorBuilder()
+            for name, field in plan:
+                try:
+                    dumped = field.dump(name, obj, context)
+                except ValidationError as ve:
+                    errors_builder.add_error(name, ve.raw_messages)
+                    continue
+
+                try:
+                    columns[name].append(dumped)
+                except OverflowError:
+                    # Value does not fit into array, fall back to list
+                    columns[name] = column = list(columns[name])
+                    column.append(dumped)
+
+            if errors_builder.errors:
+                errors[idx] = errors_builder.errors
+
+        if errors:
+            raise ValidationError(errors)
+
+        if array_type == 'numpy':
+            from lollipop.arrays import array_to_numpy
+            for name, column in iteritems(columns):
+                if isinstance(column, array.array):
+                    columns[name] = array_to_numpy(column)
+
+        return columns
+
+
+#: Array typecodes for columns of simple types in columnar dumps
+_COLUMN_TYPECODES = {
+    Integer: 'q',
+    Float: 'd',
+    Boolean: 'b',
+}
+
+
+def _columns_from_rows(object_type, values, context, array_type):
+    """Pivots serialized objects into columns. Used for :class:`Object` types
+    that override :meth:`Object.dump`."""
+    rows, errors = object_type.dump_many(values, context)
+    if errors:
+        raise ValidationError(errors)
+
+    columns = {}
+    for name, field in iteritems(object_type.fields):
+        if isinstance(field.field_type, LoadOnly):
+            continue
+        column = [row.get(name, MISSING) for row in rows]
+        typecode = array_type and _COLUMN_TYPECODES.get(field.field_type.__class__)
+        if typecode:
+            try:
+                column = array.array(typecode, column)
+            except (OverflowError, TypeError):
+                pass
+        if array_type == 'numpy' and isinstance(column, array.array):
+            from lollipop.arrays import array_to_numpy
+            column = array_to_numpy(column)
+        columns[name] = column
+    return columns
 
 
 class Optional(Type):
@@ -788,6 +2208,9 @@ class Optional(Type):
     :param dump_default: Value to use when value is missing on serialization.
     :param kwargs: Same keyword arguments as for :class:`Type`.
     """
+
+    __slots__ = ('inner_type', 'load_default', 'dump_default')
+
     def __init__(self, inner_type,
                  load_default=None, dump_default=None,
                  **kwargs):
@@ -804,6 +2227,43 @@ class Optional(Type):
             *args, **kwargs
         )
 
+    def _load_limited(self, data, context, limit):
+        if data is MISSING or data is None or \
+                self.__class__.load != Optional.load:
+            return super(Optional, self)._load_limited(data, context, limit)
+        return super(Optional, self).load(
+            self.inner_type._load_limited(data, context, limit),
+            context, max_errors=limit,
+        )
+
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        if _error_limit(fail_fast, max_errors) is not None or self._validators:
+            return super(Optional, self).validate(
+                data, context, fail_fast=fail_fast, max_errors=max_errors,
+            )
+        if data is MISSING or data is None:
+            return {}
+        return self.inner_type.validate(data, context)
+
+    def is_valid(self, data, context=None):
+        if self._validators:
+            return super(Optional, self).is_valid(data, context)
+        return data is MISSING or data is None or \
+            self.inner_type.is_valid(data, context)
+
+    def iter_errors(self, data, context=None):
+        if data is MISSING or data is None:
+            return
+
+        has_errors = False
+        for error in self.inner_type.iter_errors(data, context):
+            has_errors = True
+            yield error
+
+        if not has_errors and self._validators:
+            for error in super(Optional, self).iter_errors(data, context):
+                yield error
+
     def dump(self, data, *args, **kwargs):
         if data is MISSING or data is None:
             return self.dump_default
@@ -832,6 +2292,9 @@ class LoadOnly(Type):
 
     :param Type inner_type: Data type.
     """
+
+    __slots__ = ('inner_type',)
+
     def __init__(self, inner_type):
         super(LoadOnly, self).__init__()
         self.inner_type = inner_type
@@ -839,6 +2302,17 @@ class LoadOnly(Type):
     def load(self, data, *args, **kwargs):
         return self.inner_type.load(data, *args, **kwargs)
 
+    def validate(self, data, context=None, fail_fast=False, max_errors=None):
+        return self.inner_type.validate(
+            data, context, fail_fast=fail_fast, max_errors=max_errors,
+        )
+
+    def is_valid(self, data, context=None):
+        return self.inner_type.is_valid(data, context)
+
+    def iter_errors(self, data, context=None):
+        return self.inner_type.iter_errors(data, context)
+
     def dump(self, data, context=None):
         return MISSING
 
@@ -862,6 +2336,9 @@ class DumpOnly(Type):
 
     :param Type inner_type: Data type.
     """
+
+    __slots__ = ('inner_type',)
+
     def __init__(self, inner_type):
         super(DumpOnly, self).__init__()
         self.inner_type = inner_type
@@ -877,3 +2354,419 @@ class DumpOnly(Type):
             klass=self.__class__.__name__,
             inner_type=repr(self.inner_type),
         )
+
+
+def _positional_plan(constructor):
+    """If constructor is a namedtuple or a dataclass, returns tuple of
+    names of it's arguments in positional order, function that extracts them
+    from dict into a tuple and flag whether tuple can be used as constructed
+    value as is (for namedtuples that do not override `__new__`). Otherwise
+    returns None."""
+    if not inspect.isclass(constructor):
+        return None
+
+    if issubclass(constructor, tuple) and hasattr(constructor, '_fields'):
+        names = tuple(constructor._fields)
+        namedtuple_class = next(klass for klass in constructor.__mro__
+                                if '_fields' in vars(klass))
+        is_tuple = constructor.__new__ is namedtuple_class.__new__ and \
+            constructor.__init__ is tuple.__init__
+        if not is_tuple and not _takes_positional_args(constructor, names):
+            return None
+    elif dataclasses is not None and dataclasses.is_dataclass(constructor):
+        names = tuple(field.name for field in dataclasses.fields(constructor)
+                      if field.init)
+        is_tuple = False
+        if not _takes_positional_args(constructor, names):
+            return None
+    else:
+        return None
+
+    if not names:
+        return None
+    elif len(names) == 1:
+        name = names[0]
+        getter = lambda values: (values[name],)
+    else:
+        getter = operator.itemgetter(*names)
+    return names, getter, is_tuple
+
+
+def _takes_positional_args(func, names):
+    """Returns True if callable takes exactly given arguments which can be
+    passed positionally."""
+    try:
+        parameters = inspect.signature(func).parameters.values()
+    except (AttributeError, TypeError, ValueError):
+        return False
+    return tuple(
+        parameter.name for parameter in parameters
+        if parameter.kind == parameter.POSITIONAL_OR_KEYWORD
+    ) == names and len(parameters) == len(names)
+
+
+class _Record(object):
+    __slots__ = ('name', 'module')
+
+    def __init__(self, name, module=None):
+        self.name = name
+        self.module = module
+
+    def make_class(self, field_names):
+        klass = collections.namedtuple(self.name, field_names)
+        # Fields which were not loaded default to None
+        klass.__new__.__defaults__ = (None,) * len(field_names)
+        if self.module is not None:
+            klass.__module__ = self.module
+        return klass
+
+    def __repr__(self):
+        return 'record(%r)' % self.name
+
+
+def record(name, module=None):
+    """Object constructor which makes :class:`Object` generate a record class
+    with given name and attributes named after object fields. Record class is
+    a :func:`~collections.namedtuple` (a tuple subclass without instance
+    dict), so records take less memory and are faster to create than regular
+    objects. Fields without loaded value are set to None. Generated class is
+    available as type's `constructor` attribute.
+
+    Example: ::
+
+        BookType = Object({
+            'title': String(),
+            'author': String(),
+        }, constructor=record('Book'))
+
+        BookType.load({'title': 'Moby Dick', 'author': 'Herman Melville'})
+        # => Book(title='Moby Dick', author='Herman Melville')
+
+    :param str name: Record class name.
+    :param str module: Module name to set on record class. Records can be
+        pickled if generated class is also assigned to a module attribute
+        with the same name.
+    """
+    return _Record(name, module)
+
+
+def _freeze_paths(paths):
+    if paths is None:
+        return None
+    if isinstance(paths, string_types):
+        paths = [paths]
+    return frozenset(paths)
+
+
+def _paths_tree(paths):
+    """Converts dotted field paths into a tree of nested dicts. Value is None
+    for fields selected as a whole."""
+    tree = {}
+    for path in paths:
+        node = tree
+        names = path.split('.')
+        for name in names[:-1]:
+            if node.get(name, {}) is None:
+                break  # Whole field is already selected
+            node = node.setdefault(name, {})
+        else:
+            node[names[-1]] = None
+    return tree
+
+
+def _project(type, only, exclude, path):
+    """Returns copy of type with fields selected by `only` and `exclude`
+    trees (see :func:`_paths_tree`)."""
+    if isinstance(type, Object):
+        for names in (only, exclude):
+            for name in names or ():
+                if name not in type.fields:
+                    raise ValueError('Unknown field: %s' %
+                                     '.'.join(path + (name,)))
+
+        fields = {}
+        for name, field in iteritems(type.fields):
+            field_only = None
+            if only is not None:
+                if name not in only:
+                    continue
+                field_only = only[name]
+
+            field_exclude = None
+            if exclude is not None and name in exclude:
+                field_exclude = exclude[name]
+                if field_exclude is None:
+                    continue
+
+            if field_only is not None or field_exclude is not None:
+                field = copy.copy(field)
+                field.field_type = _project(field.field_type, field_only,
+                                            field_exclude, path + (name,))
+            fields[name] = field
+
+        projection = copy.copy(type)
+        projection.fields = fields
+        projection._projections = None
+        return projection
+
+    if isinstance(type, Cached):
+        # Cache of projected type should not be shared with original type
+        return Cached(_project(type.inner_type, only, exclude, path),
+                      maxsize=type.maxsize, ttl=type.ttl)
+
+    if isinstance(type, List):
+        projection = copy.copy(type)
+        projection.item_type = _project(type.item_type, only, exclude, path)
+        return projection
+
+    if isinstance(type, (Optional, LoadOnly, DumpOnly)):
+        projection = copy.copy(type)
+        projection.inner_type = _project(type.inner_type, only, exclude, path)
+        return projection
+
+    raise ValueError('Can not select fields of %s: %r' %
+                     ('.'.join(path), type))
+
+
+def _inner_types(type):
+    """Returns list of types nested directly in given type."""
+    if isinstance(type, List):
+        return [type.item_type]
+    elif isinstance(type, Tuple):
+        return list(type.item_types)
+    elif isinstance(type, Dict):
+        value_types = type.value_types
+        if isinstance(value_types, DictWithDefault):
+            return list(value_types.values.values()) + [value_types.default]
+        elif isinstance(value_types, dict):
+            return list(value_types.values())
+        return []
+    elif isinstance(type, Object):
+        return [field.field_type for field in type.fields.values()]
+    return [getattr(type, 'inner_type', None)]
+
+
+def _uses_context(type, seen=None):
+    """Returns True if type or any of it's inner types has validators
+    (or fields) that take context argument."""
+    if not isinstance(type, Type):
+        return False
+
+    seen = seen or set()
+    if id(type) in seen:
+        return False
+    seen.add(id(type))
+
+    for validator, with_context in type._validator_plans:
+        if isinstance(validator, Predicate):
+            # Predicate takes context argument, but may not use it
+            with_context = validator._predicate_takes_context
+        if with_context:
+            return True
+
+    if isinstance(type, Object):
+        for field in type.fields.values():
+            if isinstance(field, MethodField) or \
+                    getattr(field, '_function_takes_context', False):
+                return True
+
+    return any(_uses_context(inner_type, seen)
+               for inner_type in _inner_types(type))
+
+
+def _cache_key(value):
+    """Returns cache key for value or None if value can not be cached."""
+    klass = value.__class__
+    if klass.__hash__ is object.__hash__:
+        # Hashed by identity, so value can be mutated
+        return None
+    if isinstance(value, tuple):
+        items = []
+        for item in value:
+            key = _cache_key(item)
+            if key is None:
+                return None
+            items.append(key)
+        return (klass, tuple(items))
+    try:
+        hash(value)
+    except TypeError:
+        return None
+    return (klass, value)
+
+
+try:
+    _monotonic = time.monotonic
+except AttributeError:  # Python 2
+    _monotonic = time.time
+
+
+class _LRUCache(object):
+    """Thread-safe LRU cache with optional entry expiration.
+    Pickles into an empty cache."""
+
+    __slots__ = ('maxsize', 'ttl', '_entries', '_lock')
+
+    def __init__(self, maxsize=None, ttl=None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Returns cached value or :obj:`MISSING`."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is None:
+                return MISSING
+            value, expires_at = entry
+            if expires_at is not None and expires_at <= _monotonic():
+                return MISSING
+            # Reinsert to mark entry as most recently used
+            self._entries[key] = entry
+            return value
+
+    def set(self, key, value):
+        expires_at = None if self.ttl is None else _monotonic() + self.ttl
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (value, expires_at)
+            if self.maxsize is not None:
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __reduce__(self):
+        return (self.__class__, (self.maxsize, self.ttl))
+
+
+#: Cache statistics returned by :meth:`Cached.cache_info`
+CacheInfo = collections.namedtuple(
+    'CacheInfo', ['hits', 'misses', 'bypassed', 'maxsize', 'currsize'],
+)
+
+
+class Cached(Type):
+    """A wrapper type which memoizes results of loading and dumping with
+    inner type, including validation errors. Useful for values that repeat
+    a lot (e.g. country codes, enum strings or date strings). Least recently
+    used results are evicted once cache is full.
+
+    Example: ::
+
+        PaymentType = Object({
+            'currency': Cached(String(validate=AnyOf(CURRENCIES)), maxsize=256),
+            'amount': Float(),
+        })
+
+    Only hashable values (including tuples of hashable values) are cached;
+    other values and values hashed by identity (e.g. instances of classes
+    that do not define `__hash__`, which can be mutated) are passed to inner
+    type as is. Calls with context also bypass cache if inner type has
+    validators or fields that take context. Loaded and dumped values are
+    shared between calls, so inner type should produce immutable values.
+
+    :param Type inner_type: Type which results should be cached.
+    :param int maxsize: Maximum number of cached results (separately for
+        loading and dumping). If None, cache is not limited.
+    :param float ttl: Number of seconds cached results stay valid.
+        If None, results do not expire.
+    :param kwargs: Same keyword arguments as for :class:`Type`.
+    """
+
+    __slots__ = ('inner_type', '_load_cache', '_dump_cache', '_uses_context',
+                 '_hits', '_misses', '_bypassed')
+
+    def __init__(self, inner_type, maxsize=1024, ttl=None, **kwargs):
+        super(Cached, self).__init__(**kwargs)
+        self.inner_type = inner_type
+        self._load_cache = _LRUCache(maxsize, ttl)
+        self._dump_cache = _LRUCache(maxsize, ttl)
+        self._uses_context = None
+        self._hits = self._misses = self._bypassed = 0
+
+    @property
+    def maxsize(self):
+        return self._load_cache.maxsize
+
+    @property
+    def ttl(self):
+        return self._load_cache.ttl
+
+    def _cached(self, cache, func, data, context, args, kwargs):
+        key = None
+        if not args and not kwargs:
+            key = _cache_key(data)
+        if key is not None and context is not None:
+            if self._uses_context is None:
+                self._uses_context = _uses_context(self)
+            if self._uses_context:
+                key = None
+
+        if key is None:
+            self._bypassed += 1
+            return func(data, context, *args, **kwargs)
+
+        result = cache.get(key)
+        if result is MISSING:
+            self._misses += 1
+            try:
+                result = (func(data, context), None)
+            except ValidationError as ve:
+                result = (None, ve.raw_messages)
+            cache.set(key, result)
+        else:
+            self._hits += 1
+
+        value, errors = result
+        if errors is not None:
+            raise ValidationError(errors)
+        return value
+
+    def _load(self, data, context=None, *args, **kwargs):
+        return super(Cached, self).load(
+            self.inner_type.load(data, context, *args, **kwargs),
+            context, *args, **kwargs
+        )
+
+    def _dump(self, value, context=None, *args, **kwargs):
+        return super(Cached, self).dump(
+            self.inner_type.dump(value, context, *args, **kwargs),
+            context, *args, **kwargs
+        )
+
+    def load(self, data, context=None, *args, **kwargs):
+        return self._cached(self._load_cache, self._load,
+                            data, context, args, kwargs)
+
+    def dump(self, value, context=None, *args, **kwargs):
+        return self._cached(self._dump_cache, self._dump,
+                            value, context, args, kwargs)
+
+    def cache_info(self):
+        """Returns :class:`CacheInfo` with number of cache hits, misses and
+        calls that bypassed cache (for loading and dumping combined),
+        maximum number of cached results and current number of cached
+        results (for loading and dumping combined)."""
+        return CacheInfo(
+            self._hits, self._misses, self._bypassed, self.maxsize,
+            len(self._load_cache) + len(self._dump_cache),
+        )
+
+    def cache_clear(self):
+        """Clears cached results and statistics."""
+        self._load_cache.clear()
+        self._dump_cache.clear()
+        self._hits = self._misses = self._bypassed = 0
+
+    def __repr__(self):
+        return '<{klass} {inner_type}>'.format(
+            klass=self.__class__.__name__,
+            inner_type=repr(self.inner_type),
+        )
@@ -1,4 +1,10 @@
 import inspect
+import weakref
+
+try:
+    from inspect import getfullargspec as getargspec
+except ImportError:  # Python 2
+    from inspect import getargspec
 
 
 def is_list(value):
@@ -11,20 +17,144 @@ def is_dict(value):
     return isinstance(value, dict)
 
 
+#: Argument counts declared with :func:`register_arg_count`
+_registered_arg_counts = {}
+#: Cache of argument counts obtained through introspection
+_arg_counts = weakref.WeakKeyDictionary()
+
+
+def _arg_count_key(func):
+    """Returns key to register and cache argument count of given callable
+    under or None if it can't be cached. Bound methods share key with their
+    function: counts are stored as for the function (including ``self``),
+    see :func:`_method_offset`."""
+    if inspect.ismethod(func):
+        return func.__func__
+    elif inspect.isfunction(func):
+        return func
+    elif inspect.isclass(func):
+        return None
+
+    call = getattr(func.__class__, '__call__', None)
+    if inspect.isfunction(getattr(call, '__func__', call)):
+        return func.__class__
+    # Builtin callables share class with each other, so they can't be cached
+    return None
+
+
+def _method_offset(func):
+    """Returns number of arguments bound method takes less than it's function
+    (the bound ``self``) or 0 for other callables."""
+    return 1 if inspect.ismethod(func) else 0
+
+
+def register_arg_count(func, count):
+    """Declare number of positional arguments given function takes, so it
+    does not need to be introspected. If given a class, declared number applies
+    to all callable instances of that class and it's subclasses.
+
+    Example: ::
+
+        class UniqueEmail(Validator):
+            def __call__(self, value, *args):
+                context = args[0]
+                ...
+
+        register_arg_count(UniqueEmail, 2)
+
+    :param callable func: Function, method or class of callable objects.
+    :param int count: Number of positional arguments (excluding ``self``).
+    """
+    if not inspect.isclass(func):
+        count += _method_offset(func)
+        func = _arg_count_key(func) or func
+    _registered_arg_counts[func] = count
+    _arg_counts.clear()
+
+
+def _introspect_arg_count(func):
+    try:
+        return _registered_arg_counts[_arg_count_key(func) or func] - \
+            _method_offset(func)
+    except (KeyError, TypeError):
+        pass
+
+    if inspect.ismethod(func):
+        return len(getargspec(func).args) - 1
+    elif inspect.isfunction(func):
+        return len(getargspec(func).args)
+
+    for klass in func.__class__.__mro__:
+        if klass in _registered_arg_counts:
+            return _registered_arg_counts[klass]
+
+    try:
+        return len(getargspec(func.__call__).args) - 1
+    except TypeError:
+        # Builtin callables can not be introspected
+        return 0
+
+
+def get_arg_count(func):
+    """Returns number of positional arguments given callable takes (excluding
+    ``self`` for methods and callable objects). Results are cached per function
+    (or per class for callable objects).
+
+    :param callable func: Function, method or callable object.
+    """
+    key = _arg_count_key(func)
+    if key is None:
+        return _introspect_arg_count(func)
+
+    offset = _method_offset(func)
+    try:
+        return _arg_counts[key] - offset
+    except KeyError:
+        pass
+
+    count = _introspect_arg_count(func)
+    _arg_counts[key] = count + offset
+    return count
+
+
+def _function(method):
+    """Returns function implementing given method, so that methods can be
+    compared to find out whether a class overrides them."""
+    func = getattr(method, '__func__', method)
+    # Methods replaced by lollipop.instrument keep original function
+    return getattr(func, '_original_method', func)
+
+
+def takes_context(func, args_count):
+    """Returns True if given function takes more than `args_count` positional
+    arguments, so extra context argument should be passed to it.
+
+    :param callable func: Function, method or callable object.
+    :param int args_count: Number of arguments function is called with.
+    """
+    return get_arg_count(func) > args_count
+
+
 def call_with_context(func, context, *args):
     """
     Check if given function has more arguments than given. Call it with context
     as last argument or without it.
     """
-    if inspect.ismethod(func):
-        arg_count = len(inspect.getargspec(func).args) - 1
-    elif inspect.isfunction(func):
-        arg_count = len(inspect.getargspec(func).args)
-    else:
-        arg_count = len(inspect.getargspec(func.__call__).args) - 1
-
-    if len(args) < arg_count:
-        args = list(args)
-        args.append(context)
+    if takes_context(func, len(args)):
+        args = args + (context,)
 
     return func(*args)
+
+
+def is_coroutine_function(func):
+    """Returns True if given function (or callable object) is a coroutine
+    function, i.e. calling it returns an awaitable to be run with asyncio.
+
+    :param callable func: Function, method or callable object.
+    """
+    iscoroutinefunction = getattr(inspect, 'iscoroutinefunction', None)
+    if iscoroutinefunction is None:  # Python 2
+        return False
+    if inspect.isfunction(func) or inspect.ismethod(func):
+        return iscoroutinefunction(func)
+    return iscoroutinefunction(getattr(func, '__call__', None))
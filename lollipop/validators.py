@@ -1,6 +1,7 @@
-from lollipop.errors import ValidationError, ErrorMessagesMixin
-from lollipop.compat import string_types
-from lollipop.utils import call_with_context
+from lollipop.errors import ValidationError, ValidationErrorBuilder, \
+    ErrorMessagesMixin
+from lollipop.compat import string_types, iteritems
+from lollipop.utils import takes_context
 import re
 
 
@@ -15,12 +16,26 @@ class Validator(ErrorMessagesMixin, object):
     ignored.
     """
 
+    __slots__ = ()
+
     def __call__(self, value, context=None):
         """Validate value. In case of errors, raise
         :exc:`~lollipop.errors.ValidationError`. Return value is always ignored.
         """
         raise NotImplemented()
 
+    def _condition(self):
+        """Returns inline check of a valid value for fused validation
+        (see :class:`_FusedValidator`) as tuple of evaluation cost, Python
+        expression template (with ``{data}``, ``{context}`` and numbered
+        constant placeholders) and list of constants. Expression should read
+        validator parameters from validator itself (passed as a constant),
+        so that changing them later takes effect. Cost is None for checks
+        that should be evaluated once and in validators order (their failure
+        raises validator's 'invalid' error). Returns None if validator can not
+        be fused."""
+        return None
+
 
 class Predicate(Validator):
     """Validator that succeeds if given predicate returns True.
@@ -33,6 +48,8 @@ class Predicate(Validator):
         Can be interpolated with ``data``.
     """
 
+    __slots__ = ('predicate', '_predicate_takes_context', 'error')
+
     default_error_messages = {
         'invalid': 'Invalid data',
     }
@@ -40,14 +57,24 @@ class Predicate(Validator):
     def __init__(self, predicate, error=None, **kwargs):
         super(Predicate, self).__init__(**kwargs)
         self.predicate = predicate
+        self._predicate_takes_context = takes_context(predicate, 1)
         if error is not None:
-            self._error_messages['invalid'] = error
+            self._set_error_message('invalid', error)
         self.error = error
 
     def __call__(self, value, context=None):
-        if not call_with_context(self.predicate, context, value):
+        if self._predicate_takes_context:
+            valid = self.predicate(value, context)
+        else:
+            valid = self.predicate(value)
+        if not valid:
             self._fail('invalid', data=value)
 
+    def _condition(self):
+        if self._predicate_takes_context:
+            return (None, '{0}.predicate({data}, {context})', [self])
+        return (None, '{0}.predicate({data})', [self])
+
     def __repr__(self):
         return '<{klass} predicate={predicate} error={error}>'.format(
             klass=self.__class__.__name__,
@@ -64,6 +91,8 @@ class Range(Validator):
         Can be interpolated with ``data``, ``min`` or ``max``.
     """
 
+    __slots__ = ('min', 'max')
+
     default_error_messages = {
         'min': 'Value should be at least {min}',
         'max': 'Value should be at most {max}',
@@ -89,6 +118,10 @@ class Range(Validator):
             if value > self.max:
                 self._fail('max', data=value)
 
+    def _condition(self):
+        return (0, '({0}.min is None or not {data} < {0}.min) and '
+                   '({0}.max is None or not {data} > {0}.max)', [self])
+
     def __repr__(self):
         return '<{klass} {properties}>'.format(
             klass= self.__class__.__name__,
@@ -109,6 +142,9 @@ class Length(Validator):
     :param str error: Error message in case of validation error.
         Can be interpolated with ``data``, ``length``, ``exact``, ``min`` or ``max``.
     """
+
+    __slots__ = ('exact', 'min', 'max')
+
     default_error_messages = {
         'exact': 'Length should be {exact}',
         'min': 'Length should be at least {min}',
@@ -127,19 +163,50 @@ class Length(Validator):
                                   **kwargs)
 
     def __call__(self, value):
-        length = len(value)
+        self.validate_length(len(value), data=value)
+
+    def validate_length(self, length, data=None):
+        """Validate length of a sequence without having the sequence itself.
+        Useful for validating streams.
+
+        :param int length: Sequence length.
+        :param data: Sequence to interpolate into error messages.
+        """
         if self.exact is not None:
             if length != self.exact:
-                self._fail('exact', data=value, length=length)
+                self._fail('exact', data=data, length=length)
         elif self.min is not None and self.max is not None:
             if length < self.min or length > self.max:
-                self._fail('range', data=value, length=length)
+                self._fail('range', data=data, length=length)
         elif self.min is not None:
             if length < self.min:
-                self._fail('min', data=value, length=length)
+                self._fail('min', data=data, length=length)
         elif self.max is not None:
             if length > self.max:
-                self._fail('max', data=value, length=length)
+                self._fail('max', data=data, length=length)
+
+    def validate_partial_length(self, length, data=None):
+        """Validate that a sequence which already has `length` items can still
+        have valid length (i.e. it is not too long). Useful for validating
+        streams as they are consumed.
+
+        :param int length: Number of sequence items seen so far.
+        :param data: Data to interpolate into error messages.
+        """
+        if self.exact is not None:
+            if length > self.exact:
+                self._fail('exact', data=data, length=length)
+        elif self.max is not None and length > self.max:
+            self._fail('range' if self.min is not None else 'max',
+                       data=data, length=length)
+
+    def _condition(self):
+        if self.__class__.validate_length is not Length.validate_length:
+            return None
+
+        return (1, 'len({data}) == {0}.exact if {0}.exact is not None else '
+                   '({0}.min is None or len({data}) >= {0}.min) and '
+                   '({0}.max is None or len({data}) <= {0}.max)', [self])
 
     def __repr__(self):
         if self.exact is not None:
@@ -151,14 +218,60 @@ class Length(Validator):
             super(Length, self).__repr__()
 
 
+class _Members(object):
+    """Fast membership test for given values. Lists and tuples are converted
+    into a frozenset (unhashable items are kept aside and compared one by one),
+    so that test takes constant time. Other containers (e.g. sets, dicts or
+    ranges) are tested as is. Attribute `lookup` holds the fastest container
+    to test membership with."""
+
+    __slots__ = ('values', 'hashable', 'unhashable', 'lookup')
+
+    def __init__(self, values):
+        self.values = values
+        self.hashable = None
+        self.unhashable = ()
+        self.lookup = values
+        if not isinstance(values, (list, tuple)):
+            return
+
+        hashable = []
+        unhashable = []
+        for value in values:
+            try:
+                hash(value)
+                hashable.append(value)
+            except TypeError:
+                unhashable.append(value)
+        self.hashable = frozenset(hashable)
+        self.unhashable = tuple(unhashable)
+        self.lookup = self if self.unhashable else self.hashable
+
+    def __contains__(self, value):
+        if self.hashable is None:
+            return value in self.values
+
+        try:
+            if value in self.hashable:
+                return True
+        except TypeError:
+            # Unhashable value: compare with all values
+            return value in self.values
+        return bool(self.unhashable) and value in self.unhashable
+
+
 class NoneOf(Validator):
     """Validator that succeeds if ``value`` is not a member of given ``values``.
+    Lists and tuples of values are converted into a set on construction, so
+    validation takes constant time regardless of number of values.
 
     :param iterable values: A sequence of invalid values.
     :param str error: Error message in case of validation error.
         Can be interpolated with ``data`` and ``values``.
     """
 
+    __slots__ = ('_members',)
+
     default_error_messages = {
         'invalid': 'Invalid data',
     }
@@ -167,12 +280,23 @@ class NoneOf(Validator):
         super(NoneOf, self).__init__(**kwargs)
         self.values = values
         if error is not None:
-            self._error_messages['invalid'] = error
+            self._set_error_message('invalid', error)
+
+    @property
+    def values(self):
+        return self._members.values
+
+    @values.setter
+    def values(self, values):
+        self._members = _Members(values)
 
     def __call__(self, value):
-        if value in self.values:
+        if value in self._members:
             self._fail('invalid', data=value, values=self.values)
 
+    def _condition(self):
+        return (2, '{data} not in {0}._members.lookup', [self])
+
     def __repr__(self):
         return '<{klass} {values}>'.format(
             klass=self.__class__.__name__,
@@ -182,12 +306,16 @@ class NoneOf(Validator):
 
 class AnyOf(Validator):
     """Validator that succeeds if ``value`` is a member of given ``choices``.
+    Lists and tuples of choices are converted into a set on construction, so
+    validation takes constant time regardless of number of choices.
 
     :param iterable choices: A sequence of allowed values.
     :param str error: Error message in case of validation error.
         Can be interpolated with ``data`` and ``choices``.
     """
 
+    __slots__ = ('_members',)
+
     default_error_messages = {
         'invalid': 'Invalid choice',
     }
@@ -196,12 +324,23 @@ class AnyOf(Validator):
         super(AnyOf, self).__init__(**kwargs)
         self.choices = choices
         if error is not None:
-            self._error_messages['invalid'] = error
+            self._set_error_message('invalid', error)
+
+    @property
+    def choices(self):
+        return self._members.values
+
+    @choices.setter
+    def choices(self, choices):
+        self._members = _Members(choices)
 
     def __call__(self, value):
-        if value not in self.choices:
+        if value not in self._members:
             self._fail('invalid', data=value, choices=self.choices)
 
+    def _condition(self):
+        return (2, '{data} in {0}._members.lookup', [self])
+
     def __repr__(self):
         return '<{klass} {choices}>'.format(
             klass=self.__class__.__name__,
@@ -219,6 +358,8 @@ class Regexp(Validator):
         Can be interpolated with ``data`` and ``regexp``.
     """
 
+    __slots__ = ('regexp',)
+
     default_error_messages = {
         'invalid': 'String does not match expected pattern',
     }
@@ -229,14 +370,172 @@ class Regexp(Validator):
             regexp = re.compile(regexp, flags)
         self.regexp = regexp
         if error is not None:
-            self._error_messages['invalid'] = error
+            self._set_error_message('invalid', error)
 
     def __call__(self, value):
         if self.regexp.match(value) is None:
             self._fail('invalid', data=value, regexp=self.regexp.pattern)
 
+    def _condition(self):
+        return (3, '{0}.regexp.match({data}) is not None', [self])
+
     def __repr__(self):
         return '<{klass} {regexp}>'.format(
             klass=self.__class__.__name__,
             regexp=self.regexp.pattern,
         )
+
+
+def _defining_class(klass, name):
+    for base in klass.__mro__:
+        if name in base.__dict__:
+            return base
+    return None
+
+
+def _fused_condition(validator):
+    """Returns inline check of validator (see :meth:`Validator._condition`)
+    or None if validator can not be fused. Subclasses that override
+    `__call__` are not fused."""
+    if not isinstance(validator, Validator):
+        return None
+
+    klass = validator.__class__
+    if _defining_class(klass, '_condition') is not \
+            _defining_class(klass, '__call__'):
+        return None
+    return validator._condition()
+
+
+def _run_validators(plans, data, context):
+    """Runs validators collecting errors of all of them."""
+    errors_builder = None
+    for validator, with_context in plans:
+        try:
+            if with_context:
+                validator(data, context)
+            else:
+                validator(data)
+        except ValidationError as ve:
+            if errors_builder is None:
+                errors_builder = ValidationErrorBuilder()
+            errors_builder.add_errors(ve.raw_messages)
+    if errors_builder is not None:
+        errors_builder.raise_errors()
+
+
+def _add_errors(errors_builder, error):
+    if errors_builder is None:
+        errors_builder = ValidationErrorBuilder()
+    errors_builder.add_errors(error.raw_messages)
+    return errors_builder
+
+
+#: Cache of generated fused check factories by their source
+_fused_factories = {}
+
+
+class _FusedValidator(object):
+    """Single check combining built-in validators (:class:`Predicate`,
+    :class:`Range`, :class:`Length`, :class:`AnyOf`, :class:`NoneOf` and
+    :class:`Regexp`) of a type.
+
+    Checks of validators are combined into one generated expression, cheap
+    ones (range, length) first and expensive ones (regular expressions) last.
+    If expression tells that data is invalid (or raises an exception), all
+    validators are run one by one in their original order, so error messages
+    are exactly the same as without fusion. Otherwise predicates and other
+    validators are run in their original order. Validator parameters are
+    read on each check, so changing them after type creation takes effect.
+
+    :param list plans: List of tuples of validator and a flag whether it takes
+        context argument.
+    """
+
+    __slots__ = ('plans', 'check')
+
+    def __init__(self, plans):
+        self.plans = plans
+
+        args = []
+
+        def format(template, constants):
+            names = ['c%d' % (len(args) + idx) for idx in range(len(constants))]
+            args.extend(constants)
+            return template.format(*names, data='data', context='context')
+
+        conditions = []
+        for idx, (validator, _) in enumerate(plans):
+            condition = _fused_condition(validator)
+            if condition is not None and condition[0] is not None:
+                conditions.append((condition[0], idx) + condition[1:])
+        conditions.sort()
+        fused = set(idx for _, idx, _, _ in conditions)
+
+        lines = [
+            '    def check(data, context=None):',
+            '        try:',
+            '            valid = %s' % ' and '.join(
+                '(%s)' % format(template, constants)
+                for _, _, template, constants in conditions
+            ),
+            '        except Exception:',
+            '            valid = False',
+            '        if not valid:',
+            '            run(plans, data, context)',
+            '            return',
+            '        errors = None',
+        ] if conditions else [
+            '    def check(data, context=None):',
+            '        errors = None',
+        ]
+        for idx, (validator, with_context) in enumerate(plans):
+            if idx in fused:
+                continue
+
+            name = format('{0}', [validator])
+            condition = _fused_condition(validator)
+            lines.append('        try:')
+            if condition is not None:
+                lines.append('            if not (%s):' % format(*condition[1:]))
+                lines.append("                %s._fail('invalid', data=data)"
+                             % name)
+            else:
+                lines.append('            %s(data%s)' % (
+                    name, ', context' if with_context else '',
+                ))
+            lines.append('        except ValidationError as e:')
+            lines.append('            errors = add_errors(errors, e)')
+        lines.append('        if errors is not None:')
+        lines.append('            errors.raise_errors()')
+
+        source = '\n'.join([
+            'def make(run, add_errors, ValidationError, plans, %s):' %
+            ', '.join('c%d' % idx for idx in range(len(args))),
+        ] + lines + [
+            '    return check',
+        ])
+
+        make = _fused_factories.get(source)
+        if make is None:
+            namespace = {}
+            exec(compile(source, '<lollipop fused validators>', 'exec'),
+                 namespace)
+            make = _fused_factories[source] = namespace['make']
+        self.check = make(_run_validators, _add_errors, ValidationError,
+                          plans, *args)
+
+    def __call__(self, data, context=None):
+        self.check(data, context)
+
+    def __reduce__(self):
+        return (self.__class__, (self.plans,))
+
+
+def _fuse(plans):
+    """Returns :class:`_FusedValidator` for given validator plans or None if
+    none of validators can be fused."""
+    if not any(_fused_condition(validator) is not None
+               for validator, _ in plans):
+        return None
+    return _FusedValidator(plans)
@@ -55,6 +55,9 @@ setup(
         'Programming Language :: Python :: Implementation :: CPython',
         'Programming Language :: Python :: Implementation :: PyPy',
     ],
+    extras_require={
+        'numpy': ['numpy'],
+    },
     setup_requires=['pytest-runner'],
     tests_require=['pytest'],
 )
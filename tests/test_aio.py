@@ -0,0 +1,245 @@
+import pytest
+import asyncio
+from collections import namedtuple
+from lollipop.types import MISSING, ValidationError, Type, String, Integer, \
+    List, Tuple, Dict, Object, Optional, LoadOnly, DumpOnly, Cached
+from lollipop.validators import Range, Length
+
+
+def run(coroutine):
+    return asyncio.run(coroutine)
+
+
+async def is_positive(value):
+    await asyncio.sleep(0)
+    if value <= 0:
+        raise ValidationError('Should be positive')
+
+
+async def is_not_foo(value, context):
+    await asyncio.sleep(0)
+    if value == context:
+        raise ValidationError('Should not be %s' % context)
+
+
+class TestLoadAsync:
+    def test_loading_runs_async_validators(self):
+        with pytest.raises(ValidationError) as exc_info:
+            run(Integer(validate=is_positive).load_async(-1))
+        assert exc_info.value.messages == 'Should be positive'
+
+    def test_loading_returns_loaded_value(self):
+        assert run(Integer(validate=is_positive).load_async('123')) == 123
+
+    def test_loading_passes_context_to_validators(self):
+        type = String(validate=is_not_foo)
+        assert run(type.load_async('bar', context='foo')) == 'bar'
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async('foo', context='foo'))
+        assert exc_info.value.messages == 'Should not be foo'
+
+    def test_loading_merges_sync_and_async_validator_errors_in_order(self):
+        def sync_error(value):
+            raise ValidationError('Sync error')
+
+        type = Integer(validate=[is_positive, sync_error])
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async(-1))
+        assert exc_info.value.messages == ['Should be positive', 'Sync error']
+
+    def test_loading_sync_types_without_async_validators(self):
+        type = List(Integer(validate=Range(min=0)))
+        assert run(type.load_async([1, 2, 3])) == [1, 2, 3]
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async([1, -2, 3]))
+        with pytest.raises(ValidationError) as expected_exc_info:
+            type.load([1, -2, 3])
+        assert exc_info.value.messages == expected_exc_info.value.messages
+
+    def test_loading_list_errors_have_item_indexes(self):
+        type = List(Integer(validate=is_positive))
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async([1, -2, 'foo', -4]))
+        assert exc_info.value.messages == {
+            1: 'Should be positive',
+            2: Integer.default_error_messages['invalid'],
+            3: 'Should be positive',
+        }
+
+    def test_loading_list_runs_list_validators(self):
+        type = List(Integer(validate=is_positive), validate=Length(max=2))
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async([1, 2, 3]))
+        assert exc_info.value.messages == 'Length should be at most 2'
+
+    def test_loading_list_checks_required_and_type(self):
+        type = List(Integer(validate=is_positive))
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async(None))
+        assert exc_info.value.messages == Type.default_error_messages['required']
+
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async('foo'))
+        assert exc_info.value.messages == List.default_error_messages['invalid']
+
+    def test_loading_tuple(self):
+        type = Tuple([Integer(validate=is_positive), String()],
+                     validate=Length(exact=2))
+        assert run(type.load_async([1, 'foo'])) == [1, 'foo']
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async([-1, 123]))
+        assert exc_info.value.messages == {
+            0: 'Should be positive',
+            1: String.default_error_messages['invalid'],
+        }
+
+    def test_loading_tuple_checks_required_type_and_length(self):
+        type = Tuple([Integer(validate=is_positive)])
+        for data, error in [
+            (None, Type.default_error_messages['required']),
+            ('foo', Tuple.default_error_messages['invalid']),
+            ([1, 2], 'Value length should be 1'),
+        ]:
+            with pytest.raises(ValidationError) as exc_info:
+                run(type.load_async(data))
+            assert exc_info.value.messages == error
+
+    def test_loading_dict(self):
+        type = Dict(Integer(validate=is_positive))
+        assert run(type.load_async({'a': 1, 'b': 2})) == {'a': 1, 'b': 2}
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async({'a': 1, 'b': -2}))
+        assert exc_info.value.messages == {'b': 'Should be positive'}
+
+    def test_loading_object(self):
+        Person = namedtuple('Person', ['name', 'age'])
+        type = Object({
+            'name': String(validate=Length(min=1)),
+            'age': Integer(validate=is_positive),
+        }, constructor=Person)
+        assert run(type.load_async({'name': 'John', 'age': 42})) == \
+            Person('John', 42)
+
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async({'name': '', 'age': -1}))
+        with pytest.raises(ValidationError) as expected_exc_info:
+            Object({
+                'name': String(validate=Length(min=1)),
+                'age': Integer(validate=Range(
+                    min=1, error_messages={'min': 'Should be positive'},
+                )),
+            }).load({'name': '', 'age': -1})
+        assert exc_info.value.messages == expected_exc_info.value.messages
+
+    def test_loading_object_reports_unknown_fields(self):
+        type = Object({'age': Integer(validate=is_positive)},
+                      allow_extra_fields=False)
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async({'age': 1, 'foo': 'bar'}))
+        assert exc_info.value.messages == \
+            {'foo': Object.default_error_messages['unknown']}
+
+    def test_loading_optional(self):
+        type = Optional(Integer(validate=is_positive), load_default=0)
+        assert run(type.load_async(None)) == 0
+        assert run(type.load_async(MISSING)) == 0
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async(-1))
+        assert exc_info.value.messages == 'Should be positive'
+
+    def test_loading_load_only_and_dump_only(self):
+        type = Object({
+            'foo': LoadOnly(Integer(validate=is_positive)),
+            'bar': DumpOnly(Integer(validate=is_positive)),
+        })
+        assert run(type.load_async({'foo': 1, 'bar': -1})) == {'foo': 1}
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async({'foo': -1}))
+        assert exc_info.value.messages == {'foo': 'Should be positive'}
+
+    def test_loading_cached_types_runs_async_validators(self):
+        type = Cached(Integer(validate=is_positive))
+        with pytest.raises(TypeError):
+            type.load(-1)
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async(-1))
+        assert exc_info.value.messages == 'Should be positive'
+
+    def test_loading_compiled_types(self):
+        type = List(Integer(validate=is_positive)).compile()
+        with pytest.raises(ValidationError) as exc_info:
+            run(type.load_async([1, -2]))
+        assert exc_info.value.messages == {1: 'Should be positive'}
+
+    def test_loading_recursive_types(self):
+        node = Object({'children': List(String()),
+                       'name': String(validate=is_not_foo)})
+        node.fields['children'].field_type = List(node)
+        data = {'name': 'foo', 'children': [{'name': 'foo', 'children': []}]}
+        with pytest.raises(ValidationError) as exc_info:
+            run(node.load_async(data, 'foo'))
+        assert exc_info.value.messages == {
+            'name': 'Should not be foo',
+            'children': {0: {'name': 'Should not be foo'}},
+        }
+
+    def test_loading_runs_validators_concurrently(self):
+        running = []
+        max_running = []
+
+        async def validator(value):
+            running.append(value)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+
+        run(List(Integer(validate=validator)).load_async(list(range(10))))
+        assert max(max_running) == 10
+
+    def test_loading_limits_concurrency(self):
+        running = []
+        max_running = []
+
+        async def validator(value):
+            running.append(value)
+            max_running.append(len(running))
+            await asyncio.sleep(0.01)
+            running.remove(value)
+
+        type = List(Integer(validate=validator))
+        run(type.load_async(list(range(10)), concurrency=3))
+        assert max(max_running) == 3
+
+    def test_loading_propagates_non_validation_errors(self):
+        async def validator(value):
+            raise KeyError('foo')
+
+        with pytest.raises(KeyError):
+            run(List(Integer(validate=validator)).load_async([1]))
+
+
+class TestValidateAsync:
+    def test_validating_returns_empty_dict_on_valid_data(self):
+        assert run(List(Integer(validate=is_positive)).validate_async([1])) == {}
+
+    def test_validating_returns_errors(self):
+        assert run(List(Integer(validate=is_positive)).validate_async([1, -2])) \
+            == {1: 'Should be positive'}
+
+
+class TestSyncLoadWithAsyncValidators:
+    @pytest.mark.parametrize('type, data', [
+        (Integer(validate=is_positive), -1),
+        (Integer(validate=is_positive), 1),
+        (Integer(validate=[Range(min=0), is_positive]), -1),
+        (List(Integer(validate=is_positive)), [-1]),
+    ])
+    def test_sync_loading_and_validation_raise_TypeError(self, type, data):
+        for func in [type.load, type.validate, type.is_valid]:
+            with pytest.raises(TypeError) as exc_info:
+                func(data)
+            assert 'load_async' in str(exc_info.value)
+
+    def test_compiled_loading_raises_TypeError(self):
+        with pytest.raises(TypeError):
+            Integer(validate=is_positive).compile().load(1)
@@ -0,0 +1,126 @@
+import pytest
+import warnings
+from lollipop.types import MISSING, ValidationError, Type, List, Integer, Float
+from lollipop.validators import Range, Length, Predicate
+
+numpy = pytest.importorskip('numpy')
+
+from lollipop.arrays import NumericArray
+
+
+class TestNumericArray:
+    def test_loading_floats_into_array(self):
+        result = NumericArray(Float()).load([1.5, 2, True])
+        assert isinstance(result, numpy.ndarray)
+        assert result.dtype == numpy.float64
+        assert result.tolist() == [1.5, 2.0, 1.0]
+
+    def test_loading_integers_into_array(self):
+        result = NumericArray(Integer()).load([1, 2.7, -3.2])
+        assert result.dtype.kind == 'i'
+        assert result.tolist() == [1, 2, -3]
+
+    def test_loading_array_with_custom_dtype(self):
+        assert NumericArray(Float(), dtype='float32').load([1.5]).dtype == \
+            numpy.float32
+
+    def test_loading_numpy_array(self):
+        data = numpy.array([1.5, 2.5])
+        result = NumericArray(Float()).load(data)
+        assert result.tolist() == [1.5, 2.5]
+        assert result is not data
+
+    def test_loading_values_that_need_conversion(self):
+        assert NumericArray(Float()).load(['1.5', 2]).tolist() == [1.5, 2.0]
+
+    def test_loading_non_list_value_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(Float()).load('1, 2, 3')
+        assert exc_info.value.messages == List.default_error_messages['invalid']
+
+    def test_loading_missing_value_raises_required_error(self):
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(Float()).load(MISSING)
+        assert exc_info.value.messages == Type.default_error_messages['required']
+
+    def test_loading_invalid_items_reports_same_errors_as_list(self):
+        data = [1.5, None, 'foo', [1]]
+        with pytest.raises(ValidationError) as exc_info:
+            List(Float()).load(data)
+        expected = exc_info.value.messages
+
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(Float()).load(data)
+        assert exc_info.value.messages == expected
+
+    def test_loading_non_finite_floats_into_integers_reports_errors(self):
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(Integer()).load([1.0, float('nan')])
+        assert exc_info.value.messages == \
+            {1: Integer.default_error_messages['invalid']}
+
+    def test_loading_integers_out_of_dtype_range(self):
+        with warnings.catch_warnings():
+            warnings.simplefilter('error')
+            assert NumericArray(Integer()).load([2 ** 63, 1]).tolist() == \
+                [2 ** 63, 1]
+            assert NumericArray(Integer(), dtype='int32').load([2 ** 31])\
+                .tolist() == [2 ** 31]
+
+    def test_loading_accepts_same_arguments_as_list(self):
+        type = NumericArray(Integer())
+        data = [1, 'a', 'b', 'c']
+        for kwargs, count in [({'fail_fast': True}, 1),
+                              ({'max_errors': 2}, 2), ({}, 3)]:
+            with pytest.raises(ValidationError) as exc_info:
+                type.load(data, **kwargs)
+            assert len(exc_info.value.messages) == count
+        assert type.load([1, 2], lazy=True).tolist() == [1, 2]
+
+    def test_loading_applies_range_validators_to_all_items(self):
+        item_type = Float(validate=[Range(min=0, max=10), Range(max=5)])
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(item_type).load([1, -1, 7, 11, 3])
+        assert exc_info.value.messages == {
+            1: 'Value should be at least 0 and at most 10',
+            2: 'Value should be at most 5',
+            3: ['Value should be at least 0 and at most 10',
+                'Value should be at most 5'],
+        }
+
+    def test_loading_applies_other_item_validators(self):
+        item_type = Integer(validate=Predicate(lambda x: x % 2 == 1, 'Odd'))
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(item_type).load([1, 2, 3, 4])
+        assert exc_info.value.messages == {1: 'Odd', 3: 'Odd'}
+
+    def test_loading_applies_list_validators(self):
+        with pytest.raises(ValidationError) as exc_info:
+            NumericArray(Integer(), validate=Length(max=2)).load([1, 2, 3])
+        assert exc_info.value.messages == 'Length should be at most 2'
+
+    def test_dumping_array(self):
+        assert NumericArray(Float()).dump(numpy.array([1.5, 2.0])) == [1.5, 2.0]
+
+    def test_dumping_list(self):
+        assert NumericArray(Integer()).dump([1, 2]) == [1, 2]
+
+    def test_non_numeric_item_type_is_not_allowed(self):
+        with pytest.raises(ValueError):
+            NumericArray(List(Integer()))
+
+
+class TestColumnarDump:
+    def test_dumping_columns_into_numpy_arrays(self):
+        from lollipop.types import Object, String, Boolean
+        from collections import namedtuple
+        Dummy = namedtuple('Dummy', ['foo', 'bar', 'baz'])
+        columns = Object({
+            'foo': String(), 'bar': Integer(), 'baz': Boolean(),
+        }).dump_columns([Dummy('a', 1, True), Dummy('b', 2, False)],
+                        array_type='numpy')
+        assert columns['foo'] == ['a', 'b']
+        assert columns['bar'].dtype == numpy.int64
+        assert columns['bar'].tolist() == [1, 2]
+        assert columns['baz'].dtype == numpy.bool_
+        assert columns['baz'].tolist() == [True, False]
@@ -0,0 +1,95 @@
+import json
+from lollipop.benchmarks import BENCHMARKS, benchmark, run, diff, main
+
+
+def results(**times):
+    return {'results': {name: {'ns_per_op': time}
+                        for name, time in times.items()}}
+
+
+class TestRun:
+    def test_running_selected_benchmarks(self):
+        result = run(['types.String.load', 'validators.R*'],
+                     min_time=0, repeat=1)
+        assert list(result['results']) == \
+            ['types.String.load', 'validators.Range', 'validators.Regexp']
+        string_load = result['results']['types.String.load']
+        assert string_load['ns_per_op'] > 0
+        assert string_load['ops'] == 100
+        assert result['meta']['repeat'] == 1
+
+    def test_all_benchmarks_run(self):
+        result = run(min_time=0, repeat=1)
+        assert list(result['results']) == list(BENCHMARKS)
+        errors = {name: result['error']
+                  for name, result in result['results'].items()
+                  if 'error' in result}
+        assert set(errors) <= {'types.Tuple.load', 'types.Tuple.dump',
+                               'types.Tuple.validate'}
+
+    def test_results_are_json_serializable(self):
+        result = run(['types.Integer'], min_time=0, repeat=1)
+        assert json.loads(json.dumps(result)) == result
+
+    def test_reporting_failed_benchmarks(self):
+        @benchmark('test.failing')
+        def setup():
+            def func():
+                raise ValueError('Failed')
+            return func, 1
+
+        try:
+            result = run(['test.failing'], min_time=0, repeat=1)
+        finally:
+            del BENCHMARKS['test.failing']
+        assert result['results']['test.failing'] == \
+            {'error': 'ValueError: Failed'}
+
+
+class TestDiff:
+    def test_comparing_results(self):
+        rows = diff(results(foo=100.0, bar=100.0, baz=100.0),
+                    results(foo=150.0, bar=98.0, baz=50.0), threshold=5)
+        assert rows == [
+            ('foo', 100.0, 150.0, 50.0, True),
+            ('bar', 100.0, 98.0, -2.0, False),
+            ('baz', 100.0, 50.0, -50.0, True),
+        ]
+
+    def test_comparing_results_with_missing_benchmarks(self):
+        rows = diff(results(foo=100.0), results(bar=100.0))
+        assert sorted(rows) == [('bar', None, 100.0, None, False),
+                                ('foo', 100.0, None, None, False)]
+
+
+class TestMain:
+    def test_run_and_diff_commands(self, tmpdir, capsys):
+        output = str(tmpdir.join('results.json'))
+        assert main(['run', '-k', 'types.Boolean', '--quick',
+                     '--min-time', '0', '-o', output]) == 0
+        with open(output) as f:
+            assert list(json.load(f)['results']) == [
+                'types.Boolean.load', 'types.Boolean.dump',
+                'types.Boolean.validate',
+            ]
+
+        assert main(['diff', output, output, '--fail']) == 0
+        assert 'types.Boolean.load' in capsys.readouterr().out
+
+    def test_diff_fails_on_regressions(self, tmpdir):
+        old, new = str(tmpdir.join('old.json')), str(tmpdir.join('new.json'))
+        with open(old, 'w') as f:
+            json.dump(results(foo=100.0), f)
+        with open(new, 'w') as f:
+            json.dump(results(foo=200.0), f)
+        assert main(['diff', old, new]) == 0
+        assert main(['diff', old, new, '--fail']) == 1
+        assert main(['diff', new, old, '--fail']) == 0
+
+    def test_list_command(self, capsys):
+        assert main(['list', 'validators']) == 0
+        assert capsys.readouterr().out.split() == [
+            'validators.Predicate', 'validators.Range', 'validators.Length',
+            'validators.AnyOf', 'validators.AnyOf[5000]', 'validators.NoneOf',
+            'validators.Regexp',
+        ]
@@ -0,0 +1,329 @@
+import pytest
+import datetime
+import enum
+from collections import namedtuple
+from lollipop.types import MISSING, ValidationError, Type, Any, String, \
+    Integer, Float, Boolean, Enum, DateTime, Date, Time, List, Dict, ConstantField, \
+    AttributeField, MethodField, FunctionField, Object, Optional, LoadOnly, \
+    DumpOnly, record
+from lollipop.compiler import CompiledType, compile_type
+from lollipop.validators import Predicate, Length, AnyOf, NoneOf, Regexp
+
+
+def load_errors(type, data, context=None):
+    with pytest.raises(ValidationError) as exc_info:
+        type.load(data, context)
+    return exc_info.value.messages
+
+
+def dump_errors(type, value, context=None):
+    with pytest.raises(ValidationError) as exc_info:
+        type.dump(value, context)
+    return exc_info.value.messages
+
+
+def assert_same_load(type, data, context=None):
+    compiled = type.compile()
+    try:
+        expected = type.load(data, context)
+    except ValidationError as ve:
+        assert load_errors(compiled, data, context) == ve.messages
+    else:
+        assert compiled.load(data, context) == expected
+
+
+def assert_same_dump(type, value, context=None):
+    compiled = type.compile()
+    try:
+        expected = type.dump(value, context)
+    except ValidationError as ve:
+        assert dump_errors(compiled, value, context) == ve.messages
+    else:
+        assert compiled.dump(value, context) == expected
+
+
+class CustomType(Type):
+    def load(self, data, *args, **kwargs):
+        return 'custom:' + data
+
+    def dump(self, value, *args, **kwargs):
+        return value[len('custom:'):]
+
+
+class CustomString(String):
+    def load(self, data, *args, **kwargs):
+        return super(CustomString, self).load(data, *args, **kwargs).upper()
+
+
+Person = namedtuple('Person', ['name', 'age'])
+
+
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+    CRIMSON = 'red'
+
+
+class Book(object):
+    def __init__(self, title, author, tags=None):
+        self.title = title
+        self.author = author
+        self.tags = tags
+
+    def get_slug(self):
+        return self.title.lower().replace(' ', '-')
+
+
+PersonType = Object({
+    'name': String(validate=Length(min=1)),
+    'age': Optional(Integer(validate=Predicate(lambda x: x > 0, 'Should be positive'))),
+}, constructor=Person)
+
+BookType = Object({
+    'title': String(),
+    'author': PersonType,
+    'tags': Optional(List(String())),
+    'slug': MethodField(String(), 'get_slug'),
+}, constructor=Book)
+
+
+class TestCompile:
+    def test_compile_returns_compiled_type(self):
+        compiled = String().compile()
+        assert isinstance(compiled, CompiledType)
+        assert isinstance(compile_type(String()), CompiledType)
+
+    def test_compiled_type_exposes_generated_source(self):
+        assert 'def ' in Object({'foo': String()}).compile().source
+
+    def test_compiling_compiled_type_returns_itself(self):
+        compiled = String().compile()
+        assert compiled.compile() is compiled
+
+    @pytest.mark.parametrize('type, data', [
+        (Any(), 'foo'),
+        (String(), 'foo'),
+        (String(), 123),
+        (String(), None),
+        (String(), MISSING),
+        (Integer(), 123),
+        (Integer(), '123'),
+        (Integer(), 'abc'),
+        (Float(), 1.5),
+        (Float(), None),
+        (Boolean(), True),
+        (Boolean(), 'true'),
+        (DateTime(format='%Y-%m-%dT%H:%M:%S'), '2016-07-28T11:22:33'),
+        (DateTime(), 123),
+        (DateTime(), 'foo'),
+        (DateTime(), '2016-07-28T11:22:33UTC'),
+        (DateTime(), '2016-07-28T11:22:33.123+02:00'),
+        (DateTime(), '2016-7-28T1:2:3GMT'),
+        (DateTime(), '2016-13-28T11:22:33Z'),
+        (Date(), '2016-07-28'),
+        (Date(), '2016-02-30'),
+        (Time(), '11:22:33'),
+        (List(Integer()), [1, 2, 3]),
+        (List(Integer()), [1, 'a', 3, 'b']),
+        (List(Integer()), 'abc'),
+        (Dict(Integer()), {'foo': 1, 'bar': 2}),
+        (Dict(Integer()), {'foo': 1, 'bar': 'abc'}),
+        (Dict({'foo': Integer(), 'bar': String()}), {'foo': 1, 'bar': 'x', 'baz': 1}),
+        (Dict({'foo': Integer(), 'bar': String()}), {'foo': 'x', 'bar': 1}),
+        (Optional(String()), None),
+        (Optional(String(), load_default='foo'), MISSING),
+        (Optional(String()), 123),
+        (LoadOnly(String()), 'foo'),
+        (DumpOnly(String()), 'foo'),
+        (CustomType(), 'foo'),
+        (CustomString(), 'foo'),
+        (PersonType, {'name': 'John', 'age': 42}),
+        (PersonType, {'name': 'John'}),
+        (PersonType, {'name': '', 'age': -1}),
+        (PersonType, {'name': 123, 'age': 'abc', 'extra': True}),
+        (PersonType, 'foo'),
+        (BookType, {'title': 'Moby-Dick',
+                    'author': {'name': 'Herman Melville'},
+                    'tags': ['classic', 1]}),
+    ])
+    def test_loading_matches_interpreted_load(self, type, data):
+        assert_same_load(type, data)
+
+    def test_loading_enums(self):
+        for type in [Enum(Color), Enum(Color, by_name=True),
+                     Enum({1: 'low', 2: 'high'}, validate=AnyOf(['low']))]:
+            for data in ['red', 'RED', 1, 2, 'blue', ['red'], None, MISSING]:
+                assert_same_load(type, data)
+        assert Enum(Color).compile().load('red') is Color.RED
+
+    def test_loading_enums_with_unhashable_values(self):
+        class Rgb(enum.Enum):
+            RED = [255, 0, 0]
+            BLACK = 0
+
+        for data in [[255, 0, 0], 0, [0, 0, 0], 'red', None]:
+            assert_same_load(Enum(Rgb), data)
+        assert Enum(Rgb).compile().load([255, 0, 0]) is Rgb.RED
+
+    def test_loading_object(self):
+        assert PersonType.compile().load({'name': 'John', 'age': 42}) == \
+            Person('John', 42)
+
+    def test_loading_object_with_disallowed_extra_fields(self):
+        type = Object({'foo': String()}, allow_extra_fields=False)
+        assert_same_load(type, {'foo': 'hello', 'bar': 1, 'baz': 2})
+        assert load_errors(type.compile(), {'foo': 'hello', 'bar': 1}) == \
+            {'bar': Object.default_error_messages['unknown']}
+
+    def test_loading_runs_validators(self):
+        type = Object({
+            'foo': Integer(validate=[Predicate(lambda x: x > 1, 'Too small'),
+                                     Predicate(lambda x: x > 2, 'Way too small')]),
+        }, validate=Predicate(lambda x: False, 'Object error'))
+        assert_same_load(type, {'foo': 1})
+        assert_same_load(type, {'foo': 5})
+
+    def test_loading_runs_fused_validators(self):
+        type = List(String(validate=[
+            Regexp('^[a-z]+$'), Length(min=2, max=5), NoneOf(['root']),
+            Predicate(lambda x: x != 'foo', 'Is foo'),
+        ]))
+        assert_same_load(type, ['abc', 'root', 'x', 'foo', 'ABCDEFG', 'bar'])
+        assert_same_load(type, ['abc', 'bar'])
+
+    def test_loading_passes_context_to_validators(self):
+        context = object()
+        type = List(String(validate=Predicate(lambda x, ctx: ctx is context)))
+        assert type.compile().load(['foo'], context) == ['foo']
+
+    @pytest.mark.parametrize('type, value', [
+        (Any(), 'foo'),
+        (String(), 'foo'),
+        (String(), 123),
+        (Integer(), 123),
+        (Integer(), 'abc'),
+        (Boolean(), False),
+        (Boolean(), None),
+        (DateTime(format='%Y-%m-%dT%H:%M:%S'), datetime.datetime(2016, 7, 28, 11, 22, 33)),
+        (DateTime(), 'foo'),
+        (DateTime(), datetime.datetime(2016, 7, 28, 11, 22, 33)),
+        (Date(), datetime.date(2016, 7, 28)),
+        (Time(), datetime.time(11, 22, 33)),
+        (List(Integer()), [1, 'a', 3]),
+        (Dict(String()), {'foo': 'bar', 'baz': 1}),
+        (Optional(Integer(), dump_default=0), None),
+        (LoadOnly(String()), 'foo'),
+        (DumpOnly(String()), 'foo'),
+        (CustomType(), 'custom:foo'),
+        (PersonType, Person('John', 42)),
+        (PersonType, Person(123, None)),
+        (BookType, Book('Moby Dick', Person('Herman Melville', None), ['a'])),
+        (BookType, Book('Moby Dick', None)),
+    ])
+    def test_dumping_matches_interpreted_dump(self, type, value):
+        assert_same_dump(type, value)
+
+    def test_dumping_enums(self):
+        for type in [Enum(Color), Enum(Color, by_name=True),
+                     Enum({1: 'low', 2: 'high'}), Enum({1: ['low']})]:
+            for value in [Color.RED, Color.CRIMSON, 'low', ['low'], 'blue',
+                          [], None, MISSING]:
+                assert_same_dump(type, value)
+
+    def test_dumping_object_fields(self):
+        type = Object({
+            'foo': AttributeField(String(), attribute='bar'),
+            'baz': ConstantField(Integer(), 123),
+            'bam': FunctionField(String(), lambda name, obj: name + obj.bar),
+        })
+        obj = namedtuple('Obj', ['bar'])('hello')
+        assert type.compile().dump(obj) == \
+            {'foo': 'hello', 'baz': 123, 'bam': 'bamhello'}
+
+    def test_dumping_shared_objects_once(self):
+        authors = []
+        AuthorType = Object({
+            'name': FunctionField(
+                String(), lambda name, obj: authors.append(obj) or obj.name,
+            ),
+        })
+        type = List(Object({'title': String(), 'author': AuthorType}))
+        author = Person('Herman Melville', None)
+        books = [Book('Moby Dick', author), Book('Typee', author)]
+        result = type.compile().dump(books)
+        assert result == type.dump(books)
+        assert result[0]['author'] is result[1]['author']
+        assert len(authors) == 2  # once per dump
+
+    def test_dumping_cycle_matches_interpreted_dump(self):
+        NodeType = Object({'name': String(), 'parent': Optional(Any())})
+        NodeType.fields['parent'].field_type.inner_type = NodeType
+        Node = namedtuple('Node', ['name', 'parent'])
+
+        class MutableNode(object):
+            def __init__(self, name):
+                self.name = name
+                self.parent = self
+
+        assert_same_dump(NodeType, Node('foo', Node('bar', None)))
+        assert_same_dump(NodeType, MutableNode('foo'))
+        assert dump_errors(NodeType.compile(), MutableNode('foo')) == \
+            {'parent': Object.default_error_messages['cycle']}
+
+    def test_dumping_with_projection(self):
+        compiled = BookType.compile()
+        book = Book('Moby Dick', Person('Herman Melville', 42))
+        for only, exclude in [(['title', 'author.name'], None),
+                              (None, ['slug', 'author.age'])]:
+            assert compiled.dump(book, only=only, exclude=exclude) == \
+                BookType.dump(book, only=only, exclude=exclude)
+        assert compiled.project(only=['title']) is \
+            compiled.project(only=['title'])
+
+    def test_loading_with_positional_constructors(self):
+        fields = {'foo': String(), 'bar': Integer()}
+        for constructor in [namedtuple('MyData', ['bar', 'foo']),
+                            record('MyData')]:
+            type = Object(fields, constructor=constructor)
+            for data in [{'foo': 'hello', 'bar': 123}, {'foo': 'hello'}]:
+                assert_same_load(type, data)
+            result = type.compile().load({'foo': 'hello', 'bar': 123})
+            assert result.__class__ is type.constructor
+
+    def test_loading_record_with_missing_values(self):
+        type = Object({
+            'foo': String(), 'bar': Optional(Integer(), load_default=MISSING),
+        }, constructor=record('MyData'))
+        assert_same_load(type, {'foo': 'hello'})
+        assert_same_load(type, {'foo': 'hello', 'bar': 123})
+
+    def test_compiling_nested_shared_types(self):
+        type = List(Object({'foo': PersonType, 'bar': PersonType}))
+        data = [{'foo': {'name': 'John'}, 'bar': {'name': 'Jane', 'age': 0}}]
+        assert_same_load(type, data)
+
+    def test_loading_with_fail_fast(self):
+        compiled = List(Integer()).compile()
+        with pytest.raises(ValidationError) as exc_info:
+            compiled.load([1, 'a', 'b'], fail_fast=True)
+        assert exc_info.value.messages == \
+            {1: Integer.default_error_messages['invalid']}
+        assert compiled.load([1, 2], fail_fast=True) == [1, 2]
+
+    def test_loading_with_max_errors(self):
+        compiled = List(Integer()).compile()
+        with pytest.raises(ValidationError) as exc_info:
+            compiled.load([1, 'a', 'b', 'c'], max_errors=2)
+        assert exc_info.value.messages == {
+            1: Integer.default_error_messages['invalid'],
+            2: Integer.default_error_messages['invalid'],
+        }
+
+    def test_loading_passes_other_options_to_inner_type(self):
+        compiled = List(Integer()).compile()
+        assert compiled.load(['1', '2'], parallel=2, chunk_size=1) == [1, 2]
+
+    def test_loading_with_unknown_options_raises_TypeError(self):
+        compiled = Object({'foo': Integer()}).compile()
+        with pytest.raises(TypeError):
+            compiled.load({'foo': 1}, parallel=2)
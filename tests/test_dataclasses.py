@@ -0,0 +1,40 @@
+import pytest
+from lollipop.types import ValidationError, String, Integer, Object
+
+dataclasses = pytest.importorskip('dataclasses')
+
+
+def make_data_class(*extra_fields):
+    return dataclasses.make_dataclass(
+        'MyData', [('foo', str), ('bar', int)] + list(extra_fields),
+    )
+
+
+class TestObjectConstructor:
+    def test_loading_dataclass(self):
+        MyData = make_data_class()
+        assert Object({'foo': String(), 'bar': Integer()}, constructor=MyData)\
+            .load({'foo': 'hello', 'bar': 123}) == MyData('hello', 123)
+
+    def test_loading_dataclass_with_non_init_fields(self):
+        MyData = make_data_class(
+            ('baz', list, dataclasses.field(init=False, default_factory=list)),
+        )
+        assert Object({'foo': String(), 'bar': Integer()}, constructor=MyData)\
+            .load({'foo': 'hello', 'bar': 123}) == MyData('hello', 123)
+
+
+class TestCompiledObjectConstructor:
+    def test_loading_dataclass(self):
+        type = Object({'foo': String(), 'bar': Integer()},
+                      constructor=make_data_class())
+        compiled = type.compile()
+        result = compiled.load({'foo': 'hello', 'bar': 123})
+        assert result.__class__ is type.constructor
+        assert result == type.load({'foo': 'hello', 'bar': 123})
+
+        with pytest.raises(ValidationError) as exc_info:
+            compiled.load({'foo': 'hello'})
+        with pytest.raises(ValidationError) as expected_exc_info:
+            type.load({'foo': 'hello'})
+        assert exc_info.value.messages == expected_exc_info.value.messages
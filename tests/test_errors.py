@@ -2,11 +2,86 @@ from collections import namedtuple
 
 import pytest
 
-from lollipop.errors import ValidationError, ValidationErrorBuilder, merge_errors
+from lollipop.errors import ValidationError, ValidationErrorBuilder, \
+    ErrorMessagesMixin, ErrorMessage, merge_errors, flatten_errors, \
+    render_errors
 
 
 CustomError = namedtuple('CustomError', ['code', 'message'])
 
+class FormatSpy(object):
+    def __init__(self):
+        self.calls = 0
+
+    def __format__(self, spec):
+        self.calls += 1
+        return 'spy'
+
+
+class SpyErrors(ErrorMessagesMixin):
+    default_error_messages = {
+        'invalid': 'Invalid value: {data}',
+        'custom': CustomError('custom', 'Custom error'),
+    }
+
+
+class TestErrorMessage:
+    def test_rendering(self):
+        assert str(ErrorMessage('foo', 'Error {bar}', {'bar': 1})) == 'Error 1'
+
+    def test_fail_does_not_format_message(self):
+        spy = FormatSpy()
+        with pytest.raises(ValidationError) as exc_info:
+            SpyErrors()._fail('invalid', data=spy)
+        assert spy.calls == 0
+        assert exc_info.value.raw_messages == \
+            ErrorMessage('invalid', 'Invalid value: {data}', {'data': spy})
+
+    def test_accessing_messages_formats_them_once(self):
+        spy = FormatSpy()
+        with pytest.raises(ValidationError) as exc_info:
+            SpyErrors()._fail('invalid', data=spy)
+        assert exc_info.value.messages == 'Invalid value: spy'
+        assert exc_info.value.messages == 'Invalid value: spy'
+        assert spy.calls == 1
+
+    def test_fail_passes_non_string_messages_as_is(self):
+        with pytest.raises(ValidationError) as exc_info:
+            SpyErrors()._fail('custom')
+        assert exc_info.value.messages == CustomError('custom', 'Custom error')
+
+
+class TestRenderErrors:
+    def test_rendering_nested_messages(self):
+        assert render_errors({
+            'foo': [ErrorMessage('a', 'Error {x}', {'x': 1}), 'Error 2'],
+            'bar': {'baz': ErrorMessage('b', 'Error 3', {})},
+        }) == {'foo': ['Error 1', 'Error 2'], 'bar': {'baz': 'Error 3'}}
+
+
+class TestValidationError:
+    def test_messages_are_rendered(self):
+        error = ValidationError({'foo': ErrorMessage('a', 'Error {x}', {'x': 1})})
+        assert error.messages == {'foo': 'Error 1'}
+
+    def test_assigning_messages(self):
+        error = ValidationError('Error 1')
+        error.messages = {'foo': 'Error 2'}
+        assert error.messages == {'foo': 'Error 2'}
+        assert error.raw_messages == {'foo': 'Error 2'}
+
+    def test_codes(self):
+        error = ValidationError({
+            'foo': [ErrorMessage('a', 'Error 1', {}), 'Error 2'],
+            'bar': ErrorMessage('b', 'Error 3', {}),
+        })
+        assert error.codes == {'foo': ['a', None], 'bar': 'b'}
+
+    def test_string_representation_contains_rendered_messages(self):
+        error = ValidationError(ErrorMessage('a', 'Error {x}', {'x': 1}))
+        assert str(error) == "Invalid data: 'Error 1'"
+
+
 class TestMergeErrors:
 
     def test_merging_none_and_string(self):
@@ -122,6 +197,22 @@ class TestMergeErrors:
                          {'field1': {'field2': 'error2'}})
 
 
+class TestFlattenErrors:
+    def test_flattening_single_message(self):
+        assert list(flatten_errors('error1')) == [((), 'error1')]
+
+    def test_flattening_list_of_messages(self):
+        assert list(flatten_errors(['error1', 'error2'])) == \
+            [((), 'error1'), ((), 'error2')]
+
+    def test_flattening_nested_dicts(self):
+        assert sorted(flatten_errors({'foo': {'bar': ['error1', 'error2']},
+                                      'baz': 'error3'})) == \
+            [(('baz',), 'error3'),
+             (('foo', 'bar'), 'error1'),
+             (('foo', 'bar'), 'error2')]
+
+
 class TestValidationErrorBuilder:
 
     def test_empty_errors(self):
@@ -171,3 +262,83 @@ class TestValidationErrorBuilder:
             builder.raise_errors()
 
         assert excinfo.value.messages == builder.errors
+
+    @pytest.mark.parametrize('errors', [
+        ['error1', ['error2', 'error3'], 'error4'],
+        [{'foo': 'error1'}, 'error2', {'foo': ['error3'], 'bar': 'error4'}],
+        ['error1', {'foo': 'error2'}, ['error3']],
+        [[], {'foo': {'bar': 'error1'}}, {'foo': 'error2'}],
+        [{'foo': {'bar': 'error1'}}, {'foo': {'bar': ['error2']}}, ['error3']],
+    ])
+    def test_adding_errors_gives_same_result_as_merging_them(self, errors):
+        builder = ValidationErrorBuilder()
+        expected = None
+        for error in errors:
+            builder.add_errors(error)
+            expected = merge_errors(expected, error)
+        assert builder.errors == expected
+
+    def test_adding_errors_does_not_modify_them(self):
+        errors1 = {'foo': ['error1'], 'bar': {'baz': 'error2'}}
+        errors2 = {'foo': ['error3'], 'bar': {'baz': 'error4'}}
+        builder = ValidationErrorBuilder()
+        builder.add_errors(errors1)
+        builder.add_errors(errors2)
+        assert builder.errors == {'foo': ['error1', 'error3'],
+                                  'bar': {'baz': ['error2', 'error4']}}
+        assert errors1 == {'foo': ['error1'], 'bar': {'baz': 'error2'}}
+        assert errors2 == {'foo': ['error3'], 'bar': {'baz': 'error4'}}
+
+    def test_adding_errors_after_accessing_them(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error('foo', 'error1')
+        errors = builder.errors
+        builder.add_error('bar', 'error2')
+        assert errors == {'foo': 'error1'}
+        assert builder.errors == {'foo': 'error1', 'bar': 'error2'}
+
+    def test_adding_error_with_non_string_path(self):
+        builder = ValidationErrorBuilder()
+        builder.add_error(1, 'error1')
+        assert builder.errors == {1: 'error1'}
+
+
+class TestErrorMessagesMixin:
+    def test_subclass_messages_are_merged_with_base_class_messages(self):
+        class Errors(SpyErrors):
+            default_error_messages = {'invalid': 'Bad value'}
+
+        errors = Errors()
+        assert str(errors._error_message('invalid')) == 'Bad value'
+        assert errors._error_message('custom') == \
+            CustomError('custom', 'Custom error')
+
+    def test_instances_without_custom_messages_do_not_copy_messages(self):
+        assert SpyErrors()._error_overrides is None
+
+    def test_instances_keep_only_custom_messages(self):
+        errors = SpyErrors(error_messages={'invalid': 'Custom invalid'})
+        assert errors._error_overrides == {'invalid': 'Custom invalid'}
+        assert errors._error_message('custom') == \
+            CustomError('custom', 'Custom error')
+
+    def test_custom_error_messages_do_not_affect_other_instances(self):
+        errors1 = SpyErrors(error_messages={'invalid': 'Custom invalid'})
+        errors2 = SpyErrors()
+        assert str(errors1._error_message('invalid')) == 'Custom invalid'
+        assert str(errors2._error_message('invalid', data=1)) == \
+            'Invalid value: 1'
+
+    def test_setting_error_message_does_not_affect_other_instances(self):
+        errors1 = SpyErrors()
+        errors1._set_error_message('invalid', 'Custom invalid')
+        with pytest.raises(ValidationError) as exc_info:
+            SpyErrors()._fail('invalid', data=1)
+        assert exc_info.value.messages == 'Invalid value: 1'
+        with pytest.raises(ValidationError) as exc_info:
+            errors1._fail('invalid', data=1)
+        assert exc_info.value.messages == 'Custom invalid'
+
+    def test_fail_with_unknown_key_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            SpyErrors()._fail('unknown')
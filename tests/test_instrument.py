@@ -0,0 +1,202 @@
+import pytest
+from collections import namedtuple
+from lollipop.types import ValidationError, Type, String, Integer, List, \
+    Dict, Object, Optional, AttributeField, MethodField
+from lollipop.validators import Length, Predicate
+from lollipop.instrument import install, uninstall, hooks, format_path, \
+    Profiler
+
+
+def collect_calls(func):
+    calls = []
+
+    def on_exit(node, path, direction, elapsed_ns, error):
+        calls.append((node, format_path(path), direction, error))
+
+    with hooks(on_exit=on_exit):
+        try:
+            func()
+        except ValidationError:
+            pass
+    return calls
+
+
+Person = namedtuple('Person', ['name', 'age'])
+
+
+class TestHooks:
+    def test_reporting_type_loads(self):
+        type = String()
+        calls = collect_calls(lambda: type.load('foo'))
+        assert calls == [(type, '', 'load', None)]
+
+    def test_reporting_type_dumps(self):
+        type = Integer()
+        calls = collect_calls(lambda: type.dump(123))
+        assert calls == [(type, '', 'dump', None)]
+
+    def test_reporting_fields_with_field_names_in_path(self):
+        name_type = String()
+        type = Object({'name': name_type})
+        calls = collect_calls(lambda: type.load({'name': 'John'}))
+        assert calls == [
+            (name_type, 'name', 'load', None),
+            (type.fields['name'], 'name', 'load', None),
+            (type, '', 'load', None),
+        ]
+
+    def test_reporting_list_items_and_dict_values_with_common_path(self):
+        item_type = Integer()
+        value_type = Integer()
+        type = Object({'foo': List(item_type), 'bar': Dict(value_type)})
+        calls = collect_calls(
+            lambda: type.load({'foo': [1, 2], 'bar': {'baz': 3}}),
+        )
+        assert [(path, direction) for node, path, direction, _ in calls
+                if node is item_type] == [('foo[]', 'load')] * 2
+        assert [(path, direction) for node, path, direction, _ in calls
+                if node is value_type] == [('bar{}', 'load')]
+
+    def test_reporting_nested_calls_of_large_batches(self):
+        name_type = String()
+        type = Object({'name': name_type})
+        calls = collect_calls(
+            lambda: type.load_many([{'name': 'John'}] * 300),
+        )
+        assert len([node for node, _, _, _ in calls
+                    if node is name_type]) == 300
+
+    def test_reporting_validators(self):
+        validator = Length(min=1)
+        type = Object({'foo': List(String(), validate=validator)})
+        calls = collect_calls(lambda: type.load({'foo': []}))
+        assert [call for call in calls if call[0] is validator] == \
+            [(validator, 'foo', 'validate', calls[0][3])]
+        assert isinstance(calls[0][3], ValidationError)
+
+    def test_reporting_errors(self):
+        type = Integer()
+        calls = collect_calls(lambda: type.load('foo'))
+        assert len(calls) == 1
+        assert isinstance(calls[0][3], ValidationError)
+
+    def test_reporting_each_node_once_for_subclasses_calling_super(self):
+        class MyString(String):
+            def load(self, data, *args, **kwargs):
+                return super(MyString, self).load(data, *args, **kwargs)
+
+        type = MyString()
+        assert collect_calls(lambda: type.load('foo')) == \
+            [(type, '', 'load', None)]
+
+    def test_on_enter_is_called_before_nested_calls(self):
+        events = []
+        type = Object({'foo': String()})
+        with hooks(lambda node, path, direction: events.append(('enter', path)),
+                   lambda node, path, direction, elapsed_ns, error:
+                   events.append(('exit', path))):
+            type.load({'foo': 'bar'})
+        assert events == [('enter', ()), ('enter', ('foo',)),
+                          ('enter', ('foo',)), ('exit', ('foo',)),
+                          ('exit', ('foo',)), ('exit', ())]
+
+    def test_reporting_elapsed_time(self):
+        elapsed = []
+        with hooks(on_exit=lambda node, path, direction, elapsed_ns, error:
+                   elapsed.append(elapsed_ns)):
+            String().load('foo')
+        assert elapsed[0] >= 0
+
+    def test_results_and_errors_are_unchanged(self):
+        type = Object({
+            'name': String(validate=Length(min=1)),
+            'age': Optional(Integer(validate=Predicate(lambda x: x > 0,
+                                                       'Should be positive'))),
+        }, constructor=Person)
+        good = {'name': 'John', 'age': 42}
+        bad = {'name': '', 'age': -1}
+        expected_errors = type.validate(bad)
+        with hooks(on_exit=lambda *args: None):
+            assert type.load(good) == Person('John', 42)
+            assert type.dump(Person('John', 42)) == good
+            assert type.validate(bad) == expected_errors
+            assert type.validate(bad, fail_fast=True)
+
+    def test_uninstalling_restores_original_methods(self):
+        originals = (Type.load, String.load, AttributeField.load,
+                     MethodField.dump)
+        hook1 = install(on_exit=lambda *args: None)
+        hook2 = install(on_exit=lambda *args: None)
+        assert String.load is not originals[1]
+        uninstall(hook1)
+        assert String.load is not originals[1]
+        uninstall(hook2)
+        assert (Type.load, String.load, AttributeField.load,
+                MethodField.dump) == originals
+
+    def test_loading_compiled_and_lazy_types(self):
+        type = Object({'foo': List(Integer())})
+        compiled = type.compile()
+        calls = collect_calls(lambda: compiled.load({'foo': [1]}))
+        assert calls == [(compiled, '', 'load', None)]
+        with hooks(on_exit=lambda *args: None):
+            assert type.compile().load({'foo': [1]}) == {'foo': [1]}
+            view = type.load({'foo': [1]}, lazy=True)
+            assert view['foo'][0] == 1
+
+
+class TestFormatPath:
+    def test_formatting_paths(self):
+        assert format_path(()) == ''
+        assert format_path(('foo', 'bar')) == 'foo.bar'
+        assert format_path(('foo', '[]', 'bar', '{}')) == 'foo[].bar{}'
+
+
+class TestProfiler:
+    def test_aggregating_calls_by_path(self):
+        type = Object({'name': String(), 'tags': List(String())})
+        with Profiler() as profiler:
+            for _ in range(3):
+                type.load({'name': 'John', 'tags': ['foo', 'bar']})
+
+        stats = profiler.stats
+        assert sorted(path for _, path in stats) == \
+            [(), ('name',), ('tags',), ('tags', '[]')]
+        assert stats[('load', ())].calls == 3
+        assert stats[('load', ('name',))].calls == 3
+        assert stats[('load', ('name',))].nodes == ['AttributeField', 'String']
+        assert stats[('load', ('tags', '[]'))].calls == 6
+
+    def test_self_time_excludes_nested_paths(self):
+        type = Object({'name': String()})
+        with Profiler() as profiler:
+            type.load({'name': 'John'})
+
+        root = profiler.stats[('load', ())]
+        name = profiler.stats[('load', ('name',))]
+        assert root.self_ns == root.total_ns - name.total_ns
+        assert name.self_ns == name.total_ns
+
+    def test_counting_errors(self):
+        type = Object({'age': Integer()})
+        with Profiler() as profiler:
+            with pytest.raises(ValidationError):
+                type.load({'age': 'foo'})
+        assert profiler.stats[('load', ('age',))].errors == 1
+
+    def test_stopping(self):
+        profiler = Profiler().start()
+        String().load('foo')
+        profiler.stop()
+        String().load('foo')
+        assert profiler.stats[('load', ())].calls == 1
+
+    def test_report(self):
+        type = Object({'name': String(), 'tags': List(String())})
+        with Profiler() as profiler:
+            type.load({'name': 'John', 'tags': ['foo']})
+        lines = profiler.report().splitlines()
+        assert lines[0].split() == \
+            ['path', 'calls', 'total', 'ms', 'self', 'ms', 'errors']
+        assert [line.split()[0] for line in lines[1:]] == \
+            ['load', 'name', 'tags', '[]']
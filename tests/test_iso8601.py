@@ -0,0 +1,126 @@
+import pytest
+import datetime
+from lollipop.iso8601 import parse_datetime, parse_date, parse_time, \
+    format_datetime, format_date, format_time, tzoffset
+
+
+class TestParseDatetime:
+    def test_parsing_datetime(self):
+        assert parse_datetime('2016-07-28T11:22:33') == \
+            datetime.datetime(2016, 7, 28, 11, 22, 33)
+
+    def test_parsing_fractions_of_seconds(self):
+        assert parse_datetime('2016-07-28T11:22:33.5') == \
+            datetime.datetime(2016, 7, 28, 11, 22, 33, 500000)
+        assert parse_datetime('2016-07-28T11:22:33.000123') == \
+            datetime.datetime(2016, 7, 28, 11, 22, 33, 123)
+
+    @pytest.mark.parametrize('designator, minutes', [
+        ('Z', 0),
+        ('+00:00', 0),
+        ('+02:00', 120),
+        ('-0530', -330),
+    ])
+    def test_parsing_utc_offsets(self, designator, minutes):
+        value = parse_datetime('2016-07-28T11:22:33' + designator)
+        assert value.utcoffset() == datetime.timedelta(minutes=minutes)
+
+    def test_parsing_timezone_names_gives_naive_datetime(self):
+        assert parse_datetime('2016-07-28T11:22:33UTC') == \
+            datetime.datetime(2016, 7, 28, 11, 22, 33)
+        assert parse_datetime('2016-07-28T11:22:33GMT').tzinfo is None
+
+    def test_parsing_reuses_tzinfo_objects(self):
+        assert parse_datetime('2016-07-28T11:22:33+02:00').tzinfo is \
+            parse_datetime('2017-01-01T00:00:00+0200').tzinfo
+        assert parse_datetime('2016-07-28T11:22:33Z').tzinfo is tzoffset(0)
+
+    @pytest.mark.parametrize('value', [
+        '2016-7-28T11:22:33',
+        '2016-07-28 11:22:33',
+        '2016-07-28T11:22:33EST',
+        '2016-07-28T11:22:33.1234567',
+        '2016-07-28T11:22',
+        '2016-07-28',
+        'foo',
+    ])
+    def test_parsing_returns_None_if_value_does_not_match(self, value):
+        assert parse_datetime(value) is None
+
+    @pytest.mark.parametrize('value', [
+        '2016-13-28T11:22:33',
+        '2016-02-30T11:22:33',
+        '2016-07-28T24:22:33',
+        '2016-07-28T11:22:33+24:00',
+    ])
+    def test_parsing_raises_ValueError_if_value_is_invalid(self, value):
+        with pytest.raises(ValueError):
+            parse_datetime(value)
+
+
+class TestParseDate:
+    def test_parsing_date(self):
+        assert parse_date('2016-07-28') == datetime.date(2016, 7, 28)
+
+    def test_parsing_returns_None_if_value_does_not_match(self):
+        assert parse_date('2016-7-28') is None
+        assert parse_date('2016-07-28T11:22:33') is None
+
+    def test_parsing_raises_ValueError_if_value_is_invalid(self):
+        with pytest.raises(ValueError):
+            parse_date('2016-02-30')
+
+
+class TestParseTime:
+    def test_parsing_time(self):
+        assert parse_time('11:22:33') == datetime.time(11, 22, 33)
+
+    def test_parsing_returns_None_if_value_does_not_match(self):
+        assert parse_time('11:22') is None
+        assert parse_time('1:22:33') is None
+
+    def test_parsing_raises_ValueError_if_value_is_invalid(self):
+        with pytest.raises(ValueError):
+            parse_time('11:60:33')
+
+
+class TestFormatDatetime:
+    def test_formatting_naive_datetime(self):
+        assert format_datetime(datetime.datetime(2016, 7, 28, 1, 2, 3, 456)) == \
+            '2016-07-28T01:02:03'
+
+    @pytest.mark.parametrize('tzinfo', [
+        tzoffset(0), tzoffset(-90), tzoffset(330),
+        datetime.timezone(datetime.timedelta(seconds=30)),
+        datetime.timezone(datetime.timedelta(hours=1), 'CET'),
+    ])
+    def test_formatting_timezone_aware_datetime_same_as_strftime(self, tzinfo):
+        value = datetime.datetime(2016, 7, 28, 1, 2, 3, tzinfo=tzinfo)
+        assert format_datetime(value) == value.strftime('%Y-%m-%dT%H:%M:%S%Z')
+
+    def test_formatting_timezone_aware_datetime(self):
+        assert format_datetime(
+            datetime.datetime(2016, 7, 28, 1, 2, 3, tzinfo=tzoffset(0)),
+        ) == '2016-07-28T01:02:03UTC'
+
+    def test_formatting_returns_None_for_unsupported_values(self):
+        assert format_datetime(datetime.datetime(999, 7, 28, 1, 2, 3)) is None
+        assert format_datetime(datetime.date(2016, 7, 28)) is None
+        assert format_datetime(123) is None
+
+
+class TestFormatDate:
+    def test_formatting_date(self):
+        assert format_date(datetime.date(2016, 7, 8)) == '2016-07-08'
+
+    def test_formatting_returns_None_for_unsupported_values(self):
+        assert format_date(datetime.date(999, 7, 28)) is None
+        assert format_date(datetime.datetime(2016, 7, 28)) is None
+
+
+class TestFormatTime:
+    def test_formatting_time(self):
+        assert format_time(datetime.time(1, 2, 3, 456)) == '01:02:03'
+
+    def test_formatting_returns_None_for_unsupported_values(self):
+        assert format_time(datetime.datetime(2016, 7, 28)) is None
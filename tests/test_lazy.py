@@ -0,0 +1,254 @@
+import pytest
+from collections import namedtuple
+from lollipop.types import ValidationError, Type, String, Integer, \
+    List, Dict, Object, Optional, LoadOnly, DumpOnly, MethodField
+from lollipop.lazy import LazyObject, LazyList, LazyDict, load_lazy
+from lollipop.validators import Predicate
+
+
+class CountingType(Type):
+    def __init__(self, inner_type, *args, **kwargs):
+        super(CountingType, self).__init__(*args, **kwargs)
+        self.inner_type = inner_type
+        self.loaded = 0
+
+    def load(self, data, *args, **kwargs):
+        self.loaded += 1
+        return self.inner_type.load(data, *args, **kwargs)
+
+
+def errors_on_access(func):
+    with pytest.raises(ValidationError) as exc_info:
+        func()
+    return exc_info.value.messages
+
+
+Person = namedtuple('Person', ['name', 'age'])
+
+PersonType = Object({
+    'name': String(),
+    'age': Optional(Integer()),
+}, constructor=Person)
+
+DocumentType = Object({
+    'title': String(),
+    'author': PersonType,
+    'tags': List(String()),
+    'meta': Dict(Integer()),
+})
+
+DATA = {
+    'title': 'Moby Dick',
+    'author': {'name': 'Herman Melville', 'age': 72},
+    'tags': ['novel', 'sea'],
+    'meta': {'pages': 635},
+}
+
+
+class TestLazyObject:
+    def test_loading_returns_lazy_view(self):
+        assert isinstance(DocumentType.load(DATA, lazy=True), LazyObject)
+
+    def test_loading_invalid_data_fails_immediately(self):
+        assert errors_on_access(lambda: DocumentType.load(None, lazy=True)) == \
+            Type.default_error_messages['required']
+        assert errors_on_access(lambda: DocumentType.load([], lazy=True)) == \
+            Object.default_error_messages['invalid']
+
+    def test_accessing_field_returns_loaded_value(self):
+        view = DocumentType.load(DATA, lazy=True)
+        assert view['title'] == 'Moby Dick'
+        assert view['author']['age'] == 72
+
+    def test_nested_containers_are_lazy(self):
+        view = DocumentType.load(DATA, lazy=True)
+        assert isinstance(view['author'], LazyObject)
+        assert isinstance(view['tags'], LazyList)
+        assert isinstance(view['meta'], LazyDict)
+
+    def test_fields_are_loaded_on_first_access_only(self):
+        foo_type = CountingType(String())
+        bar_type = CountingType(String())
+        view = Object({'foo': foo_type, 'bar': bar_type})\
+            .load({'foo': 'hello', 'bar': 'world'}, lazy=True)
+        assert (foo_type.loaded, bar_type.loaded) == (0, 0)
+        assert view['foo'] == 'hello'
+        assert view['foo'] == 'hello'
+        assert (foo_type.loaded, bar_type.loaded) == (1, 0)
+
+    def test_accessing_invalid_field_raises_errors_with_field_path(self):
+        view = DocumentType.load(dict(DATA, author={'name': 123}), lazy=True)
+        assert view['title'] == 'Moby Dick'
+        author = view['author']
+        assert errors_on_access(lambda: author['name']) == \
+            {'author': {'name': String.default_error_messages['invalid']}}
+
+    def test_accessing_invalid_field_is_memoized(self):
+        foo_type = CountingType(Integer())
+        view = Object({'foo': foo_type}).load({'foo': 'bar'}, lazy=True)
+        assert errors_on_access(lambda: view['foo']) == \
+            errors_on_access(lambda: view['foo'])
+        assert foo_type.loaded == 1
+
+    def test_missing_fields_are_absent(self):
+        view = Object({'foo': String(), 'bar': Optional(String())})\
+            .load({'foo': 'hello'}, lazy=True)
+        assert view['bar'] is None
+        view = Object({'foo': String(), 'bar': DumpOnly(String())})\
+            .load({'foo': 'hello', 'bar': 'world'}, lazy=True)
+        assert 'bar' not in view
+        assert list(view) == ['foo']
+        assert len(view) == 1
+        with pytest.raises(KeyError):
+            view['bar']
+        with pytest.raises(KeyError):
+            view['baz']
+
+    def test_loading_fields_with_custom_field_loads(self):
+        class MyField(MethodField):
+            def load(self, name, data, *args, **kwargs):
+                return data[name].upper()
+
+        view = Object({'foo': MyField(String(), 'get_foo')})\
+            .load({'foo': 'hello'}, lazy=True)
+        assert view['foo'] == 'HELLO'
+
+    def test_materialize_returns_same_value_as_eager_loading(self):
+        view = DocumentType.load(DATA, lazy=True)
+        assert view['author']['name'] == 'Herman Melville'
+        assert view.materialize() == DocumentType.load(DATA)
+        assert view['author'].materialize() == \
+            Person('Herman Melville', 72)
+
+    def test_materialize_is_memoized(self):
+        view = DocumentType.load(DATA, lazy=True)
+        assert view.materialize() is view.materialize()
+
+    def test_materialize_runs_object_validators(self):
+        type = Object({'foo': Integer(), 'bar': Integer()},
+                      validate=Predicate(lambda v: v['foo'] < v['bar'],
+                                         'Foo should be less than bar'))
+        view = type.load({'foo': 2, 'bar': 1}, lazy=True)
+        assert view['foo'] == 2
+        assert errors_on_access(view.materialize) == \
+            'Foo should be less than bar'
+
+    def test_materialize_reports_unknown_fields(self):
+        type = Object({'foo': String()}, allow_extra_fields=False)
+        view = type.load({'foo': 'hello', 'bar': 123}, lazy=True)
+        assert view['foo'] == 'hello'
+        assert view.errors() == \
+            {'bar': Object.default_error_messages['unknown']}
+
+    def test_errors_returns_all_errors(self):
+        data = dict(DATA, author={'name': 123}, tags=['novel', 456])
+        view = DocumentType.load(data, lazy=True)
+        assert view.errors() == DocumentType.validate(data)
+        assert not view.is_valid()
+        assert DocumentType.load(DATA, lazy=True).errors() == {}
+
+    def test_errors_of_nested_view_have_full_path(self):
+        data = dict(DATA, author={'name': 123})
+        view = DocumentType.load(data, lazy=True)
+        assert view['author'].errors() == \
+            {'author': {'name': String.default_error_messages['invalid']}}
+
+    def test_passing_context_to_field_types(self):
+        class ContextType(Type):
+            def load(self, data, context=None, *args, **kwargs):
+                return context
+
+        view = Object({'foo': Object({'bar': ContextType()})})\
+            .load({'foo': {'bar': 1}}, 'context', lazy=True)
+        assert view['foo']['bar'] == 'context'
+
+    def test_loading_compiled_type_lazily(self):
+        view = DocumentType.compile().load(DATA, lazy=True)
+        assert isinstance(view, LazyObject)
+        assert view.materialize() == DocumentType.load(DATA)
+
+    def test_optional_and_load_only_types_are_lazy(self):
+        type = Object({
+            'foo': Optional(Object({'bar': String()})),
+            'baz': LoadOnly(List(String())),
+        })
+        view = type.load({'foo': {'bar': 'hello'}, 'baz': []}, lazy=True)
+        assert isinstance(view['foo'], LazyObject)
+        assert isinstance(view['baz'], LazyList)
+
+
+class TestLazyList:
+    def test_loading_returns_lazy_sequence(self):
+        view = List(Integer()).load(['1', '2', '3'], lazy=True)
+        assert isinstance(view, LazyList)
+        assert len(view) == 3
+        assert view[0] == 1
+        assert view[-1] == 3
+        assert view[1:] == [2, 3]
+        assert list(view) == [1, 2, 3]
+
+    def test_accessing_out_of_range_raises_IndexError(self):
+        view = List(Integer()).load([1], lazy=True)
+        with pytest.raises(IndexError):
+            view[1]
+
+    def test_items_are_loaded_on_first_access_only(self):
+        item_type = CountingType(Integer())
+        view = List(item_type).load([1, 2, 3], lazy=True)
+        assert view[1] == 2
+        assert view[1] == 2
+        assert item_type.loaded == 1
+
+    def test_accessing_invalid_item_raises_errors_with_item_index(self):
+        view = List(Integer()).load([1, 'foo'], lazy=True)
+        assert view[0] == 1
+        assert errors_on_access(lambda: view[1]) == \
+            {1: Integer.default_error_messages['invalid']}
+
+    def test_materialize_runs_list_validators(self):
+        type = List(Integer(), validate=Predicate(lambda v: len(v) < 3,
+                                                  'Too long'))
+        assert type.load([1, 2], lazy=True).materialize() == [1, 2]
+        assert type.load([1, 2, 3], lazy=True).errors() == 'Too long'
+
+
+class TestLazyDict:
+    def test_loading_returns_lazy_mapping(self):
+        view = Dict({'foo': Integer()}).load({'foo': '1', 'bar': 2}, lazy=True)
+        assert isinstance(view, LazyDict)
+        assert view['foo'] == 1
+        assert 'bar' not in view
+        assert dict(view) == {'foo': 1}
+        assert len(view) == 1
+
+    def test_accessing_invalid_value_raises_errors_with_key(self):
+        view = Dict(Integer()).load({'foo': 'bar'}, lazy=True)
+        assert errors_on_access(lambda: view['foo']) == \
+            {'foo': Integer.default_error_messages['invalid']}
+
+    def test_materialize_returns_same_value_as_eager_loading(self):
+        type = Dict(List(Integer()))
+        data = {'foo': [1, 2], 'bar': []}
+        assert type.load(data, lazy=True).materialize() == type.load(data)
+
+
+class TestLoadLazy:
+    def test_loading_scalar_types_eagerly(self):
+        assert load_lazy(Integer(), '123') == 123
+
+    def test_loading_containers_lazily(self):
+        assert isinstance(load_lazy(List(Integer()), [1]), LazyList)
+
+    @pytest.mark.parametrize('type', [
+        Object({'foo': Integer()}), List(Integer()), Dict(Integer()),
+        Object({'foo': Integer()}).compile(),
+    ])
+    def test_loading_lazily_with_error_limits_raises_ValueError(self, type):
+        data = [1] if isinstance(type, List) else {'foo': 1}
+        with pytest.raises(ValueError) as exc_info:
+            type.load(data, lazy=True, fail_fast=True)
+        assert 'fail_fast' in str(exc_info.value)
+        with pytest.raises(ValueError):
+            type.load(data, lazy=True, max_errors=2)
+        assert type.load(data, lazy=True, fail_fast=False,
+                         max_errors=None).materialize() == type.load(data)
@@ -0,0 +1,231 @@
+import pytest
+from collections import namedtuple
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, \
+    ThreadPoolExecutor
+from lollipop.types import MISSING, ValidationError, Type, String, Integer, \
+    List, Object, Optional, LoadOnly
+from lollipop.validators import Range, Length
+from lollipop.parallel import default_chunk_size, MIN_CHUNK_SIZE
+import lollipop.parallel
+import pickle
+
+
+Person = namedtuple('Person', ['name', 'age'])
+
+PersonType = Object({
+    'name': String(validate=Length(min=1)),
+    'age': Optional(Integer(validate=Range(min=0))),
+}, constructor=Person)
+
+
+class LazyFuture(Future):
+    """Future which runs call in current process once it's result
+    is requested."""
+    def __init__(self, executor, fn, args):
+        super(LazyFuture, self).__init__()
+        self.executor = executor
+        self.fn = fn
+        self.args = args
+
+    def result(self, timeout=None):
+        if not self.done():
+            self.executor.events.append('run')
+            if self.executor.fresh_workers:
+                lollipop.parallel._worker_types.clear()
+            self.set_result(self.fn(*self.args))
+        return super(LazyFuture, self).result(timeout)
+
+
+class RecordingExecutor(Executor):
+    """Runs calls in current process recording sizes of pickled item types
+    sent to workers and order of submitted and run calls. Can simulate each
+    call running in a new worker process which has no cached types."""
+    def __init__(self, max_workers, fresh_workers=False):
+        self._max_workers = max_workers
+        self.fresh_workers = fresh_workers
+        self.sent_types = []
+        self.events = []
+
+    def submit(self, fn, *args):
+        token, pickled_type = args[:2]
+        if pickled_type is not None:
+            self.sent_types.append(len(pickled_type))
+        self.events.append('submit')
+        return LazyFuture(self, fn, args)
+
+
+class RecordingPool(RecordingExecutor):
+    """Process pool replacement which runs worker initializer in current
+    process."""
+    def __init__(self, max_workers, initializer=None, initargs=()):
+        super(RecordingPool, self).__init__(max_workers)
+        self.initializer = initializer
+        lollipop.parallel._worker_types.clear()
+        initializer(*initargs)
+        RecordingPool.instances.append(self)
+
+    instances = []
+
+
+@pytest.fixture(scope='module')
+def executor():
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        yield executor
+
+
+class TestParallelList:
+    def test_loading_in_parallel(self, executor):
+        data = [{'name': 'John %d' % i, 'age': i} for i in range(100)]
+        assert List(PersonType).load(data, parallel=executor, chunk_size=7) == \
+            List(PersonType).load(data)
+
+    def test_loading_errors_have_original_indexes(self, executor):
+        data = [{'name': 'John', 'age': 1}] * 50
+        data[3] = {'name': '', 'age': 1}
+        data[42] = {'name': 'Jane', 'age': -1}
+        with pytest.raises(ValidationError) as exc_info:
+            List(PersonType).load(data, parallel=executor, chunk_size=10)
+        with pytest.raises(ValidationError) as expected_exc_info:
+            List(PersonType).load(data)
+        assert exc_info.value.messages == expected_exc_info.value.messages
+        assert sorted(exc_info.value.messages) == [3, 42]
+
+    def test_loading_errors_have_codes(self, executor):
+        data = [{'name': 'John', 'age': 1}] * 20
+        data[3] = {'name': '', 'age': 1}
+        data[12] = {'name': 'Jane', 'age': 'foo'}
+        with pytest.raises(ValidationError) as exc_info:
+            List(PersonType).load(data, parallel=executor, chunk_size=10)
+        with pytest.raises(ValidationError) as expected_exc_info:
+            List(PersonType).load(data)
+        assert exc_info.value.codes == expected_exc_info.value.codes
+        assert exc_info.value.codes == {3: {'name': 'min'},
+                                        12: {'age': 'invalid'}}
+        assert exc_info.value.raw_messages == \
+            expected_exc_info.value.raw_messages
+
+    def test_loading_runs_list_validators(self, executor):
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer(), validate=Length(max=2)).load([1, 2, 3],
+                                                         parallel=executor)
+        assert exc_info.value.messages == 'Length should be at most 2'
+
+    def test_loading_checks_required_and_type(self, executor):
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer()).load(None, parallel=executor)
+        assert exc_info.value.messages == Type.default_error_messages['required']
+
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer()).load('foo', parallel=executor)
+        assert exc_info.value.messages == List.default_error_messages['invalid']
+
+    def test_loading_with_number_of_processes(self):
+        assert List(Integer()).load(['1', '2', '3'], parallel=2) == [1, 2, 3]
+
+    def test_loading_with_thread_pool(self):
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            assert List(Integer()).load(list(range(10)), parallel=executor,
+                                        chunk_size=3) == list(range(10))
+
+    def test_loading_passes_context(self, executor):
+        assert List(Integer()).load([1, 2], {'foo': 'bar'},
+                                    parallel=executor) == [1, 2]
+
+    def test_loading_with_invalid_parallel_argument_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            List(Integer()).load([1], parallel='foo')
+
+    def test_loading_with_error_limit_raises_ValueError(self, executor):
+        with pytest.raises(ValueError):
+            List(Integer()).load([1, 'x', 'y'], fail_fast=True, parallel=2)
+        with pytest.raises(ValueError):
+            List(Integer()).load([1, 'x', 'y'], max_errors=1,
+                                 parallel=executor)
+
+    def test_loading_unpicklable_type_raises_ValueError(self, executor):
+        type = List(Integer(validate=lambda x: None))
+        with pytest.raises(ValueError):
+            type.load([1], parallel=executor)
+
+    def test_item_type_is_sent_once_per_worker(self):
+        lollipop.parallel._worker_types.clear()
+        type = List(PersonType)
+        data = [{'name': 'John %d' % i, 'age': i} for i in range(100)]
+        executor = RecordingExecutor(max_workers=2)
+        assert type.load(data, parallel=executor, chunk_size=5) == \
+            type.load(data)
+        # 20 chunks, but item type is sent only to 2 workers
+        assert len(executor.sent_types) == 2
+        assert sum(executor.sent_types) == 2 * executor.sent_types[0]
+
+    def test_item_type_is_resent_to_workers_without_it(self):
+        type = List(PersonType)
+        data = [{'name': 'John %d' % i, 'age': i} for i in range(20)]
+        executor = RecordingExecutor(max_workers=2, fresh_workers=True)
+        assert type.load(data, parallel=executor, chunk_size=5) == \
+            type.load(data)
+
+    def test_modified_item_type_is_sent_again(self):
+        lollipop.parallel._worker_types.clear()
+        validator = Range(min=0)
+        type = List(Integer(validate=validator))
+        data = list(range(1, 21))
+        executor = RecordingExecutor(max_workers=2)
+        assert type.load(data, parallel=executor, chunk_size=5) == data
+        validator.min = 10
+        with pytest.raises(ValidationError) as exc_info:
+            type.load(data, parallel=executor, chunk_size=5)
+        assert sorted(exc_info.value.messages) == list(range(9))
+        assert len(executor.sent_types) == 4
+
+    def test_missed_chunks_are_resubmitted_concurrently(self):
+        type = List(PersonType)
+        data = [{'name': 'John %d' % i, 'age': i} for i in range(20)]
+        executor = RecordingExecutor(max_workers=2, fresh_workers=True)
+        assert type.load(data, parallel=executor, chunk_size=5) == \
+            type.load(data)
+        # Last 2 chunks are sent without type and get to fresh workers
+        assert executor.events == ['submit'] * 4 + ['run'] * 2 + \
+            ['run', 'submit', 'run', 'submit'] + ['run'] * 2
+
+    def test_pools_started_for_a_call_install_item_type_in_workers(
+            self, monkeypatch):
+        monkeypatch.setattr(lollipop.parallel, 'ProcessPoolExecutor',
+                            RecordingPool)
+        del RecordingPool.instances[:]
+        type = List(PersonType)
+        data = [{'name': 'John %d' % i, 'age': i} for i in range(20)]
+        assert type.load(data, parallel=2, chunk_size=5) == type.load(data)
+        pool, = RecordingPool.instances
+        assert pool.initializer is lollipop.parallel._install_type
+        assert pool.sent_types == []
+        assert pool.events == ['submit'] * 4 + ['run'] * 4
+
+    def test_dumping_in_parallel(self, executor):
+        values = [Person('John %d' % i, i) for i in range(100)]
+        assert List(PersonType).dump(values, parallel=executor, chunk_size=7) == \
+            List(PersonType).dump(values)
+
+    def test_dumping_errors_have_original_indexes(self, executor):
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer()).dump([1, 'a', 3, 'b'], parallel=executor,
+                                 chunk_size=1)
+        message = Integer.default_error_messages['invalid']
+        assert exc_info.value.messages == {1: message, 3: message}
+
+    def test_dumping_load_only_items(self, executor):
+        assert List(LoadOnly(Integer())).dump([1, 2], parallel=executor) == \
+            [MISSING, MISSING]
+
+
+class TestDefaultChunkSize:
+    def test_splits_items_into_several_chunks_per_worker(self):
+        assert default_chunk_size(100000, 4) == 6250
+
+    def test_chunks_are_not_too_small(self):
+        assert default_chunk_size(100, 4) == MIN_CHUNK_SIZE
+
+
+class TestMissingPickling:
+    def test_MISSING_is_unpickled_as_singleton(self):
+        assert pickle.loads(pickle.dumps(MISSING)) is MISSING
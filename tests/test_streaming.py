@@ -0,0 +1,163 @@
+import pytest
+import io
+import json
+from lollipop.types import ValidationError, Type, Any, String, Integer, \
+    List, Object
+from lollipop.errors import ItemError
+from lollipop.validators import Length
+
+
+ItemType = Object({'name': String(), 'count': Integer()})
+DocumentType = Object({
+    'meta': Object({'source': String()}),
+    'items': List(ItemType),
+})
+
+
+def stream(type, document, path='items', chunk_size=7, binary=False, **kwargs):
+    text = json.dumps(document)
+    fp = io.BytesIO(text.encode('utf-8')) if binary else io.StringIO(text)
+    items = []
+    result = type.load_stream(fp, path, items.append, chunk_size=chunk_size,
+                              **kwargs)
+    return result, items
+
+
+class TestLoadStream:
+    def test_loading_envelope_and_streaming_items(self):
+        result, items = stream(DocumentType, {
+            'meta': {'source': 'export'},
+            'items': [{'name': 'foo', 'count': 1}, {'name': 'bar', 'count': 22}],
+        })
+        assert result == {'meta': {'source': 'export'}}
+        assert items == [{'name': 'foo', 'count': 1}, {'name': 'bar', 'count': 22}]
+
+    def test_loading_envelope_fields_after_items(self):
+        text = '{"items": [{"name": "foo", "count": 12345}], "meta": {"source": "x"}}'
+        items = []
+        result = DocumentType.load_stream(io.StringIO(text), 'items', items.append,
+                                          chunk_size=1)
+        assert result == {'meta': {'source': 'x'}}
+        assert items == [{'name': 'foo', 'count': 12345}]
+
+    @pytest.mark.parametrize('chunk_size', range(1, 17))
+    def test_loading_numbers_split_across_chunks(self, chunk_size):
+        text = '{"items": [1.5, 2.25e1, 3, -0.125, 1E+2, 12345.678e-3], ' \
+            '"name": "x", "total": 10.75}'
+        items = []
+        result = Object({'items': List(Any()), 'name': String(),
+                         'total': Any()}).load_stream(
+            io.StringIO(text), 'items', items.append, chunk_size=chunk_size,
+        )
+        assert result == {'name': 'x', 'total': 10.75}
+        assert items == [1.5, 22.5, 3, -0.125, 100.0, 12.345678]
+
+    @pytest.mark.parametrize('chunk_size', range(1, 17))
+    def test_loading_number_items_of_nested_values(self, chunk_size):
+        document = {'items': [{'name': 'foo', 'count': 1234567}] * 3,
+                    'meta': {'source': 'x'}}
+        assert stream(DocumentType, document, chunk_size=chunk_size) == \
+            ({'meta': {'source': 'x'}}, document['items'])
+
+    def test_loading_from_binary_file(self):
+        result, items = stream(DocumentType, {
+            'meta': {'source': u'экспорт'},
+            'items': [{'name': u'фу', 'count': 1}],
+        }, binary=True, chunk_size=3)
+        assert result == {'meta': {'source': u'экспорт'}}
+        assert items == [{'name': u'фу', 'count': 1}]
+
+    def test_loading_empty_list(self):
+        assert stream(DocumentType, {'meta': {'source': 'x'}, 'items': []}) == \
+            ({'meta': {'source': 'x'}}, [])
+
+    def test_items_are_passed_to_callback_before_document_is_read(self):
+        class Reader(object):
+            def __init__(self, text):
+                self.text = text
+                self.pos = 0
+
+            def read(self, size):
+                chunk = self.text[self.pos:self.pos + size]
+                self.pos += len(chunk)
+                return chunk
+
+        text = '{"items": [{"name": "foo", "count": 1}, ' + ' ' * 1000 + \
+            '{"name": "bar", "count": 2}], "meta": {"source": "x"}}'
+        reader = Reader(text)
+        positions = []
+        DocumentType.load_stream(
+            reader, 'items', lambda item: positions.append(reader.pos),
+            chunk_size=10,
+        )
+        assert len(positions) == 2
+        assert positions[0] < 100
+
+    def test_loading_streams_nested_list(self):
+        type = Object({'data': Object({'total': Integer(), 'items': List(ItemType)})})
+        result, items = stream(type, {
+            'data': {'total': 1, 'items': [{'name': 'foo', 'count': 1}]},
+        }, path='data.items')
+        assert result == {'data': {'total': 1}}
+        assert items == [{'name': 'foo', 'count': 1}]
+
+    def test_loading_invalid_item_raises_ValidationError_with_item_path(self):
+        with pytest.raises(ValidationError) as exc_info:
+            stream(DocumentType, {
+                'meta': {'source': 'x'},
+                'items': [{'name': 'foo', 'count': 1}, {'name': 1, 'count': 1}],
+            })
+        assert exc_info.value.messages == \
+            {'items': {1: {'name': String.default_error_messages['invalid']}}}
+
+    def test_loading_yields_error_records_for_invalid_items(self):
+        result, items = stream(DocumentType, {
+            'meta': {'source': 'x'},
+            'items': [{'name': 1, 'count': 1}, {'name': 'foo', 'count': 1}],
+        }, errors='yield')
+        assert items == [
+            ItemError(0, {'name': String.default_error_messages['invalid']}),
+            {'name': 'foo', 'count': 1},
+        ]
+
+    def test_loading_invalid_envelope_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            stream(DocumentType, {'meta': {'source': 1}, 'items': []})
+        assert exc_info.value.messages == \
+            {'meta': {'source': String.default_error_messages['invalid']}}
+
+    def test_loading_missing_list_raises_required_error(self):
+        with pytest.raises(ValidationError) as exc_info:
+            stream(DocumentType, {'meta': {'source': 'x'}})
+        assert exc_info.value.messages == \
+            {'items': Type.default_error_messages['required']}
+
+    def test_loading_non_list_value_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            stream(DocumentType, {'meta': {'source': 'x'}, 'items': 'foo'})
+        assert exc_info.value.messages == \
+            {'items': List.default_error_messages['invalid']}
+
+    def test_loading_non_object_document_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            stream(DocumentType, [1, 2, 3])
+        assert exc_info.value.messages == Object.default_error_messages['invalid']
+
+    def test_loading_applies_streaming_list_validators(self):
+        type = Object({'items': List(ItemType, validate=Length(max=1))})
+        with pytest.raises(ValidationError) as exc_info:
+            stream(type, {'items': [{'name': 'a', 'count': 1}] * 3})
+        assert exc_info.value.messages == {'items': 'Length should be at most 1'}
+
+    def test_loading_malformed_json_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            DocumentType.load_stream(io.StringIO('{"items": [{"name": "a", "count": 1}'), 'items',
+                                     lambda item: None)
+
+    def test_streaming_path_should_point_to_list(self):
+        with pytest.raises(ValueError):
+            DocumentType.load_stream(io.StringIO('{}'), 'meta', lambda item: None)
+
+    def test_streaming_path_should_consist_of_existing_fields(self):
+        with pytest.raises(ValueError):
+            DocumentType.load_stream(io.StringIO('{}'), 'foo', lambda item: None)
@@ -2,12 +2,18 @@ import pytest
 from functools import partial
 import datetime
 from lollipop.types import MISSING, ValidationError, Type, Any, String, \
-    Number, Integer, Float, Boolean, DateTime, Date, Time, List, Dict, \
-    Field, AttributeField, MethodField, FunctionField, ConstantField, Object, \
-    Optional, LoadOnly, DumpOnly
-from lollipop.errors import merge_errors
-from lollipop.validators import Validator, Predicate
+    Number, Integer, Float, Boolean, Enum, DateTime, Date, Time, List, Tuple, \
+    Dict, Field, AttributeField, MethodField, FunctionField, ConstantField, \
+    Object, Optional, LoadOnly, DumpOnly, Cached, DictWithDefault, record
+from lollipop.errors import merge_errors, ItemError
+from lollipop.validators import Validator, Predicate, Range, Length, \
+    AnyOf, NoneOf, Regexp
 from collections import namedtuple
+import copy
+import enum
+import pickle
+import re
+import weakref
 
 
 def validator(predicate, message='Something went wrong'):
@@ -235,6 +241,84 @@ class TestBoolean(RequiredTestsMixin, ValidationTestsMixin):
         assert exc_info.value.messages == Boolean.default_error_messages['invalid']
 
 
+class Color(enum.Enum):
+    RED = 'red'
+    GREEN = 'green'
+    CRIMSON = 'red'
+
+
+class TestEnum(RequiredTestsMixin, ValidationTestsMixin):
+    tested_type = partial(Enum, Color)
+    valid_data = 'red'
+    valid_value = Color.RED
+
+    def test_loading_enum_members_by_value(self):
+        assert Enum(Color).load('red') is Color.RED
+        assert Enum(Color).load('green') is Color.GREEN
+
+    def test_loading_enum_members_by_name(self):
+        assert Enum(Color, by_name=True).load('GREEN') is Color.GREEN
+        assert Enum(Color, by_name=True).load('CRIMSON') is Color.RED
+
+    def test_loading_mapped_values(self):
+        assert Enum({1: 'low', 2: 'high'}).load(2) == 'high'
+
+    def test_loading_unknown_value_raises_ValidationError(self):
+        for data in ['blue', 'RED', ['red']]:
+            with pytest.raises(ValidationError) as exc_info:
+                Enum(Color).load(data)
+            assert exc_info.value.messages == \
+                Enum.default_error_messages['invalid']
+
+    def test_loading_enum_members_with_unhashable_values(self):
+        class Rgb(enum.Enum):
+            RED = [255, 0, 0]
+            GREEN = [0, 255, 0]
+
+        type = Enum(Rgb)
+        assert type.load([0, 255, 0]) is Rgb.GREEN
+        assert type.dump(Rgb.RED) == [255, 0, 0]
+        for data in [[0, 0, 255], (255, 0, 0), 'red']:
+            with pytest.raises(ValidationError) as exc_info:
+                type.load(data)
+            assert exc_info.value.messages == \
+                Enum.default_error_messages['invalid']
+
+    def test_customizing_error_message(self):
+        message = '{data} is not one of {choices}'
+        with pytest.raises(ValidationError) as exc_info:
+            Enum({1: 'low'}, error_messages={'invalid': message}).load(2)
+        assert exc_info.value.messages == '2 is not one of [1]'
+
+    def test_dumping_enum_members(self):
+        assert Enum(Color).dump(Color.GREEN) == 'green'
+        assert Enum(Color, by_name=True).dump(Color.GREEN) == 'GREEN'
+
+    def test_dumping_aliased_member_to_canonical_name(self):
+        assert Enum(Color, by_name=True).dump(Color.CRIMSON) == 'RED'
+
+    def test_dumping_mapped_values(self):
+        assert Enum({1: 'low', 2: 'high'}).dump('high') == 2
+
+    def test_dumping_unhashable_mapped_values(self):
+        type = Enum({1: ['low'], 2: ['high']})
+        assert type.dump(['high']) == 2
+        with pytest.raises(ValidationError) as exc_info:
+            type.dump(['medium'])
+        assert exc_info.value.messages == Enum.default_error_messages['invalid']
+
+    def test_dumping_unknown_value_raises_ValidationError(self):
+        for value in ['red', ['red']]:
+            with pytest.raises(ValidationError) as exc_info:
+                Enum(Color).dump(value)
+            assert exc_info.value.messages == \
+                Enum.default_error_messages['invalid']
+
+    def test_choices(self):
+        assert Enum(Color).choices is Color
+        assert Enum(Color, by_name=True).by_name
+
+
 class TestDateTime(RequiredTestsMixin, ValidationTestsMixin):
     tested_type = DateTime
     valid_data = '2016-07-28T11:22:33UTC'
@@ -244,6 +328,27 @@ class TestDateTime(RequiredTestsMixin, ValidationTestsMixin):
         assert DateTime().load('2011-12-13T11:22:33UTC') == \
             datetime.datetime(2011, 12, 13, 11, 22, 33)
 
+    def test_loading_string_date_without_timezone(self):
+        assert DateTime().load('2011-12-13T11:22:33') == \
+            datetime.datetime(2011, 12, 13, 11, 22, 33)
+
+    def test_loading_string_date_with_utc_offset(self):
+        assert DateTime().load('2011-12-13T11:22:33.5+02:00') == \
+            datetime.datetime(2011, 12, 13, 11, 22, 33, 500000,
+                              datetime.timezone(datetime.timedelta(hours=2)))
+        assert DateTime().load('2011-12-13T11:22:33Z') == \
+            datetime.datetime(2011, 12, 13, 11, 22, 33, 0, datetime.timezone.utc)
+
+    def test_loading_string_date_which_is_not_zero_padded(self):
+        assert DateTime().load('2011-12-3T1:22:33UTC') == \
+            datetime.datetime(2011, 12, 3, 1, 22, 33)
+
+    def test_loading_invalid_iso_date_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            DateTime().load('2011-13-13T11:22:33Z')
+        assert exc_info.value.messages == \
+            DateTime.default_error_messages['invalid_format']
+
     def test_loading_using_predefined_format(self):
         assert DateTime(format='rfc822').load('13 Dec 11 11:22:33 UTC') == \
             datetime.datetime(2011, 12, 13, 11, 22, 33)
@@ -288,6 +393,19 @@ class TestDateTime(RequiredTestsMixin, ValidationTestsMixin):
         assert DateTime().dump(datetime.datetime(2011, 12, 13, 11, 22, 33)) == \
             '2011-12-13T11:22:33'
 
+    def test_dumping_timezone_aware_date(self):
+        tz = datetime.timezone(datetime.timedelta(hours=-5, minutes=-30))
+        assert DateTime().dump(datetime.datetime(2011, 12, 13, 11, 22, 33,
+                                                 tzinfo=tz)) == \
+            '2011-12-13T11:22:33UTC-05:30'
+        assert DateTime().dump(datetime.datetime(
+            2016, 7, 28, 11, 22, 33, tzinfo=datetime.timezone.utc,
+        )) == '2016-07-28T11:22:33UTC'
+
+    def test_dumping_date_before_year_1000(self):
+        value = datetime.datetime(999, 12, 13, 11, 22, 33)
+        assert DateTime().dump(value) == value.strftime(DateTime.ISO_FORMAT)
+
     def test_dumping_using_predefined_format(self):
         assert DateTime(format='rfc822')\
             .dump(datetime.datetime(2011, 12, 13, 11, 22, 33)) == \
@@ -460,6 +578,11 @@ class TestList(RequiredTestsMixin, ValidationTestsMixin):
         message = String.default_error_messages['invalid']
         assert exc_info.value.messages == {0: message, 2: message}
 
+    def test_loading_list_value_reports_error_codes(self):
+        with pytest.raises(ValidationError) as exc_info:
+            List(String()).load([1, '2', None])
+        assert exc_info.value.codes == {0: 'invalid', 2: 'required'}
+
     def test_loading_list_value_with_items_that_have_validation_errors_raises_ValidationError(self):
         with pytest.raises(ValidationError) as exc_info:
             List(Integer(validate=is_odd_validator())).load([1, 2, 3])
@@ -502,6 +625,45 @@ class TestList(RequiredTestsMixin, ValidationTestsMixin):
         assert inner_type.dump_context == context
 
 
+class TestTuple(RequiredTestsMixin, ValidationTestsMixin):
+    tested_type = partial(Tuple, [String(), Integer()])
+    valid_data = ['foo', 123]
+    valid_value = ['foo', 123]
+
+    def test_loading_items(self):
+        assert Tuple([String(), Integer()]).load(['foo', 123]) == ['foo', 123]
+
+    def test_loading_invalid_items_reports_errors_with_indexes(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Tuple([String(), Integer()]).load([123, 'foo'])
+        assert exc_info.value.messages == {
+            0: String.default_error_messages['invalid'],
+            1: Integer.default_error_messages['invalid'],
+        }
+
+    def test_loading_wrong_number_of_items_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Tuple([String(), Integer()]).load(['foo'])
+        assert exc_info.value.messages == 'Value length should be 2'
+
+    def test_loading_non_list_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Tuple([String()]).load('foo')
+        assert exc_info.value.messages == \
+            Tuple.default_error_messages['invalid']
+
+    def test_dumping_lists_and_tuples(self):
+        type = Tuple([String(), Integer()])
+        assert type.dump(['foo', 123]) == ['foo', 123]
+        assert type.dump(('foo', 123)) == ['foo', 123]
+
+    def test_dumping_invalid_items_reports_errors_with_indexes(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Tuple([String(), Integer()]).dump(['foo', 'bar'])
+        assert exc_info.value.messages == \
+            {1: Integer.default_error_messages['invalid']}
+
+
 class TestDict(RequiredTestsMixin, ValidationTestsMixin):
     tested_type = partial(Dict, Integer())
     valid_data = {'foo': 123, 'bar': 456}
@@ -832,6 +994,70 @@ class TestObject(RequiredTestsMixin, ValidationTestsMixin):
         assert bar_type.dump_context == context
 
 
+class TestObjectConstructor:
+    def test_loading_namedtuple(self):
+        MyData = namedtuple('MyData', ['bar', 'foo'])
+        result = Object({'foo': String(), 'bar': Integer()}, constructor=MyData)\
+            .load({'foo': 'hello', 'bar': 123})
+        assert type(result) is MyData
+        assert result == MyData(123, 'hello')
+
+    def test_loading_namedtuple_subclass_with_custom_new(self):
+        class MyData(namedtuple('MyData', ['foo', 'bar'])):
+            def __new__(cls, foo, bar):
+                return super(MyData, cls).__new__(cls, foo.upper(), bar)
+
+        assert Object({'foo': String(), 'bar': Integer()}, constructor=MyData)\
+            .load({'foo': 'hello', 'bar': 123}) == MyData('HELLO', 123)
+
+    def test_loading_with_missing_values_passes_keyword_arguments(self):
+        MyData = namedtuple('MyData', ['foo', 'bar'])
+        MyData.__new__.__defaults__ = (None,)
+        assert Object({
+            'foo': String(), 'bar': Optional(Integer(), load_default=MISSING),
+        }, constructor=MyData).load({'foo': 'hello'}) == MyData('hello', None)
+
+    def test_loading_with_unknown_constructor_arguments_fails(self):
+        MyData = namedtuple('MyData', ['foo', 'baz'])
+        with pytest.raises(TypeError):
+            Object({'foo': String(), 'bar': Integer()}, constructor=MyData)\
+                .load({'foo': 'hello', 'bar': 123})
+
+    def test_replacing_constructor(self):
+        MyData1 = namedtuple('MyData1', ['foo', 'bar'])
+        MyData2 = namedtuple('MyData2', ['bar', 'foo'])
+        type = Object({'foo': String(), 'bar': Integer()}, constructor=MyData1)
+        assert type.load({'foo': 'hello', 'bar': 123}) == MyData1('hello', 123)
+        type.constructor = MyData2
+        assert type.load({'foo': 'hello', 'bar': 123}) == MyData2(123, 'hello')
+
+    def test_record_generates_class_with_fields_as_attributes(self):
+        type = Object({'foo': String(), 'bar': Integer()},
+                      constructor=record('MyData'))
+        result = type.load({'foo': 'hello', 'bar': 123})
+        assert isinstance(result, type.constructor)
+        assert type.constructor.__name__ == 'MyData'
+        assert (result.foo, result.bar) == ('hello', 123)
+        assert not hasattr(result, '__dict__')
+
+    def test_record_sets_missing_fields_to_None(self):
+        type = Object({
+            'foo': String(), 'bar': Optional(Integer(), load_default=MISSING),
+        }, constructor=record('MyData'))
+        result = type.load({'foo': 'hello'})
+        assert (result.foo, result.bar) == ('hello', None)
+
+    def test_record_module(self):
+        type = Object({'foo': String()}, constructor=record('MyData', __name__))
+        assert type.constructor.__module__ == __name__
+
+    def test_record_can_be_dumped(self):
+        type = Object({'foo': String(), 'bar': Integer()},
+                      constructor=record('MyData'))
+        data = {'foo': 'hello', 'bar': 123}
+        assert type.dump(type.load(data)) == data
+
+
 class TestOptional:
     def test_loading_value_calls_load_of_inner_type(self):
         inner_type = SpyType()
@@ -940,3 +1166,1080 @@ class TestDumpOnly:
         context = object()
         DumpOnly(inner_type).dump('foo', context)
         assert inner_type.dump_context == context
+
+
+class TestObjectProjection:
+    class Author(object):
+        def __init__(self, name, email):
+            self.name = name
+            self.email = email
+
+    class Book(object):
+        def __init__(self, title, author, tags=None):
+            self.title = title
+            self.author = author
+            self.tags = tags or []
+
+        def get_slug(self):
+            self.slug_called = True
+            return self.title.lower()
+
+    AuthorType = Object({'name': String(), 'email': String()})
+    BookType = Object({
+        'title': String(),
+        'author': AuthorType,
+        'coauthors': AttributeField(Optional(List(AuthorType)),
+                                    attribute='tags'),
+        'slug': MethodField(String(), 'get_slug'),
+    })
+
+    def book(self):
+        return self.Book('Moby Dick', self.Author('Herman Melville', 'hm@x.org'))
+
+    def test_dumping_only_given_fields(self):
+        book = self.book()
+        assert self.BookType.dump(book, only=['title']) == {'title': 'Moby Dick'}
+        assert not hasattr(book, 'slug_called')
+
+    def test_dumping_only_given_nested_fields(self):
+        assert self.BookType.dump(self.book(), only=['title', 'author.name']) == \
+            {'title': 'Moby Dick', 'author': {'name': 'Herman Melville'}}
+
+    def test_dumping_only_nested_fields_inside_wrapper_types(self):
+        book = self.book()
+        book.tags = [book.author]
+        assert self.BookType.dump(book, only=['coauthors.email']) == \
+            {'coauthors': [{'email': 'hm@x.org'}]}
+
+    def test_selecting_whole_field_and_nested_field(self):
+        assert self.BookType.dump(self.book(),
+                                  only=['author.name', 'author']) == \
+            {'author': {'name': 'Herman Melville', 'email': 'hm@x.org'}}
+
+    def test_dumping_without_excluded_fields(self):
+        book = self.book()
+        assert self.BookType.dump(book, exclude=['slug', 'coauthors',
+                                                 'author.email']) == \
+            {'title': 'Moby Dick', 'author': {'name': 'Herman Melville'}}
+        assert not hasattr(book, 'slug_called')
+
+    def test_dumping_with_only_and_exclude(self):
+        assert self.BookType.dump(self.book(), only=['title', 'author'],
+                                  exclude=['author.email']) == \
+            {'title': 'Moby Dick', 'author': {'name': 'Herman Melville'}}
+
+    def test_dumping_with_context_and_projection(self):
+        inner_type = SpyType()
+        type = Object({'foo': inner_type, 'bar': Any()})
+        obj = namedtuple('Obj', ['foo', 'bar'])('foo', 'bar')
+        context = object()
+        assert type.dump(obj, context, only=['foo']) == {'foo': 'foo'}
+        assert inner_type.dump_context is context
+
+    def test_projection_does_not_change_original_type(self):
+        self.BookType.project(only=['author.name'])
+        assert self.BookType.dump(self.book())['author'] == \
+            {'name': 'Herman Melville', 'email': 'hm@x.org'}
+
+    def test_projections_are_cached(self):
+        assert self.BookType.project(only=['title', 'author.name']) is \
+            self.BookType.project(only=('author.name', 'title'))
+        assert self.BookType.project(only=['title']) is not \
+            self.BookType.project(exclude=['title'])
+
+    def test_unknown_fields_raise_ValueError(self):
+        with pytest.raises(ValueError) as exc_info:
+            self.BookType.project(only=['author.foo'])
+        assert 'author.foo' in str(exc_info.value)
+
+        with pytest.raises(ValueError):
+            self.BookType.project(exclude=['foo'])
+
+    def test_selecting_fields_of_non_object_type_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            self.BookType.project(only=['title.foo'])
+
+
+class TestDumpMemo:
+    class Node(object):
+        def __init__(self, name, parent=None, children=None):
+            self.name = name
+            self.parent = parent
+            self.children = children or []
+
+    def counting_type(self, counter):
+        def get_name(name, obj):
+            counter.append(obj.name)
+            return obj.name
+
+        return Object({'name': FunctionField(String(), get_name)})
+
+    def test_dumping_shared_objects_once(self):
+        counter = []
+        ItemType = Object({
+            'name': String(),
+            'parent': self.counting_type(counter),
+        })
+        parent = self.Node('parent')
+        items = [self.Node('item%d' % idx, parent) for idx in range(3)]
+        result = List(ItemType).dump(items)
+        assert result == [{'name': 'item%d' % idx, 'parent': {'name': 'parent'}}
+                          for idx in range(3)]
+        assert counter == ['parent']
+        assert result[0]['parent'] is result[2]['parent']
+
+    def test_dumping_shared_objects_once_with_dump_many(self):
+        counter = []
+        ItemType = Object({'parent': self.counting_type(counter)})
+        parent = self.Node('parent')
+        values, errors = ItemType.dump_many([self.Node('a', parent),
+                                             self.Node('b', parent)])
+        assert values == [{'parent': {'name': 'parent'}}] * 2
+        assert counter == ['parent']
+
+    def test_dumping_same_object_with_different_types(self):
+        type = Object({
+            'foo': AttributeField(Object({'name': String()}), attribute='parent'),
+            'bar': AttributeField(Object({'parent': Optional(Any())}),
+                                  attribute='parent'),
+        })
+        parent = self.Node('parent')
+        assert type.dump(self.Node('child', parent)) == {
+            'foo': {'name': 'parent'},
+            'bar': {'parent': None},
+        }
+
+    def test_memo_does_not_outlive_dump(self):
+        counter = []
+        type = List(self.counting_type(counter))
+        node = self.Node('foo')
+        type.dump([node])
+        type.dump([node])
+        assert counter == ['foo', 'foo']
+
+    def test_memo_keeps_temporary_objects_alive(self):
+        class Obj(object):
+            def __init__(self, idx):
+                self.idx = idx
+
+            def get_foo(self):
+                return Obj(self.idx * 10)
+
+        type = Object({
+            'idx': Integer(),
+            'foo': MethodField(Object({'idx': Integer()}), 'get_foo'),
+        })
+        assert List(type).dump([Obj(idx) for idx in range(100)]) == [
+            {'idx': idx, 'foo': {'idx': idx * 10}} for idx in range(100)
+        ]
+
+    def test_dumping_cycle_raises_ValidationError(self):
+        NodeType = Object({'name': String()})
+        NodeType = Object({
+            'name': String(),
+            'parent': Optional(NodeType),
+            'children': List(NodeType),
+        })
+        NodeType.fields['parent'].field_type.inner_type = NodeType
+        NodeType.fields['children'].field_type.item_type = NodeType
+
+        parent = self.Node('parent')
+        child = self.Node('child', parent)
+        parent.children.append(child)
+
+        with pytest.raises(ValidationError) as exc_info:
+            NodeType.dump(parent)
+        assert exc_info.value.messages == {
+            'children': {0: {'parent': Object.default_error_messages['cycle']}},
+        }
+
+        assert NodeType.dump(self.Node('foo', self.Node('bar'))) == {
+            'name': 'foo',
+            'parent': {'name': 'bar', 'parent': None, 'children': []},
+            'children': [],
+        }
+
+
+class CountingType(Type):
+    def __init__(self, *args, **kwargs):
+        super(CountingType, self).__init__(*args, **kwargs)
+        self.load_count = 0
+        self.dump_count = 0
+
+    def load(self, data, *args, **kwargs):
+        self.load_count += 1
+        if data == 'invalid':
+            raise ValidationError('Invalid data')
+        return super(CountingType, self).load(data, *args, **kwargs)
+
+    def dump(self, value, *args, **kwargs):
+        self.dump_count += 1
+        return value
+
+
+class TestCached:
+    def test_loading_returns_inner_type_result(self):
+        assert Cached(Integer()).load('123') == 123
+
+    def test_loading_caches_results(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        assert type.load('foo') == 'foo'
+        assert type.load('foo') == 'foo'
+        assert inner_type.load_count == 1
+        assert type.cache_info().hits == 1
+        assert type.cache_info().misses == 1
+
+    def test_loading_caches_validation_errors(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                type.load('invalid')
+            assert exc_info.value.messages == 'Invalid data'
+        assert inner_type.load_count == 1
+
+    def test_loading_distinguishes_equal_values_of_different_types(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        assert type.load(1).__class__ is int
+        assert type.load(True).__class__ is bool
+        assert type.load(1.0).__class__ is float
+        assert inner_type.load_count == 3
+
+    def test_loading_caches_tuples(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        type.load(('USD', 1))
+        type.load(('USD', 1))
+        type.load(('USD', 1.0))
+        assert inner_type.load_count == 2
+
+    def test_loading_unhashable_data_bypasses_cache(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        type.load(['foo'])
+        type.load(['foo'])
+        type.load(('foo', ['bar']))
+        assert inner_type.load_count == 3
+        assert type.cache_info().bypassed == 3
+        assert type.cache_info().currsize == 0
+
+    def test_loading_data_hashed_by_identity_bypasses_cache(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        data = object()
+        type.load(data)
+        type.load(data)
+        assert inner_type.load_count == 2
+
+    def test_loading_runs_own_validators(self):
+        type = Cached(Integer(), validate=constant_fail_validator('Error'))
+        with pytest.raises(ValidationError) as exc_info:
+            type.load(1)
+        assert exc_info.value.messages == 'Error'
+
+    def test_loading_with_context_uses_cache_if_validators_do_not_take_context(self):
+        inner_type = CountingType(validate=is_odd_validator())
+        type = Cached(inner_type)
+        type.load(1, {'foo': 'bar'})
+        type.load(1, {'foo': 'baz'})
+        assert inner_type.load_count == 1
+
+    def test_loading_with_context_bypasses_cache_if_validators_take_context(self):
+        type = Cached(Optional(
+            Integer(validate=validator(
+                lambda x, context: context is None or x < context,
+            )),
+        ))
+        assert type.load(1, 2) == 1
+        with pytest.raises(ValidationError):
+            type.load(1, 1)
+        assert type.cache_info().bypassed == 2
+        assert type.load(1) == type.load(1)
+        assert type.cache_info().hits == 1
+
+
+    def test_evicting_least_recently_used_results(self):
+        inner_type = CountingType()
+        type = Cached(inner_type, maxsize=2)
+        type.load('foo')
+        type.load('bar')
+        type.load('foo')
+        type.load('baz')  # evicts 'bar'
+        assert inner_type.load_count == 3
+        type.load('foo')
+        assert inner_type.load_count == 3
+        type.load('bar')
+        assert inner_type.load_count == 4
+        assert type.cache_info().currsize == 2
+
+    def test_expiring_results(self, monkeypatch):
+        import lollipop.types
+        now = [100.0]
+        monkeypatch.setattr(lollipop.types, '_monotonic', lambda: now[0])
+        inner_type = CountingType()
+        type = Cached(inner_type, ttl=10)
+        type.load('foo')
+        now[0] += 5
+        type.load('foo')
+        assert inner_type.load_count == 1
+        now[0] += 5
+        type.load('foo')
+        assert inner_type.load_count == 2
+
+    def test_dumping_caches_results(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        assert type.dump('foo') == 'foo'
+        assert type.dump('foo') == 'foo'
+        assert inner_type.dump_count == 1
+
+    def test_dumping_caches_validation_errors(self):
+        type = Cached(Integer())
+        for _ in range(2):
+            with pytest.raises(ValidationError) as exc_info:
+                type.dump('foo')
+            assert exc_info.value.messages == \
+                Integer.default_error_messages['invalid']
+        assert type.cache_info().hits == 1
+
+    def test_clearing_cache(self):
+        inner_type = CountingType()
+        type = Cached(inner_type)
+        type.load('foo')
+        type.cache_clear()
+        assert type.cache_info() == (0, 0, 0, type.maxsize, 0)
+        type.load('foo')
+        assert inner_type.load_count == 2
+
+    def test_cached_type_can_be_copied_and_pickled(self):
+        type = Cached(Integer(), maxsize=10, ttl=5)
+        type.load(1)
+        for copied in [copy.deepcopy(type), pickle.loads(pickle.dumps(type))]:
+            assert copied.load('2') == 2
+            assert copied.maxsize == 10
+            assert copied.ttl == 5
+            assert copied.cache_info().currsize == 1
+
+
+class TestLoadMany:
+    def test_loading_multiple_values(self):
+        assert Integer().load_many([1, 2, 3]) == ([1, 2, 3], {})
+
+    def test_loading_accepts_any_iterable(self):
+        assert Integer().load_many(iter([1, 2])) == ([1, 2], {})
+
+    def test_loading_reports_errors_by_item_index(self):
+        values, errors = Integer().load_many([1, 'foo', 3, None])
+        assert values == [1, MISSING, 3, MISSING]
+        assert errors == {1: Integer.default_error_messages['invalid'],
+                          3: Type.default_error_messages['required']}
+
+    def test_loading_objects(self):
+        type = Object({'foo': String(), 'bar': Integer()})
+        values, errors = type.load_many([
+            {'foo': 'hello', 'bar': 123},
+            {'foo': 123, 'bar': 'goodbye'},
+        ])
+        assert values == [{'foo': 'hello', 'bar': 123}, MISSING]
+        assert errors == {1: {'foo': String.default_error_messages['invalid'],
+                              'bar': Integer.default_error_messages['invalid']}}
+
+    def test_loading_objects_passes_context_to_fields(self):
+        inner_type = SpyType()
+        context = object()
+        Object({'foo': inner_type}).load_many([{'foo': 'bar'}], context)
+        assert inner_type.load_context == context
+
+    def test_loading_objects_uses_overridden_load(self):
+        class UppercaseObject(Object):
+            def load(self, data, *args, **kwargs):
+                return dict((k.upper(), v) for k, v in
+                            super(UppercaseObject, self).load(data).items())
+
+        assert UppercaseObject({'foo': String()}).load_many([{'foo': 'bar'}]) == \
+            ([{'FOO': 'bar'}], {})
+
+    def test_loading_large_batches_gives_same_results_and_errors(self):
+        type = Object({'foo': String(validate=Length(max=3)),
+                       'bar': Integer()})
+        data = [{'foo': 'abc', 'bar': idx} if idx % 3 else
+                {'foo': 'abcd', 'bar': 'x'} for idx in range(300)]
+        values, errors = type.load_many(data)
+        assert values == [MISSING if idx % 3 == 0 else type.load(item)
+                          for idx, item in enumerate(data)]
+        assert errors == dict((idx, type.validate(item))
+                              for idx, item in enumerate(data) if idx % 3 == 0)
+
+    def test_loading_objects_gives_same_results_and_errors_as_load(self):
+        Person = namedtuple('Person', ['name', 'age'])
+        type = Object({
+            'name': String(validate=Length(min=1)),
+            'age': Optional(Integer()),
+            'kind': ConstantField(String(), 'person'),
+        }, constructor=Person, allow_extra_fields=False,
+            validate=validator(lambda person: person.get('age') != 13,
+                               'Unlucky'))
+        data = [{'name': 'John', 'age': 1}, {'name': 'Jane'}, {'name': ''},
+                {'name': 'Bob', 'age': 13}, {'name': 'Ann', 'foo': 1},
+                None, 'foo']
+        values, errors = type.load_many(data)
+        for idx, item in enumerate(data):
+            if idx in errors:
+                assert values[idx] is MISSING
+                assert errors[idx] == type.validate(item)
+            else:
+                assert values[idx] == type.load(item)
+        assert sorted(errors) == [2, 3, 4, 5, 6]
+
+
+class TestDumpMany:
+    def test_dumping_multiple_values(self):
+        assert String().dump_many(['foo', 123]) == \
+            (['foo', MISSING], {1: String.default_error_messages['invalid']})
+
+    def test_dumping_objects(self):
+        type = Object({'foo': String(), 'bar': Integer()})
+        values, errors = type.dump_many([
+            AttributeDummy(),
+            namedtuple('Dummy', ['foo', 'bar'])(123, 'goodbye'),
+        ])
+        assert values == [{'foo': 'hello', 'bar': 123}, MISSING]
+        assert errors == {1: {'foo': String.default_error_messages['invalid'],
+                              'bar': Integer.default_error_messages['invalid']}}
+
+    def test_dumping_large_batches_gives_same_results_and_errors(self):
+        type = Object({'foo': String(), 'bar': Integer()})
+        Dummy = namedtuple('Dummy', ['foo', 'bar'])
+        values = [Dummy('hello', idx) if idx % 3 else Dummy(123, 'goodbye')
+                  for idx in range(300)]
+        dumped, errors = type.dump_many(values)
+        assert dumped == [MISSING if idx % 3 == 0 else type.dump(value)
+                          for idx, value in enumerate(values)]
+        assert sorted(errors) == list(range(0, 300, 3))
+        assert errors[297] == {
+            'foo': String.default_error_messages['invalid'],
+            'bar': Integer.default_error_messages['invalid'],
+        }
+
+
+class TestDumpColumns:
+    tested_type = Object({
+        'foo': String(),
+        'bar': Integer(),
+        'baz': Boolean(),
+        'password': LoadOnly(String()),
+    })
+
+    def test_dumping_objects_into_columns(self):
+        objs = [AttributeDummy(), namedtuple('Dummy', ['foo', 'bar', 'baz'])(
+            'goodbye', 456, False,
+        )]
+        AttributeDummy.baz = True
+        try:
+            assert self.tested_type.dump_columns(objs) == {
+                'foo': ['hello', 'goodbye'],
+                'bar': [123, 456],
+                'baz': [True, False],
+            }
+        finally:
+            del AttributeDummy.baz
+
+    def test_dumping_into_arrays(self):
+        import array
+        Dummy = namedtuple('Dummy', ['foo', 'bar', 'baz'])
+        columns = self.tested_type.dump_columns(
+            [Dummy('a', 1, True), Dummy('b', 2, False)], array_type='array',
+        )
+        assert columns['foo'] == ['a', 'b']
+        assert columns['bar'] == array.array('q', [1, 2])
+        assert columns['baz'] == array.array('b', [1, 0])
+
+    def test_dumping_into_arrays_falls_back_to_list_on_overflow(self):
+        Dummy = namedtuple('Dummy', ['foo', 'bar', 'baz'])
+        columns = self.tested_type.dump_columns(
+            [Dummy('a', 1, True), Dummy('b', 2**70, False)], array_type='array',
+        )
+        assert columns['bar'] == [1, 2**70]
+
+    def test_dumping_uses_method_fields(self):
+        type = Object({'foo': MethodField(String(), 'foo')})
+        assert type.dump_columns([MethodDummy(), MethodDummy()]) == \
+            {'foo': ['hello', 'hello']}
+
+    def test_dumping_reports_errors_by_row_index(self):
+        Dummy = namedtuple('Dummy', ['foo', 'bar', 'baz'])
+        with pytest.raises(ValidationError) as exc_info:
+            self.tested_type.dump_columns(
+                [Dummy('a', 1, True), Dummy(1, 'x', True), None],
+            )
+        assert exc_info.value.messages == {
+            1: {'foo': String.default_error_messages['invalid'],
+                'bar': Integer.default_error_messages['invalid']},
+            2: Type.default_error_messages['required'],
+        }
+
+    def test_dumping_list_of_objects(self):
+        Dummy = namedtuple('Dummy', ['foo', 'bar', 'baz'])
+        assert List(self.tested_type).dump_columns([Dummy('a', 1, True)]) == \
+            {'foo': ['a'], 'bar': [1], 'baz': [True]}
+
+    def test_dumping_list_of_non_objects_is_not_allowed(self):
+        with pytest.raises(ValueError):
+            List(String()).dump_columns(['foo'])
+
+
+class TestLoadIter:
+    def test_loading_items_lazily(self):
+        consumed = []
+
+        def generate():
+            for x in [1, 2, 3]:
+                consumed.append(x)
+                yield x
+
+        items = Integer().load_iter(generate())
+        assert consumed == []
+        assert next(items) == 1
+        assert consumed == [1]
+        assert list(items) == [2, 3]
+
+    def test_loading_raises_ValidationError_on_first_invalid_item(self):
+        items = Integer().load_iter(iter([1, 'foo', 'bar']))
+        assert next(items) == 1
+        with pytest.raises(ValidationError) as exc_info:
+            next(items)
+        assert exc_info.value.messages == \
+            {1: Integer.default_error_messages['invalid']}
+
+    def test_loading_yields_error_records_for_invalid_items(self):
+        items = Integer().load_iter(iter([1, 'foo', 3]), errors='yield')
+        assert list(items) == \
+            [1, ItemError(1, Integer.default_error_messages['invalid']), 3]
+
+    def test_loading_with_unknown_errors_mode_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            Integer().load_iter([1], errors='ignore')
+
+    def test_loading_passes_context_to_load(self):
+        inner_type = SpyType()
+        context = object()
+        list(inner_type.load_iter(['foo'], context))
+        assert inner_type.load_context == context
+
+
+class TestListLoadIter:
+    def test_loading_items_from_any_iterable(self):
+        items = List(Integer()).load_iter(x for x in [1, 2, 3])
+        assert list(items) == [1, 2, 3]
+
+    def test_loading_non_iterable_raises_ValidationError(self):
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer()).load_iter(123)
+        assert exc_info.value.messages == List.default_error_messages['invalid']
+
+    def test_loading_None_raises_required_error(self):
+        with pytest.raises(ValidationError) as exc_info:
+            List(Integer()).load_iter(None)
+        assert exc_info.value.messages == Type.default_error_messages['required']
+
+    def test_loading_fails_as_soon_as_maximum_length_is_exceeded(self):
+        def generate():
+            yield 1
+            yield 2
+            raise AssertionError('Should not be consumed')
+
+        items = List(Integer(), validate=Length(max=1)).load_iter(generate())
+        assert next(items) == 1
+        with pytest.raises(ValidationError) as exc_info:
+            next(items)
+        assert exc_info.value.messages == 'Length should be at most 1'
+
+    def test_loading_checks_minimum_length_at_the_end(self):
+        items = List(Integer(), validate=Length(min=3)).load_iter(iter([1, 2]))
+        with pytest.raises(ValidationError) as exc_info:
+            list(items)
+        assert exc_info.value.messages == 'Length should be at least 3'
+
+    def test_loading_with_non_streaming_validators_raises_ValueError(self):
+        with pytest.raises(ValueError):
+            List(Integer(), validate=constant_succeed_validator()).load_iter([1])
+
+
+class TestIterErrors:
+    def test_yields_nothing_for_valid_data(self):
+        type = Object({'foo': List(Integer()), 'bar': Optional(String())})
+        assert list(type.iter_errors({'foo': [1, 2]})) == []
+
+    def test_yields_errors_with_paths(self):
+        type = Object({
+            'foo': List(Integer()),
+            'bar': Dict(String()),
+            'baz': String(),
+        })
+        errors = list(type.iter_errors({
+            'foo': [1, 'a'], 'bar': {'x': 1}, 'baz': 'ok',
+        }))
+        assert sorted(errors) == sorted([
+            (('foo', 1), Integer.default_error_messages['invalid']),
+            (('bar', 'x'), String.default_error_messages['invalid']),
+        ])
+
+    def test_yields_errors_of_value_itself_with_empty_path(self):
+        assert list(List(Integer()).iter_errors('foo')) == \
+            [((), List.default_error_messages['invalid'])]
+
+    def test_yields_unknown_fields_errors(self):
+        type = Object({'foo': String()}, allow_extra_fields=False)
+        assert list(type.iter_errors({'foo': 'a', 'bar': 1})) == \
+            [(('bar',), Object.default_error_messages['unknown'])]
+
+    def test_yields_customized_unknown_fields_errors(self):
+        type = Object({'foo': String()}, allow_extra_fields=False,
+                      error_messages={'unknown': 'Custom unknown'})
+        assert list(type.iter_errors({'foo': 'a', 'bar': 1})) == \
+            [(('bar',), 'Custom unknown')]
+
+    def test_yields_errors_lazily(self):
+        validated = []
+
+        def spy(value):
+            validated.append(value)
+            return False
+
+        type = List(Integer(validate=validator(spy, 'Invalid')))
+        errors = type.iter_errors([1, 2, 3])
+        assert next(errors) == ((0,), 'Invalid')
+        assert validated == [1]
+
+    def test_runs_container_validators_only_if_items_are_valid(self):
+        type = List(Integer(), validate=constant_fail_validator('Error'))
+        assert list(type.iter_errors([1, 'a'])) == \
+            [((1,), Integer.default_error_messages['invalid'])]
+        assert list(type.iter_errors([1, 2])) == [((), 'Error')]
+
+    def test_yields_no_errors_for_missing_optional_value(self):
+        assert list(Optional(Integer()).iter_errors(None)) == []
+
+    def test_yields_tuple_errors_with_item_indexes(self):
+        type = Tuple([Integer(), List(String())])
+        assert list(type.iter_errors([1, ['a', 2]])) == \
+            [((1, 1), String.default_error_messages['invalid'])]
+        assert list(type.iter_errors([1])) == \
+            [((), 'Value length should be 2')]
+
+
+class TestErrorLimits:
+    def test_validate_with_fail_fast_returns_first_error(self):
+        errors = List(Integer()).validate([1, 'a', 'b'], fail_fast=True)
+        assert errors == {1: Integer.default_error_messages['invalid']}
+
+    def test_validate_with_max_errors_returns_that_many_errors(self):
+        errors = List(Integer()).validate(['a', 'b', 'c', 'd'], max_errors=2)
+        assert errors == {0: Integer.default_error_messages['invalid'],
+                          1: Integer.default_error_messages['invalid']}
+
+    def test_validate_with_limits_returns_empty_dict_for_valid_data(self):
+        assert List(Integer()).validate([1, 2], fail_fast=True) == {}
+
+    def test_load_with_fail_fast_stops_on_first_error(self):
+        validated = []
+
+        def spy(value):
+            validated.append(value)
+            return False
+
+        type = Object({'foo': List(Integer(validate=validator(spy, 'Invalid')))})
+        with pytest.raises(ValidationError) as exc_info:
+            type.load({'foo': [1, 2, 3]}, fail_fast=True)
+        assert exc_info.value.messages == {'foo': {0: 'Invalid'}}
+        assert validated == [1]
+
+    def test_load_with_max_errors_stops_after_given_number_of_errors(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Dict(Integer()).load({'foo': 'a'}, max_errors=5)
+        assert exc_info.value.messages == \
+            {'foo': Integer.default_error_messages['invalid']}
+
+    def test_load_with_limits_returns_loaded_value_for_valid_data(self):
+        Person = namedtuple('Person', ['name'])
+        type = Object({'name': String()}, constructor=Person)
+        assert type.load({'name': 'John'}, fail_fast=True) == Person('John')
+
+    def test_load_with_fail_fast_stops_after_first_failed_validator(self):
+        type = Integer(validate=[constant_fail_validator('Error 1'),
+                                 constant_fail_validator('Error 2')])
+        with pytest.raises(ValidationError) as exc_info:
+            type.load(1, fail_fast=True)
+        assert exc_info.value.messages == 'Error 1'
+
+    def test_load_with_limits_runs_validators_once(self):
+        calls = []
+
+        def spy(name):
+            return validator(lambda value: calls.append(name) is None, 'Error')
+
+        type = Object({
+            'foo': List(Integer(validate=spy('item')), validate=spy('list')),
+            'bar': Optional(Object({'baz': String()}, validate=spy('inner'))),
+        }, validate=spy('object'))
+        type.load({'foo': [1, 2], 'bar': {'baz': 'hello'}}, fail_fast=True)
+        assert sorted(calls) == ['inner', 'item', 'item', 'list', 'object']
+
+    def test_load_with_max_errors_stops_loading_nested_items(self):
+        validated = []
+
+        def spy(value):
+            validated.append(value)
+            return False
+
+        type = Object({
+            'foo': Optional(List(Integer(validate=validator(spy, 'Invalid')))),
+            'bar': Dict(Integer(validate=validator(spy, 'Invalid'))),
+        })
+        with pytest.raises(ValidationError) as exc_info:
+            type.load({'foo': [1, 2], 'bar': {'baz': 3}}, max_errors=2)
+        assert exc_info.value.messages == {'foo': {0: 'Invalid', 1: 'Invalid'}}
+        assert validated == [1, 2]
+
+    def test_non_positive_max_errors_is_not_allowed(self):
+        for max_errors in [0, -1]:
+            with pytest.raises(ValueError):
+                List(Integer()).load(['a'], max_errors=max_errors)
+            with pytest.raises(ValueError):
+                List(Integer()).validate(['a'], max_errors=max_errors)
+
+    def test_tuple_load_with_fail_fast_stops_on_first_error(self):
+        validated = []
+
+        def spy(value):
+            validated.append(value)
+            return False
+
+        item_type = Integer(validate=validator(spy, 'Invalid'))
+        type = Tuple([item_type, item_type, item_type])
+        with pytest.raises(ValidationError) as exc_info:
+            type.load([1, 2, 3], fail_fast=True)
+        assert exc_info.value.messages == {0: 'Invalid'}
+        assert validated == [1]
+
+    def test_tuple_validate_with_max_errors(self):
+        type = Tuple([Integer(), Integer(), Integer()])
+        assert type.validate(['a', 'b', 'c'], max_errors=2) == \
+            {0: Integer.default_error_messages['invalid'],
+             1: Integer.default_error_messages['invalid']}
+        assert type.validate([1, 2, 3], fail_fast=True) == {}
+
+    def test_load_through_optional_with_fail_fast(self):
+        with pytest.raises(ValidationError) as exc_info:
+            Optional(List(Integer())).load(['a', 'b'], fail_fast=True)
+        assert exc_info.value.messages == \
+            {0: Integer.default_error_messages['invalid']}
+
+
+class TestValidationOnly:
+    def constructor_spy(self):
+        calls = []
+
+        def constructor(**kwargs):
+            calls.append(kwargs)
+            return kwargs
+        return constructor, calls
+
+    def test_validate_does_not_call_object_constructor(self):
+        constructor, calls = self.constructor_spy()
+        type = List(Object({'foo': String()}, constructor=constructor))
+        assert type.validate([{'foo': 'hello'}, {'foo': 123}]) == \
+            {1: {'foo': String.default_error_messages['invalid']}}
+        assert calls == []
+
+    def test_validate_does_not_call_constructor_of_object_with_validators(self):
+        constructor, calls = self.constructor_spy()
+        type = Object({'foo': String()}, constructor=constructor,
+                      validate=constant_fail_validator('Error'))
+        assert type.validate({'foo': 'hello'}) == 'Error'
+        assert calls == []
+
+    @pytest.mark.parametrize('make_type, data', [
+        (lambda item_type: Object({'foo': item_type, 'bar': Integer()},
+                                  validate=constant_fail_validator('Error')),
+         {'foo': {'baz': 'hello'}, 'bar': 'a'}),
+        (lambda item_type: List(item_type,
+                                validate=constant_fail_validator('Error')),
+         [{'baz': 'hello'}, {'baz': 123}]),
+        (lambda item_type: Dict(item_type,
+                                validate=constant_fail_validator('Error')),
+         {'foo': {'baz': 'hello'}, 'bar': {'baz': 123}}),
+        (lambda item_type: Tuple([item_type, item_type],
+                                 validate=constant_fail_validator('Error')),
+         [{'baz': 'hello'}, {'baz': 123}]),
+    ])
+    def test_validate_does_not_call_constructors_of_invalid_data(
+            self, make_type, data):
+        constructor, calls = self.constructor_spy()
+        type = make_type(Object({'baz': String()}, constructor=constructor))
+        assert type.validate(data)
+        assert not type.is_valid(data)
+        assert list(type.iter_errors(data))
+        assert calls == []
+
+    def test_validators_of_valid_data_get_constructed_nested_objects(self):
+        constructor, calls = self.constructor_spy()
+        outer_constructor, outer_calls = self.constructor_spy()
+        type = Object({'foo': Object({'bar': String()}, constructor=constructor)},
+                      constructor=outer_constructor,
+                      validate=constant_fail_validator('Error'))
+        assert type.validate({'foo': {'bar': 'hello'}}) == 'Error'
+        assert calls == [{'bar': 'hello'}]
+        assert outer_calls == []
+
+    @pytest.mark.parametrize('type, data', [
+        (List(Integer()), [1, 'a', None]),
+        (List(Integer(), validate=constant_fail_validator('Error')), [1, 2]),
+        (List(Integer(), validate=constant_fail_validator('Error')), [1, 'a']),
+        (Dict(Integer(), validate=constant_fail_validator('Error')),
+         {'foo': 'a'}),
+        (Object({'foo': Integer()}, validate=constant_fail_validator('Error')),
+         {'foo': 'a'}),
+        (Dict(Integer()), {'foo': 1, 'bar': 'a'}),
+        (Dict({'foo': Integer()}), {'foo': 'a', 'bar': 'b'}),
+        (Object({'foo': Integer(), 'bar': List(String())},
+                allow_extra_fields=False),
+         {'foo': 'a', 'bar': ['x', 1], 'baz': 1}),
+        (Object({'foo': Optional(Integer())},
+                validate=constant_fail_validator('Error')), {}),
+        (Object({'foo': Integer()}), 'foo'),
+        (Optional(List(Integer())), ['a']),
+        (LoadOnly(List(Integer())), ['a']),
+        (Tuple([Integer(), String()]), ['a', 1]),
+        (Tuple([Integer(), String()]), [1]),
+        (Tuple([Integer()], validate=constant_fail_validator('Error')), [1]),
+        (Tuple([Integer()], validate=constant_fail_validator('Error')), ['a']),
+    ])
+    def test_validate_returns_same_errors_as_load(self, type, data):
+        with pytest.raises(ValidationError) as exc_info:
+            type.load(data)
+        assert type.validate(data) == exc_info.value.messages
+
+
+class TestIsValid:
+    @pytest.mark.parametrize('type, data', [
+        (String(), 'foo'),
+        (List(Integer()), [1, 2, 3]),
+        (Dict(Integer()), {'foo': 1}),
+        (Object({'foo': Integer(), 'bar': Optional(String())}), {'foo': 1}),
+        (Optional(Integer()), None),
+        (LoadOnly(Integer()), 1),
+        (DumpOnly(Integer()), 'foo'),
+        (Tuple([Integer(), String()]), [1, 'foo']),
+    ])
+    def test_returns_True_for_valid_data(self, type, data):
+        assert type.is_valid(data) is True
+
+    @pytest.mark.parametrize('type, data', [
+        (String(), 123),
+        (List(Integer()), [1, 'a']),
+        (List(Integer()), 'foo'),
+        (List(Integer(), validate=constant_fail_validator('Error')), [1]),
+        (Dict(Integer()), {'foo': 'a'}),
+        (Object({'foo': Integer()}), {'foo': 'a'}),
+        (Object({'foo': Integer()}, allow_extra_fields=False),
+         {'foo': 1, 'bar': 2}),
+        (Object({'foo': Integer()}, validate=constant_fail_validator('Error')),
+         {'foo': 1}),
+        (Optional(Integer()), 'a'),
+        (Tuple([Integer(), String()]), [1, 2]),
+        (Tuple([Integer(), String()]), [1]),
+        (Tuple([Integer()], validate=constant_fail_validator('Error')), [1]),
+    ])
+    def test_returns_False_for_invalid_data(self, type, data):
+        assert type.is_valid(data) is False
+
+    def test_stops_on_first_invalid_item(self):
+        validated = []
+
+        def spy(value):
+            validated.append(value)
+            return False
+
+        type = List(Integer(validate=validator(spy, 'Invalid')))
+        assert not type.is_valid([1, 2, 3])
+        assert validated == [1]
+
+    def test_does_not_call_object_constructor(self):
+        calls = []
+        type = Object({'foo': String()},
+                      constructor=lambda **kwargs: calls.append(kwargs))
+        assert type.is_valid({'foo': 'hello'})
+        assert calls == []
+
+    def test_tuple_does_not_call_object_constructor(self):
+        calls = []
+        type = Tuple([Object({'foo': String()},
+                             constructor=lambda **kwargs: calls.append(kwargs))])
+        assert type.is_valid([{'foo': 'hello'}])
+        assert type.validate([{'foo': 'hello'}]) == {}
+        assert calls == []
+
+
+class TestValidatorFusion:
+    def fused_and_plain(self, make_type):
+        fused = make_type()
+        plain = make_type()
+        plain._fused_validator = None
+        assert fused._fused_validator is not None
+        return fused, plain
+
+    @pytest.mark.parametrize('data', [
+        'hello', '', 'x' * 20, 'admin', 'Hello', 'foo',
+    ])
+    def test_fused_validators_give_same_errors(self, data):
+        fused, plain = self.fused_and_plain(lambda: Any(validate=[
+            Regexp('^[a-z]+$'),
+            Length(min=1, max=10),
+            NoneOf(['admin', 'root']),
+            AnyOf(['hello', 'admin', 'x' * 20, 'Hello', '']),
+            Predicate(lambda x: x != 'hello', 'Is hello'),
+        ]))
+        assert fused.validate(data) == plain.validate(data)
+
+    def test_fused_range_validators(self):
+        fused, plain = self.fused_and_plain(lambda: Integer(validate=[
+            Range(min=1), Range(max=10), Range(min=3, max=5),
+        ]))
+        for data in [0, 4, 7, 20]:
+            assert fused.validate(data) == plain.validate(data)
+
+    def test_errors_are_in_validators_order(self):
+        type = String(validate=[Regexp('^x'), Length(min=10)])
+        assert type.validate('abc') == [
+            'String does not match expected pattern',
+            'Length should be at least 10',
+        ]
+
+    def test_predicates_are_called_once(self):
+        calls = []
+
+        def predicate(value):
+            calls.append(value)
+            return not value.startswith('b')
+
+        type = String(validate=[Length(max=3), Predicate(predicate)])
+        type.load('foo')
+        assert type.validate('bar') == 'Invalid data'
+        assert type.validate('bazz') == \
+            ['Length should be at most 3', 'Invalid data']
+        assert calls == ['foo', 'bar', 'bazz']
+
+    def test_running_user_validators_and_passing_context(self):
+        context = object()
+        contexts = []
+
+        def user_validator(value, context):
+            contexts.append(context)
+            if value == 'foo':
+                raise ValidationError('Is foo')
+
+        type = String(validate=[
+            user_validator, Length(min=1),
+            Predicate(lambda value, ctx: ctx is context, 'Bad context'),
+        ])
+        with pytest.raises(ValidationError) as exc_info:
+            type.load('foo', context)
+        assert exc_info.value.messages == 'Is foo'
+        assert type.validate('bar') == 'Bad context'
+        assert contexts == [context, None]
+
+    def test_subclasses_overriding_call_are_not_fused(self):
+        class MyLength(Length):
+            def __call__(self, value):
+                if value == 'foo':
+                    self._fail('exact', data=value)
+
+        type = String(validate=MyLength(exact=1))
+        assert type._fused_validator is None
+        assert type.validate('bar') == {}
+        assert type.validate('foo') == 'Length should be 1'
+
+    def test_exceptions_of_validators_are_propagated(self):
+        type = Any(validate=[Length(min=1)])
+        with pytest.raises(TypeError):
+            type.load(123)
+
+    def test_changing_any_of_choices_after_type_creation(self):
+        validator = AnyOf([1, 2])
+        type = Integer(validate=validator)
+        validator.choices = [3]
+        assert type.validate(1) == 'Invalid choice'
+        assert type.load(3) == 3
+
+    def test_changing_none_of_values_after_type_creation(self):
+        validator = NoneOf([1, 2])
+        type = Integer(validate=validator)
+        validator.values = [3]
+        assert type.load(1) == 1
+        assert type.validate(3) == 'Invalid data'
+
+    def test_changing_range_after_type_creation(self):
+        validator = Range(min=0)
+        type = Integer(validate=validator)
+        validator.min = 10
+        assert type.validate(5) == 'Value should be at least 10'
+        validator.max = 20
+        assert type.validate(30) == \
+            'Value should be at least 10 and at most 20'
+        assert type.load(15) == 15
+
+    def test_changing_length_after_type_creation(self):
+        validator = Length(max=3)
+        type = String(validate=validator)
+        validator.max = None
+        validator.exact = 5
+        assert type.validate('foo') == 'Length should be 5'
+        assert type.load('hello') == 'hello'
+
+    def test_changing_regexp_after_type_creation(self):
+        validator = Regexp('^a')
+        type = String(validate=validator)
+        validator.regexp = re.compile('^b')
+        assert type.validate('abc') == \
+            'String does not match expected pattern'
+        assert type.load('bcd') == 'bcd'
+
+    def test_types_with_fused_validators_can_be_copied_and_pickled(self):
+        type = String(validate=[Length(min=2), Regexp('^a')])
+        for copied in [copy.deepcopy(type), pickle.loads(pickle.dumps(type))]:
+            assert copied.load('ab') == 'ab'
+            assert copied.validate('b') == type.validate('b')
+
+
+class TestSlots:
+    @pytest.mark.parametrize('obj', [
+        String(), Integer(), List(String()), Dict(String()),
+        Object({'foo': String()}), Optional(String()), LoadOnly(String()),
+        DumpOnly(String()), Cached(String()), AttributeField(String()),
+        Enum({1: 'foo'}), DictWithDefault({}),
+        Length(max=1), Predicate(lambda x: True),
+    ])
+    def test_built_in_nodes_do_not_have_instance_dict(self, obj):
+        assert not hasattr(obj, '__dict__')
+
+    def test_subclasses_can_have_arbitrary_attributes(self):
+        class CustomString(String):
+            def __init__(self, prefix, *args, **kwargs):
+                super(CustomString, self).__init__(*args, **kwargs)
+                self.prefix = prefix
+
+        assert CustomString('foo').prefix == 'foo'
+
+    def test_types_support_weak_references(self):
+        type = String()
+        assert weakref.ref(type)() is type
+
+    def test_types_can_be_copied(self):
+        type = Object({'foo': List(String(validate=Length(max=1)))},
+                      allow_extra_fields=False)
+        copied = copy.deepcopy(type)
+        assert copied.allow_extra_fields is False
+        assert copied.load({'foo': ['a']}) == {'foo': ['a']}
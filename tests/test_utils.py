@@ -1,4 +1,6 @@
-from lollipop.utils import call_with_context
+import pytest
+from lollipop.utils import call_with_context, get_arg_count, takes_context, \
+    register_arg_count
 
 
 class ObjMethodDummy:
@@ -67,3 +69,63 @@ class TestCallWithContext:
         obj = ObjCallableDummy()
         call_with_context(obj, context, 1, 'foo')
         assert obj.args == (1, 'foo', context)
+
+
+class TestGetArgCount:
+    def test_counting_function_arguments(self):
+        def func(a, b, c=None):
+            pass
+
+        assert get_arg_count(func) == 3
+
+    def test_counting_method_arguments_excluding_self(self):
+        assert get_arg_count(ObjMethodDummy().foo) == 3
+
+    @pytest.mark.parametrize('method_first', [True, False])
+    def test_counting_method_and_its_function_arguments(self, method_first):
+        def foo(self, a, b):
+            pass
+
+        Dummy = type('Dummy', (object,), {'foo': foo})
+        if method_first:
+            assert get_arg_count(Dummy().foo) == 2
+        assert get_arg_count(foo) == 3
+        assert get_arg_count(Dummy().foo) == 2
+
+    def test_registered_method_argument_count_excludes_self(self):
+        def foo(self, *args):
+            pass
+
+        Dummy = type('Dummy', (object,), {'foo': foo})
+        register_arg_count(Dummy().foo, 2)
+        assert get_arg_count(Dummy().foo) == 2
+        assert get_arg_count(foo) == 3
+
+    def test_counting_callable_object_arguments_excluding_self(self):
+        assert get_arg_count(ObjCallableDummy()) == 3
+
+    def test_registered_function_argument_count(self):
+        def func(*args):
+            pass
+
+        register_arg_count(func, 2)
+        assert get_arg_count(func) == 2
+
+    def test_registered_class_argument_count_applies_to_subclass_instances(self):
+        class Base(object):
+            def __call__(self, *args):
+                pass
+
+        class Derived(Base):
+            pass
+
+        register_arg_count(Base, 2)
+        assert get_arg_count(Derived()) == 2
+
+
+class TestTakesContext:
+    def test_returns_True_if_function_takes_more_arguments(self):
+        assert takes_context(lambda a, b: None, 1)
+
+    def test_returns_False_if_function_takes_same_number_of_arguments(self):
+        assert not takes_context(lambda a: None, 1)
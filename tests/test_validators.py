@@ -206,6 +206,22 @@ class TestLength:
         assert exc_info.value.messages == \
             message.format(data=[], length=0, min=1, max=5)
 
+    def test_validating_length_without_value(self):
+        with raises(ValidationError) as exc_info:
+            Length(max=1).validate_length(2)
+        assert exc_info.value.messages == \
+            Length.default_error_messages['max'].format(max=1)
+
+    def test_validating_partial_length_does_not_check_min_value(self):
+        with not_raises(ValidationError):
+            Length(min=2, max=3).validate_partial_length(1)
+
+    def test_raising_ValidationError_when_partial_length_exceeds_max_value(self):
+        with raises(ValidationError) as exc_info:
+            Length(exact=2).validate_partial_length(3)
+        assert exc_info.value.messages == \
+            Length.default_error_messages['exact'].format(exact=2)
+
 
 class TestNoneOf:
     def test_matching_values_other_than_given_values(self):
@@ -225,6 +241,24 @@ class TestNoneOf:
                                                          values=['foo', 'bar'])
 
 
+    def test_matching_unhashable_values(self):
+        with raises(ValidationError):
+            NoneOf([{'foo': 1}, 'bar'])({'foo': 1})
+        with raises(ValidationError):
+            NoneOf(['foo', 'bar'])('bar')
+        with not_raises(ValidationError):
+            NoneOf(['foo', 'bar'])(['foo'])
+
+    def test_changing_values(self):
+        validator = NoneOf(['foo'])
+        validator.values = ['bar']
+        assert validator.values == ['bar']
+        with not_raises(ValidationError):
+            validator('foo')
+        with raises(ValidationError):
+            validator('bar')
+
+
 class TestAnyOf:
     def test_matching_given_values(self):
         with not_raises(ValidationError):
@@ -246,6 +280,43 @@ class TestAnyOf:
                                                          choices=['foo', 'bar'])
 
 
+    def test_matching_unhashable_choices(self):
+        validator = AnyOf([['foo'], {'bar': 1}, 'baz'])
+        with not_raises(ValidationError):
+            validator(['foo'])
+            validator({'bar': 1})
+            validator('baz')
+        with raises(ValidationError):
+            validator(['bar'])
+        with raises(ValidationError):
+            validator('foo')
+
+    def test_matching_unhashable_values_against_hashable_choices(self):
+        with raises(ValidationError):
+            AnyOf(['foo', 'bar'])(['foo'])
+
+    def test_matching_equal_values_of_different_types(self):
+        with not_raises(ValidationError):
+            AnyOf([1, 2])(1.0)
+
+    def test_using_other_containers_as_is(self):
+        with not_raises(ValidationError):
+            AnyOf(range(10 ** 12))(10 ** 11)
+        with not_raises(ValidationError):
+            AnyOf({'foo': 1})('foo')
+        with raises(ValidationError):
+            AnyOf(set(['foo']))('bar')
+
+    def test_changing_choices(self):
+        validator = AnyOf(['foo'])
+        validator.choices = ['bar']
+        assert validator.choices == ['bar']
+        with not_raises(ValidationError):
+            validator('bar')
+        with raises(ValidationError):
+            validator('foo')
+
+
 class TestRegexp:
     def test_matching_by_string_regexp(self):
         with not_raises(ValidationError):